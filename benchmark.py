@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark entry point
+ベンチマーク実行スクリプト
+
+Usage:
+    python benchmark.py renderer [--themes モダン ネオン] [--sizes 250 550] [--frames 600]
+                                 [--backend display_list|tk] [--prerender-dial] [--json] [--output FILE]
+    python benchmark.py grid [--counts 24 200 500] [--frames 60] [--cell-size 120] [--json]
+    python benchmark.py formatter [--formats "%H:%M:%S"] [--steps-ms 1000 33] [--json]
+    python benchmark.py batch [--counts 1000 100000] [--json]
+    python benchmark.py windows [--counts 1 6 12] [--seconds 2] [--json]   # Tk のディスプレイが必要
+
+JSON output is machine-readable so results can be compared release over release.
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+def _write_report(report: dict, text: str, args: argparse.Namespace) -> None:
+    """結果を出力（--json なら JSON、--output ならファイルにも保存）"""
+    serialized = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(serialized)
+    print(serialized if args.json else text)
+
+def _run_renderer(args: argparse.Namespace) -> None:
+    """レンダラーベンチマーク"""
+    from src.benchmarks.renderer_benchmark import run_renderer_benchmark, format_renderer_report
+    report = run_renderer_benchmark(
+        theme_names=args.themes,
+        sizes=args.sizes,
+        frames=args.frames,
+        face_iterations=args.face_iterations,
+        warmup=args.warmup,
+        backend=args.backend,
+        prerender_dial=args.prerender_dial
+    )
+    _write_report(report, format_renderer_report(report), args)
+
+def _run_grid(args: argparse.Namespace) -> None:
+    """世界時計グリッドのベンチマーク"""
+    from src.benchmarks.grid_benchmark import run_grid_benchmark, format_grid_report
+    report = run_grid_benchmark(
+        counts=args.counts,
+        frames=args.frames,
+        cell_size=args.cell_size,
+        theme_name=args.theme,
+        warmup=args.warmup
+    )
+    _write_report(report, format_grid_report(report), args)
+
+def _run_formatter(args: argparse.Namespace) -> None:
+    """デジタル表示フォーマッターと strftime の比較"""
+    from src.benchmarks.formatter_benchmark import run_formatter_benchmark, format_formatter_report
+    report = run_formatter_benchmark(
+        formats=args.formats,
+        steps_ms=args.steps_ms,
+        iterations=args.iterations,
+        repeat=args.repeat
+    )
+    _write_report(report, format_formatter_report(report), args)
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """針の先端座標のバッチ計算とスカラー計算の比較"""
+    from src.benchmarks.batch_benchmark import run_batch_benchmark, format_batch_report
+    report = run_batch_benchmark(
+        counts=args.counts,
+        repeat=args.repeat
+    )
+    _write_report(report, format_batch_report(report), args)
+
+def _run_windows(args: argparse.Namespace) -> None:
+    """時計ごとのプロセスと1つのホストのメモリ比較"""
+    from src.benchmarks.window_benchmark import run_window_benchmark, format_window_report
+    report = run_window_benchmark(
+        counts=args.counts,
+        seconds=args.seconds
+    )
+    _write_report(report, format_window_report(report), args)
+
+def main():
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="アナログ時計のベンチマーク")
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    renderer_parser = subparsers.add_parser("renderer", help="テーマ×サイズごとのフレームコスト")
+    renderer_parser.add_argument("--themes", nargs="+", help="計測するテーマ名（既定: すべて）")
+    renderer_parser.add_argument("--sizes", nargs="+", type=int, help="計測する時計サイズpx（既定: プリセット + 800）")
+    renderer_parser.add_argument("--frames", type=int, default=600, help="ティック計測のフレーム数")
+    renderer_parser.add_argument("--face-iterations", type=int, default=20, help="文字盤描画の計測回数")
+    renderer_parser.add_argument("--warmup", type=int, default=5, help="計測前のウォームアップフレーム数")
+    renderer_parser.add_argument("--backend", choices=["display_list", "tk"], default="display_list",
+                                 help="描画先（tk は実際の Tk キャンバス、ディスプレイが必要）")
+    renderer_parser.add_argument("--prerender-dial", action="store_true",
+                                 help="文字盤を事前描画した1枚の画像で描く（再構築時間とキャッシュ容量も表示）")
+    renderer_parser.set_defaults(handler=_run_renderer)
+
+    grid_parser = subparsers.add_parser("grid", help="世界時計グリッドの時計数ごとのフレーム時間")
+    grid_parser.add_argument("--counts", nargs="+", type=int, help="時計の数（既定: 1〜500）")
+    grid_parser.add_argument("--frames", type=int, default=60, help="ティック計測のフレーム数")
+    grid_parser.add_argument("--cell-size", type=int, default=120, help="1つの時計のセルの大きさpx")
+    grid_parser.add_argument("--theme", default="モダン", help="テーマ名")
+    grid_parser.add_argument("--warmup", type=int, default=2, help="計測前のウォームアップフレーム数")
+    grid_parser.set_defaults(handler=_run_grid)
+
+    formatter_parser = subparsers.add_parser("formatter", help="デジタル表示の整形コスト（strftime との比較）")
+    formatter_parser.add_argument("--formats", nargs="+", help="書式文字列（既定: デジタル表示の既定書式）")
+    formatter_parser.add_argument("--steps-ms", nargs="+", type=int, help="時刻の刻みミリ秒（既定: 1000 33）")
+    formatter_parser.add_argument("--iterations", type=int, default=100000, help="1回の計測で整形する時刻の数")
+    formatter_parser.add_argument("--repeat", type=int, default=5, help="計測の繰り返し回数（最小値を採用）")
+    formatter_parser.set_defaults(handler=_run_formatter)
+
+    batch_parser = subparsers.add_parser("batch", help="多数の時刻の針の先端座標のバッチ計算（スカラー計算との比較）")
+    batch_parser.add_argument("--counts", nargs="+", type=int, help="一度に計算する時刻の数（既定: 1000 10000 100000）")
+    batch_parser.add_argument("--repeat", type=int, default=5, help="計測の繰り返し回数（最小値を採用）")
+    batch_parser.set_defaults(handler=_run_batch)
+
+    windows_parser = subparsers.add_parser("windows", help="時計ごとのプロセスと1つのホストのメモリ比較（ディスプレイが必要）")
+    windows_parser.add_argument("--counts", nargs="+", type=int, help="ウィンドウの数（既定: 1 6 12）")
+    windows_parser.add_argument("--seconds", type=float, default=2.0, help="計測前に時計を動かす秒数")
+    windows_parser.set_defaults(handler=_run_windows)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("--json", action="store_true", help="JSON 形式で出力")
+        subparser.add_argument("--output", help="JSON 結果の保存先ファイル")
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
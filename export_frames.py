@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame exporter
+時刻の区間の時計をウィンドウを開かずに PNG 連番またはアニメーション GIF に書き出すスクリプト
+
+Usage:
+    python export_frames.py --start 10:08:00 --end 10:09:00 --output clock.gif            # 1秒刻みの GIF
+    python export_frames.py --start 10:08 --end 10:08:10 --step 0.1 --fps 10 --output clock.gif
+    python export_frames.py --start 09:00 --end 10:00 --step 60 --format png --output frames/
+    python export_frames.py --theme ネオン --size 550 --workers 8 ...
+
+Frames are rendered with the same renderer as the live clock and rasterized in a process pool.
+"""
+
+import argparse
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+def _parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    from src.core.clock_config import MAX_CLOCK_SIZE, MIN_CLOCK_SIZE
+    parser = argparse.ArgumentParser(description="時計のフレームの書き出し")
+    parser.add_argument("--start", required=True, help="開始時刻 HH:MM[:SS[.fff]]")
+    parser.add_argument("--end", required=True, help="終了時刻 HH:MM[:SS[.fff]]（含まない。開始より前なら翌日）")
+    parser.add_argument("--step", type=float, default=1.0, help="フレームの時刻の刻み（秒）")
+    parser.add_argument("--theme", default="モダン", help="テーマ名")
+    parser.add_argument("--size", type=int, default=350, help=f"時計のサイズpx（{MIN_CLOCK_SIZE}〜{MAX_CLOCK_SIZE}）")
+    parser.add_argument("--format", choices=["gif", "png"], help="出力形式（既定: 出力先の拡張子が .gif なら gif、それ以外は png）")
+    parser.add_argument("--fps", type=float, help="GIF の再生レート（既定: 実時間と同じ 1/step）")
+    parser.add_argument("--workers", type=int, help="ワーカープロセス数（既定: CPU 数、1 ならプロセス内で処理）")
+    parser.add_argument("--max-in-flight", type=int, help="同時に処理するフレーム数の上限（既定: ワーカー数の2倍）")
+    parser.add_argument("--output", required=True, help="GIF のファイル、または PNG 連番を書き出すディレクトリ")
+    parser.add_argument("--quiet", action="store_true", help="進捗を表示しない")
+    args = parser.parse_args()
+    if not MIN_CLOCK_SIZE <= args.size <= MAX_CLOCK_SIZE:
+        parser.error(f"--size は {MIN_CLOCK_SIZE} から {MAX_CLOCK_SIZE} の範囲で指定してください")
+    if args.step <= 0:
+        parser.error("--step は正の値を指定してください")
+    return args
+
+def _print_progress(done: int, total: int) -> None:
+    """進捗を表示"""
+    if done == total or done % 10 == 0:
+        print(f"\r{done}/{total} フレーム", end="", file=sys.stderr, flush=True)
+
+def main():
+    """メインエントリーポイント"""
+    args = _parse_args()
+    from src.export.frame_pipeline import ExportSettings, export_frames, parse_time_of_day
+    from src.themes.theme_manager import ThemeManager
+
+    theme_names = ThemeManager().get_theme_names()
+    if args.theme not in theme_names:
+        print(f"テーマが見つかりません: {args.theme}（{', '.join(theme_names)}）", file=sys.stderr)
+        sys.exit(1)
+    try:
+        start = parse_time_of_day(args.start)
+        end = parse_time_of_day(args.end)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    image_format = args.format or ('gif' if args.output.lower().endswith('.gif') else 'png')
+    fps = args.fps if args.fps else 1.0 / args.step
+    settings = ExportSettings(
+        theme_name=args.theme,
+        size=args.size,
+        start=start,
+        end=end,
+        step=args.step,
+        image_format=image_format,
+        delay_cs=max(2, int(round(100.0 / fps)))  # 多くのビューアーは 2/100 秒未満を無視する
+    )
+    stats = export_frames(settings, args.output, args.workers, args.max_in_flight,
+                          None if args.quiet else _print_progress)
+    if not args.quiet:
+        print("", file=sys.stderr)
+    print(f"{args.output}: {stats['frames']} フレーム, {stats['bytes_written'] / 1024:.1f} KB, "
+          f"{stats['elapsed_s']:.2f} 秒 ({stats['frames_per_second']:.1f} フレーム/秒, "
+          f"ワーカー {stats['workers']}, 同時処理 最大 {stats['peak_in_flight']})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Frame log reader
+フレームログ（設定 "frame_log_enabled" で記録したリングバッファ）の表示スクリプト
+
+Usage:
+    python frame_log_reader.py [frame_log.bin]                 # 段階ごとの集計
+    python frame_log_reader.py --minutes 30 --slow 20          # 直近30分のうち 20ms を超えたフレームを一覧
+    python frame_log_reader.py --last 1000 --csv > frames.csv  # 直近1000フレームを CSV で出力
+
+The log can be read while the clock is running.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+def _parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="フレームログの表示")
+    parser.add_argument("path", nargs="?", default="frame_log.bin", help="フレームログのファイル")
+    parser.add_argument("--last", type=int, help="直近のフレーム数に絞る")
+    parser.add_argument("--minutes", type=float, help="直近の分数に絞る")
+    parser.add_argument("--slow", type=float, metavar="MS", help="合計時間がこれを超えたフレームを一覧表示")
+    parser.add_argument("--limit", type=int, default=50, help="--slow で表示する最大件数")
+    parser.add_argument("--csv", action="store_true", help="全レコードを CSV で出力")
+    parser.add_argument("--json", action="store_true", help="集計を JSON で出力")
+    return parser.parse_args()
+
+def _summarize(records) -> dict:
+    """段階ごとの時間（ミリ秒）を集計"""
+    from src.benchmarks.stats import summarize_samples
+    from src.core.frame_recorder import STAGE_NAMES
+    fields = ('total',) + STAGE_NAMES + ('lateness',)
+    return {
+        field: summarize_samples([getattr(record, f"{field}_us") / 1000.0 for record in records])
+        for field in fields
+    }
+
+def _format_time(timestamp: float) -> str:
+    """UNIX 時刻を表示用の文字列に変換"""
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+
+def main():
+    """メインエントリーポイント"""
+    args = _parse_args()
+    from src.core.frame_recorder import FLAG_ANIMATED, FLAG_DIGITAL_UPDATED, FLAG_HIDDEN, FrameRingBuffer
+
+    try:
+        ring = FrameRingBuffer(args.path, readonly=True)
+    except (OSError, ValueError) as e:
+        print(f"フレームログを開けません: {e}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        records = ring.read_records(args.last)
+    finally:
+        ring.close()
+    if args.minutes is not None:
+        since = time.time() - args.minutes * 60.0
+        records = [record for record in records if record.timestamp >= since]
+
+    if args.csv:
+        print("timestamp,total_us,lateness_us,time_us,format_us,hands_us,flush_us,flags,interval_ms")
+        for record in records:
+            print(",".join(str(value) for value in record))
+        return
+
+    summary = _summarize(records)
+    if args.json:
+        print(json.dumps({
+            'path': args.path,
+            'frames': len(records),
+            'first': records[0].timestamp if records else None,
+            'last': records[-1].timestamp if records else None,
+            'stages': summary
+        }, indent=2, ensure_ascii=False))
+        return
+
+    if not records:
+        print("記録されたフレームはありません")
+        return
+    print(f"{args.path}: {len(records)} フレーム ({_format_time(records[0].timestamp)} 〜 "
+          f"{_format_time(records[-1].timestamp)})")
+    print(f"{'stage':<10} {'mean ms':>8} {'p50':>8} {'p99':>8} {'max':>8}")
+    for stage, stats in summary.items():
+        print(f"{stage:<10} {stats['mean_ms']:>8.3f} {stats['p50_ms']:>8.3f} "
+              f"{stats['p99_ms']:>8.3f} {stats['max_ms']:>8.3f}")
+
+    if args.slow is not None:
+        slow = [record for record in records if record.total_us / 1000.0 > args.slow]
+        print("")
+        print(f"{args.slow} ms を超えたフレーム: {len(slow)} 件")
+        for record in slow[-args.limit:]:
+            flags = "".join(flag for bit, flag in ((FLAG_ANIMATED, 'A'), (FLAG_DIGITAL_UPDATED, 'D'),
+                                                   (FLAG_HIDDEN, 'H')) if record.flags & bit)
+            print(f"{_format_time(record.timestamp)}  total {record.total_us / 1000.0:7.2f}  "
+                  f"late {record.lateness_us / 1000.0:7.2f}  time {record.time_us / 1000.0:6.2f}  "
+                  f"format {record.format_us / 1000.0:6.2f}  hands {record.hands_us / 1000.0:6.2f}  "
+                  f"flush {record.flush_us / 1000.0:6.2f}  {flags}")
+
+if __name__ == "__main__":
+    main()
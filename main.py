@@ -18,19 +18,56 @@ Features:
 - Right-click context menu for quick access
 - Automatic settings persistence
 - Clean, SOLID architecture for easy extension
+
+Usage:
+    python main.py                                   # 通常の時計
+    python main.py --world-clock                     # 世界時計（設定 "world_clocks" の地域）
+    python main.py --world-clock Asia/Tokyo Europe/London
+    python main.py --host desk1.json desk2.json desk3.json  # 1つのプロセスで設定ファイルごとの時計ウィンドウを表示
+    python main.py --startup-profile                 # import 時間と初回描画までの時間を表示
 """
 
+import argparse
 import sys
 import os
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.core.clock_application import ClockApplication
+def _parse_args() -> argparse.Namespace:
+    """コマンドライン引数を解析"""
+    parser = argparse.ArgumentParser(description="アナログ時計アプリケーション")
+    parser.add_argument("--world-clock", nargs="*", metavar="ZONE",
+                        help="複数の地域の時計を1つのウィンドウに並べて表示（IANA タイムゾーン名）")
+    parser.add_argument("--host", nargs="+", metavar="CONFIG",
+                        help="1つのプロセスで複数の時計ウィンドウを表示（ウィンドウごとの設定ファイル）")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="モジュールごとの import 時間と初回描画までの時間を表示")
+    return parser.parse_args()
+
+def _print_startup_profile(profiler) -> None:
+    """起動プロファイルを表示"""
+    print(profiler.format_report(), file=sys.stderr)
 
 def main():
     """メインエントリーポイント"""
-    app = ClockApplication()
+    args = _parse_args()
+    from src.core.startup_profiler import mark_startup, start_startup_profile
+    if args.startup_profile:
+        # アプリケーションのモジュールを読み込む前に計測を開始
+        start_startup_profile(_print_startup_profile)
+    
+    # 必要になった時点で読み込む（起動を速くするため）
+    if args.world_clock is not None:
+        from src.core.world_clock_application import WorldClockApplication
+        app = WorldClockApplication(args.world_clock)
+    elif args.host:
+        from src.core.clock_host import ClockHost
+        app = ClockHost(args.host)
+    else:
+        from src.core.clock_application import ClockApplication
+        app = ClockApplication()
+    mark_startup("imported")
     
     try:
         print("アナログ時計アプリケーションを起動中...")
@@ -41,6 +78,7 @@ def main():
         print("")
         
         app.initialize()
+        mark_startup("initialized")
         app.run()
     except KeyboardInterrupt:
         print("\nアプリケーションを終了します...")
@@ -0,0 +1,5 @@
+# Benchmark suites (headless, no Tk window required)
+
+from .stats import summarize_samples
+
+__all__ = ['summarize_samples']
@@ -0,0 +1,101 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .renderer_benchmark import _environment
+from ..core.clock_config import SIZE_PRESETS
+from ..rendering.hand_geometry import (HandEndpoints, compute_hand_endpoints, hand_angles, hand_end_point,
+                                       hand_lengths, has_numpy)
+
+# 一度に計算する (時刻, 半径, 中心) の組の数
+BATCH_COUNTS: List[int] = [1000, 10000, 100000]
+
+def _make_inputs(count: int) -> Tuple[List[float], List[int], List[int], List[int]]:
+    """1日に散らばった時刻（秒の小数部あり）と、プリセットサイズを順に使う半径・中心"""
+    radii_cycle = [(size - 50) // 2 for _, size in SIZE_PRESETS]
+    times = [(index * 86400.0 / count + index * 0.037) % 86400.0 for index in range(count)]
+    radii = [radii_cycle[index % len(radii_cycle)] for index in range(count)]
+    centers = [radius + 25 for radius in radii]
+    return times, radii, centers, centers
+
+def scalar_hand_endpoints(times: Sequence[float], radii: Sequence[int], centers_x: Sequence[int],
+                          centers_y: Sequence[int]) -> List[Tuple[float, ...]]:
+    """render_hands と同じスカラーの計算を1時刻ずつ呼ぶ（比較の基準）"""
+    results = []
+    for time_of_day, radius, center_x, center_y in zip(times, radii, centers_x, centers_y):
+        time_of_day %= 86400
+        hours = int(time_of_day // 3600) % 12
+        minutes = int(time_of_day % 3600 // 60)
+        seconds = time_of_day % 60
+        angles = hand_angles(hours, minutes, seconds)
+        points: Tuple[float, ...] = ()
+        for angle, length in zip(angles, hand_lengths(radius)):
+            points += hand_end_point(center_x, center_y, angle, length)
+        results.append(angles + points)
+    return results
+
+def _max_difference(batch: HandEndpoints, scalar: List[Tuple[float, ...]]) -> float:
+    """バッチ計算とスカラー計算の結果の最大の差"""
+    difference = 0.0
+    for field_index, column in enumerate(batch):
+        for index, value in enumerate(column):
+            difference = max(difference, abs(float(value) - scalar[index][field_index]))
+    return difference
+
+def _best_ms(call: Callable[[], Any], repeat: int) -> float:
+    """最も速かった1回の時間（ミリ秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0
+
+def benchmark_batch(count: int, repeat: int = 5) -> Dict[str, Any]:
+    """スカラーの呼び出しの繰り返しと、バッチ計算（純 Python / NumPy）の時間を比較"""
+    times, radii, centers_x, centers_y = _make_inputs(count)
+    scalar = scalar_hand_endpoints(times, radii, centers_x, centers_y)
+    result: Dict[str, Any] = {
+        'count': count,
+        'scalar_ms': _best_ms(lambda: scalar_hand_endpoints(times, radii, centers_x, centers_y), repeat)
+    }
+    backends = ['python'] + (['numpy'] if has_numpy() else [])
+    for backend in backends:
+        batch = compute_hand_endpoints(times, centers_x, centers_y, radii, backend=backend)
+        result[f'{backend}_max_difference'] = _max_difference(batch, scalar)
+        result[f'{backend}_ms'] = _best_ms(
+            lambda: compute_hand_endpoints(times, centers_x, centers_y, radii, backend=backend), repeat)
+        result[f'{backend}_speedup'] = result['scalar_ms'] / result[f'{backend}_ms'] if result[f'{backend}_ms'] else 0.0
+    return result
+
+def run_batch_benchmark(counts: Optional[Sequence[int]] = None, repeat: int = 5) -> Dict[str, Any]:
+    """件数ごとにバッチ計算の時間を計測"""
+    counts = list(counts or BATCH_COUNTS)
+    return {
+        'benchmark': 'batch',
+        'environment': _environment(),
+        'parameters': {
+            'counts': counts,
+            'repeat': repeat,
+            'numpy': has_numpy()
+        },
+        'results': [benchmark_batch(count, repeat) for count in counts]
+    }
+
+def format_batch_report(report: Dict[str, Any]) -> str:
+    """計測結果を表形式の文字列に整形"""
+    numpy_available = report['parameters']['numpy']
+    header = f"{'count':>8} | {'scalar ms':>10} {'python ms':>10} {'speedup':>8}"
+    if numpy_available:
+        header += f" {'numpy ms':>10} {'speedup':>8}"
+    lines = [header]
+    max_difference = 0.0
+    for result in report['results']:
+        line = (f"{result['count']:>8} | {result['scalar_ms']:>10.2f} {result['python_ms']:>10.2f} "
+                f"{result['python_speedup']:>7.2f}x")
+        max_difference = max(max_difference, result['python_max_difference'])
+        if numpy_available:
+            line += f" {result['numpy_ms']:>10.2f} {result['numpy_speedup']:>7.2f}x"
+            max_difference = max(max_difference, result['numpy_max_difference'])
+        lines.append(line)
+    lines.append(f"max difference from scalar path: {max_difference:.3g} px/deg"
+                 + ("" if numpy_available else " (NumPy not installed)"))
+    return "\n".join(lines)
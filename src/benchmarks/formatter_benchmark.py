@@ -0,0 +1,70 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .renderer_benchmark import _environment
+from ..core.digital_formatter import DEFAULT_DIGITAL_FORMAT, DigitalTimeFormatter
+
+# 1秒ごと（通常の時計）と 1/30 秒ごと（滑らかな秒針）の時刻列で比較する
+FORMATTER_STEPS_MS: List[int] = [1000, 33]
+
+def _time_per_call(format_call: Callable[[datetime], str], times: Sequence[datetime], repeat: int) -> float:
+    """1回あたりの整形時間（ナノ秒）の最小値を計測"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for current in times:
+            format_call(current)
+        best = min(best, (time.perf_counter() - start) / len(times))
+    return best * 1e9
+
+def benchmark_formatter(format_string: str = DEFAULT_DIGITAL_FORMAT, step_ms: int = 1000,
+                        iterations: int = 100000, repeat: int = 5) -> Dict[str, Any]:
+    """strftime と DigitalTimeFormatter の1回あたりの整形時間を比較"""
+    start_time = datetime(2025, 1, 1, 23, 30, 0)  # 途中で日付が変わる
+    step = timedelta(milliseconds=step_ms)
+    times = [start_time + step * index for index in range(iterations)]
+
+    formatter = DigitalTimeFormatter(format_string)
+    for current in times:
+        if formatter.format(current) != current.strftime(format_string):
+            raise AssertionError(f"Formatter output differs from strftime at {current}")
+
+    strftime_ns = _time_per_call(lambda current: current.strftime(format_string), times, repeat)
+    formatter_ns = _time_per_call(DigitalTimeFormatter(format_string).format, times, repeat)
+    return {
+        'format': format_string,
+        'step_ms': step_ms,
+        'iterations': iterations,
+        'strftime_ns': strftime_ns,
+        'formatter_ns': formatter_ns,
+        'speedup': strftime_ns / formatter_ns if formatter_ns else 0.0
+    }
+
+def run_formatter_benchmark(formats: Optional[Sequence[str]] = None, steps_ms: Optional[Sequence[int]] = None,
+                            iterations: int = 100000, repeat: int = 5) -> Dict[str, Any]:
+    """書式×時刻の刻みごとに strftime との比較を行う"""
+    formats = list(formats or [DEFAULT_DIGITAL_FORMAT])
+    steps_ms = list(steps_ms or FORMATTER_STEPS_MS)
+    results = [benchmark_formatter(format_string, step_ms, iterations, repeat)
+               for format_string in formats for step_ms in steps_ms]
+    return {
+        'benchmark': 'formatter',
+        'environment': _environment(),
+        'parameters': {
+            'formats': formats,
+            'steps_ms': steps_ms,
+            'iterations': iterations,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+def format_formatter_report(report: Dict[str, Any]) -> str:
+    """計測結果を表形式の文字列に整形"""
+    lines = [f"{'format':<28} {'step ms':>7} | {'strftime ns':>11} {'formatter ns':>12} {'speedup':>8}"]
+    for result in report['results']:
+        lines.append(
+            f"{result['format']:<28} {result['step_ms']:>7} | "
+            f"{result['strftime_ns']:>11.1f} {result['formatter_ns']:>12.1f} {result['speedup']:>7.2f}x"
+        )
+    return "\n".join(lines)
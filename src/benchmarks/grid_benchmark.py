@@ -0,0 +1,95 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from .stats import summarize_samples
+from .renderer_benchmark import _environment
+from ..core.clock_config import DEFAULT_WORLD_CLOCKS
+from ..core.world_clock_grid import WorldClockGrid
+from ..rendering.display_list import DisplayListCanvas
+from ..themes.theme_manager import ThemeManager
+
+# 計測する時計の数（運用ダッシュボードの想定 24〜200 と、その先の 500 まで）
+GRID_CLOCK_COUNTS: List[int] = [1, 12, 24, 50, 100, 200, 500]
+
+def benchmark_grid(count: int, frames: int = 60, cell_size: int = 120, theme_name: str = 'モダン',
+                   warmup: int = 2) -> Dict[str, Any]:
+    """count 個の時計を並べたグリッドについて1ティックあたりのコストを計測"""
+    theme = ThemeManager().get_theme(theme_name)
+    if theme is None:
+        raise ValueError(f"Unknown theme: {theme_name}")
+
+    # 実時間ではなく1秒ずつ進む仮想時計で駆動（毎フレーム秒針が動く）
+    start_timestamp = datetime(2025, 1, 1, 10, 8, 0).timestamp()
+    frame = [0]
+
+    def clock() -> float:
+        return start_timestamp + frame[0]
+
+    timezones = [DEFAULT_WORLD_CLOCKS[i % len(DEFAULT_WORLD_CLOCKS)] for i in range(count)]
+    grid = WorldClockGrid(timezones, cell_size, clock=clock)
+    width, height = grid.get_canvas_size()
+    canvas = DisplayListCanvas(width, height)
+    grid.attach(canvas)
+
+    start = time.perf_counter()
+    grid.render_all(theme)
+    face_ms = (time.perf_counter() - start) * 1000.0
+    items = len(canvas.find_all())
+
+    for _ in range(warmup):
+        frame[0] += 1
+        grid.render_tick(theme)
+
+    samples: List[float] = []
+    calls_before = canvas.get_call_count()
+    for _ in range(frames):
+        frame[0] += 1
+        start = time.perf_counter()
+        grid.render_tick(theme)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    calls = canvas.get_call_count() - calls_before
+
+    tick: Dict[str, float] = summarize_samples(samples)
+    tick['per_clock_us'] = tick['mean_ms'] * 1000.0 / count if count else 0.0
+    tick['canvas_calls_per_frame'] = calls / frames if frames else 0.0
+    return {
+        'clocks': count,
+        'canvas_size': [width, height],
+        'items': items,
+        'render_all_ms': face_ms,
+        'tick': tick
+    }
+
+def run_grid_benchmark(counts: Optional[Sequence[int]] = None, frames: int = 60, cell_size: int = 120,
+                       theme_name: str = 'モダン', warmup: int = 2) -> Dict[str, Any]:
+    """時計の数ごとに1ティックのフレーム時間を計測"""
+    counts = list(counts or GRID_CLOCK_COUNTS)
+    results = [benchmark_grid(count, frames, cell_size, theme_name, warmup) for count in counts]
+    return {
+        'benchmark': 'grid',
+        'environment': _environment(),
+        'parameters': {
+            'backend': 'display_list',
+            'frames': frames,
+            'cell_size': cell_size,
+            'theme': theme_name,
+            'warmup': warmup,
+            'counts': counts
+        },
+        'results': results
+    }
+
+def format_grid_report(report: Dict[str, Any]) -> str:
+    """計測結果を表形式の文字列に整形"""
+    lines = [
+        f"{'clocks':>6} {'items':>7} | {'full ms':>8} | {'tick ms':>8} {'p50':>8} {'p99':>8} "
+        f"{'us/clock':>8} {'calls':>7}"
+    ]
+    for result in report['results']:
+        tick = result['tick']
+        lines.append(
+            f"{result['clocks']:>6} {result['items']:>7} | {result['render_all_ms']:>8.2f} | "
+            f"{tick['mean_ms']:>8.3f} {tick['p50_ms']:>8.3f} {tick['p99_ms']:>8.3f} "
+            f"{tick['per_clock_us']:>8.2f} {tick['canvas_calls_per_frame']:>7.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,208 @@
+import platform
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from ..core.clock_config import ClockConfig, SIZE_PRESETS, MAX_CLOCK_SIZE
+from ..interfaces.theme_interface import ITheme
+from ..rendering.analog_clock_renderer import AnalogClockRenderer
+from ..rendering.display_list import DisplayListCanvas
+from ..themes.theme_manager import ThemeManager
+from .stats import summarize_samples
+
+# 設定画面のプリセット + カスタムサイズの上限
+BENCHMARK_SIZES: List[int] = [size for _, size in SIZE_PRESETS] + [MAX_CLOCK_SIZE]
+
+class RecordingCanvas:
+    """Canvas API の呼び出し回数を記録するプロキシ"""
+
+    def __init__(self, canvas: Any):
+        self._canvas = canvas
+        self._call_count = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._canvas, name)
+        if not callable(attribute):
+            return attribute
+
+        def recorded(*args, **kwargs):
+            self._call_count += 1
+            return attribute(*args, **kwargs)
+        return recorded
+
+    def get_call_count(self) -> int:
+        """呼び出し回数を取得"""
+        return self._call_count
+
+def _environment() -> Dict[str, str]:
+    """計測環境の情報を取得"""
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': datetime.now().isoformat(timespec='seconds')
+    }
+
+def _measure(renderer: AnalogClockRenderer, canvas: RecordingCanvas,
+             draw: Callable[[int], None], iterations: int, warmup: int,
+             idle: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """draw を繰り返し実行し、1フレームあたりの時間・生成アイテム数・呼び出し回数を集計
+
+    idle はフレームの合間（アプリではタイマーの空き時間）の処理で、フレーム時間とは別に集計する。
+    """
+    for i in range(warmup):
+        draw(i)
+        if idle is not None:
+            idle()
+
+    samples: List[float] = []
+    items_created = 0
+    hands_skipped = 0
+    calls = 0
+    idle_ms = 0.0
+    for i in range(warmup, warmup + iterations):
+        stats_before = renderer.get_render_stats()
+        calls_before = canvas.get_call_count()
+        start = time.perf_counter()
+        draw(i)
+        samples.append((time.perf_counter() - start) * 1000.0)
+        stats_after = renderer.get_render_stats()
+        items_created += stats_after['created_total'] - stats_before['created_total']
+        hands_skipped += stats_after['hands_skipped_total'] - stats_before['hands_skipped_total']
+        calls += canvas.get_call_count() - calls_before
+        if idle is not None:
+            start = time.perf_counter()
+            idle()
+            idle_ms += (time.perf_counter() - start) * 1000.0
+
+    summary: Dict[str, float] = summarize_samples(samples)
+    summary['items_created_per_frame'] = items_created / iterations if iterations else 0.0
+    summary['canvas_calls_per_frame'] = calls / iterations if iterations else 0.0
+    summary['hands_skipped_per_frame'] = hands_skipped / iterations if iterations else 0.0
+    summary['idle_ms_per_frame'] = idle_ms / iterations if iterations else 0.0
+    return summary
+
+def _create_canvas(backend: str, size: int, tk_root: Any) -> Any:
+    """計測に使う描画先を生成"""
+    if backend == 'tk':
+        import tkinter as tk
+        canvas = tk.Canvas(tk_root, width=size, height=size, highlightthickness=0)
+        canvas.pack()
+        return canvas
+    return DisplayListCanvas(size, size)
+
+def benchmark_case(theme: ITheme, size: int, frames: int = 600, face_iterations: int = 20,
+                   warmup: int = 5, backend: str = 'display_list', tk_root: Any = None,
+                   prerender_dial: bool = False) -> Dict[str, Any]:
+    """1つのテーマ・サイズについて文字盤とティック（針）の描画コストを計測"""
+    config = ClockConfig(persist=False)
+    config.set_clock_size(size)
+    config.set("prerender_dial", prerender_dial)
+
+    raw_canvas = _create_canvas(backend, size, tk_root)
+    canvas = RecordingCanvas(raw_canvas)
+    renderer = AnalogClockRenderer()
+    renderer.initialize(canvas, config)
+
+    def draw_face(_: int) -> None:
+        renderer.clear_all()
+        renderer.render_clock_face(theme)
+        if tk_root is not None:
+            tk_root.update_idletasks()
+
+    start_time = datetime(2025, 1, 1, 10, 8, 0)
+
+    def draw_tick(i: int) -> None:
+        current = start_time + timedelta(seconds=i)
+        renderer.render_hands(current.hour % 12, current.minute, current.second, theme)
+        if tk_root is not None:
+            tk_root.update_idletasks()
+
+    def warm_sprites() -> None:
+        # アプリではティックの合間のタイマーで行う発光スプライトの先読み
+        renderer.warm_glow_sprites()
+
+    face = _measure(renderer, canvas, draw_face, face_iterations, 1)
+    tick = _measure(renderer, canvas, draw_tick, frames, warmup, warm_sprites)
+
+    if backend == 'tk':
+        raw_canvas.destroy()
+
+    result = {
+        'theme': theme.get_name(),
+        'size': size,
+        'radius': config.get_radius(),
+        'face': face,
+        'tick': tick
+    }
+    if prerender_dial:
+        # 初回のラスター化はウォームアップに含まれるため、再構築時間は別に報告する
+        result['dial_cache'] = renderer.get_dial_cache_stats()
+    return result
+
+def run_renderer_benchmark(theme_names: Optional[Sequence[str]] = None,
+                           sizes: Optional[Sequence[int]] = None,
+                           frames: int = 600, face_iterations: int = 20, warmup: int = 5,
+                           backend: str = 'display_list', prerender_dial: bool = False) -> Dict[str, Any]:
+    """すべてのテーマ×サイズについてレンダラーのフレームコストを計測"""
+    theme_manager = ThemeManager()
+    theme_names = list(theme_names or theme_manager.get_theme_names())
+    sizes = list(sizes or BENCHMARK_SIZES)
+
+    tk_root = None
+    if backend == 'tk':
+        import tkinter as tk
+        tk_root = tk.Tk()
+
+    results = []
+    try:
+        for size in sizes:
+            for theme_name in theme_names:
+                theme = theme_manager.get_theme(theme_name)
+                if theme is None:
+                    raise ValueError(f"Unknown theme: {theme_name}")
+                results.append(benchmark_case(theme, size, frames, face_iterations,
+                                              warmup, backend, tk_root, prerender_dial))
+    finally:
+        if tk_root is not None:
+            tk_root.destroy()
+
+    return {
+        'benchmark': 'renderer',
+        'environment': _environment(),
+        'parameters': {
+            'backend': backend,
+            'prerender_dial': prerender_dial,
+            'frames': frames,
+            'face_iterations': face_iterations,
+            'warmup': warmup,
+            'themes': theme_names,
+            'sizes': sizes
+        },
+        'results': results
+    }
+
+def format_renderer_report(report: Dict[str, Any]) -> str:
+    """計測結果を表形式の文字列に整形"""
+    lines = [
+        f"{'theme':<8} {'size':>5} | {'face ms':>8} {'face p99':>8} {'items':>6} | "
+        f"{'tick ms':>8} {'p50':>7} {'p99':>7} {'items':>6} {'calls':>6} | {'idle ms':>7}"
+    ]
+    for result in report['results']:
+        face = result['face']
+        tick = result['tick']
+        lines.append(
+            f"{result['theme']:<8} {result['size']:>5} | "
+            f"{face['mean_ms']:>8.3f} {face['p99_ms']:>8.3f} {face['items_created_per_frame']:>6.1f} | "
+            f"{tick['mean_ms']:>8.4f} {tick['p50_ms']:>7.4f} {tick['p99_ms']:>7.4f} "
+            f"{tick['items_created_per_frame']:>6.2f} {tick['canvas_calls_per_frame']:>6.2f} | "
+            f"{tick['idle_ms_per_frame']:>7.3f}"
+        )
+    if report['parameters'].get('prerender_dial') and report['results']:
+        dial_cache = report['results'][-1]['dial_cache']
+        lines.append(
+            f"dial cache: {dial_cache['size']} images, {dial_cache['bytes'] / (1024 * 1024):.1f} MiB, "
+            f"rebuild mean {dial_cache['mean_build_ms']:.1f} ms / max {dial_cache['max_build_ms']:.1f} ms"
+        )
+    return "\n".join(lines)
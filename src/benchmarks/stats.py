@@ -0,0 +1,20 @@
+from typing import Dict, List, Sequence
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """ソート済みサンプルのパーセンタイル値を取得"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+def summarize_samples(samples_ms: Sequence[float]) -> Dict[str, float]:
+    """計測値（ミリ秒）の平均・p50・p99・最大を計算"""
+    ordered = sorted(samples_ms)
+    count = len(ordered)
+    return {
+        'count': count,
+        'mean_ms': sum(ordered) / count if count else 0.0,
+        'p50_ms': _percentile(ordered, 0.50),
+        'p99_ms': _percentile(ordered, 0.99),
+        'max_ms': ordered[-1] if ordered else 0.0
+    }
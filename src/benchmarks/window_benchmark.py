@@ -0,0 +1,110 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from .renderer_benchmark import _environment
+
+# 1人あたりの時計の数（マルチモニターの机で 6〜12 個）
+WINDOW_COUNTS: List[int] = [1, 6, 12]
+
+# 子プロセスで実行するモジュール（リポジトリのルートから -m で起動）
+_CHILD_MODULE = 'src.benchmarks.window_benchmark'
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _pump(root: Any, seconds: float) -> None:
+    """メインループの代わりにイベントを処理して数ティック分動かす"""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        root.update()
+        time.sleep(0.01)
+
+def _measure_child(mode: str, count: int, seconds: float) -> Dict[str, Any]:
+    """子プロセス内で時計を起動し、数ティック後の RSS を測る（mode: 'process' は単独の時計1つ）"""
+    from ..core.clock_application import ClockApplication
+    from ..core.clock_host import ClockHost
+    from ..rendering.performance_hud import get_process_rss
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_files = [os.path.join(directory, f"clock_{index}.json") for index in range(count)]
+        if mode == 'process':
+            application = ClockApplication(config_files[0])
+            application.initialize()
+            application.start()
+            _pump(application.get_window_manager().get_clock_root(), seconds)
+            result = {'rss': get_process_rss()}
+            application.shutdown()
+            return result
+        host = ClockHost(config_files)
+        host.initialize()
+        host.start()
+        _pump(host.get_master(), seconds)
+        result = host.get_memory_stats()
+        result['tick'] = {key: value for key, value in host.get_tick_stats().items()
+                          if key in ('ticks', 'callbacks', 'wakeups_shared', 'interval_ms')}
+        host.shutdown()
+        return result
+
+def _run_child(mode: str, count: int, seconds: float) -> Dict[str, Any]:
+    """別プロセスで計測（プロセスごとの RSS を他の計測と混ぜないため）"""
+    completed = subprocess.run(
+        [sys.executable, '-m', _CHILD_MODULE, mode, str(count), str(seconds)],
+        cwd=_REPO_ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        errors = completed.stderr.strip().splitlines()
+        detail = errors[-1] if errors else f"exit code {completed.returncode}"
+        raise RuntimeError(f"{mode} x{count} failed: {detail}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def run_window_benchmark(counts: Optional[Sequence[int]] = None, seconds: float = 2.0) -> Dict[str, Any]:
+    """時計を別プロセスで起動した場合と、1つのホストに並べた場合のメモリを比較（Tk のディスプレイが必要）"""
+    counts = sorted(set(counts or WINDOW_COUNTS))
+    single = _run_child('process', 1, seconds)
+    results = []
+    baseline: Optional[int] = None
+    for count in counts:
+        host = _run_child('host', count, seconds)
+        if count == 1:
+            baseline = host['rss']
+        results.append({
+            'windows': count,
+            'separate_processes_rss': single['rss'] * count if single['rss'] else None,
+            'host_rss': host['rss'],
+            'host_rss_per_additional_window': host['rss_per_additional_window'],
+            'tick': host['tick']
+        })
+    return {
+        'benchmark': 'windows',
+        'environment': _environment(),
+        'parameters': {
+            'counts': counts,
+            'seconds': seconds
+        },
+        'single_process_rss': single['rss'],
+        'host_single_window_rss': baseline,
+        'results': results
+    }
+
+def _mb(value: Optional[float]) -> str:
+    """バイト数を MB の文字列に（取得できなければ -）"""
+    return f"{value / (1024 * 1024):.1f}" if value is not None else "-"
+
+def format_window_report(report: Dict[str, Any]) -> str:
+    """計測結果を表形式の文字列に整形"""
+    lines = [f"single clock process RSS: {_mb(report['single_process_rss'])} MB",
+             f"{'windows':>8} | {'processes MB':>12} {'host MB':>8} {'+MB/window':>10} {'saved MB':>9} | "
+             f"{'wakeups':>7} {'callbacks':>9}"]
+    for result in report['results']:
+        separate = result['separate_processes_rss']
+        host = result['host_rss']
+        saved = separate - host if separate is not None and host is not None else None
+        lines.append(f"{result['windows']:>8} | {_mb(separate):>12} {_mb(host):>8} "
+                     f"{_mb(result['host_rss_per_additional_window']):>10} {_mb(saved):>9} | "
+                     f"{result['tick']['ticks']:>7} {result['tick']['callbacks']:>9}")
+    return "\n".join(lines)
+
+if __name__ == '__main__':
+    # 子プロセス: python -m src.benchmarks.window_benchmark MODE COUNT SECONDS
+    print(json.dumps(_measure_child(sys.argv[1], int(sys.argv[2]), float(sys.argv[3]))))
@@ -1,19 +1,41 @@
 # Core application components
+# 各要素は初回アクセス時に読み込む（PEP 562）。起動時に設定画面などを読み込まないため
 
-from .clock_application import ClockApplication
-from .clock_window import ClockWindow
-from .settings_window import SettingsWindow
-from .window_manager import WindowManager
-from .time_provider import TimeProvider
-from .clock_config import ClockConfig
-from .event_manager import EventManager
+from importlib import import_module
+from typing import Any, Dict, List
 
-__all__ = [
-    'ClockApplication',
-    'ClockWindow',
-    'SettingsWindow', 
-    'WindowManager',
-    'TimeProvider',
-    'ClockConfig',
-    'EventManager'
-]
\ No newline at end of file
+# 公開名 -> 定義モジュール
+_LAZY_EXPORTS: Dict[str, str] = {
+    'ClockApplication': '.clock_application',
+    'ClockHost': '.clock_host',
+    'ClockWindow': '.clock_window',
+    'SettingsWindow': '.settings_window',
+    'WindowManager': '.window_manager',
+    'TimeProvider': '.time_provider',
+    'resolve_timezone': '.time_provider',
+    'ClockConfig': '.clock_config',
+    'EventManager': '.event_manager',
+    'TickScheduler': '.tick_scheduler',
+    'SharedTickScheduler': '.shared_tick',
+    'TickSubscription': '.shared_tick',
+    'VisibilityMonitor': '.visibility_monitor',
+    'LatencyHistogram': '.latency_histogram',
+    'WorldClockGrid': '.world_clock_grid',
+    'WorldClockApplication': '.world_clock_application',
+    'DigitalTimeFormatter': '.digital_formatter'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    """公開名を初回アクセス時に読み込む"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
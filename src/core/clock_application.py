@@ -1,86 +1,222 @@
-import tkinter as tk
-from tkinter import messagebox
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 from ..interfaces.time_provider_interface import ITimeProvider
 from ..interfaces.renderer_interface import IRenderer
 from ..interfaces.window_manager_interface import IWindowManager
-from .window_manager import WindowManager
 from .time_provider import TimeProvider
 from .clock_config import ClockConfig
 from .event_manager import EventManager
+
+from .tick_scheduler import TickScheduler
+from .visibility_monitor import VisibilityMonitor
+from .frame_governor import FrameGovernor
+from .digital_formatter import DEFAULT_DIGITAL_FORMAT, DigitalTimeFormatter
+from .frame_recorder import (FLAG_ANIMATED, FLAG_DIGITAL_UPDATED, FLAG_HIDDEN, STAGE_FLUSH, STAGE_FORMAT,
+                             STAGE_HANDS, STAGE_TIME, NullFrameRecorder, create_frame_recorder)
+from .startup_profiler import is_startup_profiling, mark_startup, watch_first_frame
 from ..themes.theme_manager import ThemeManager
-from ..rendering.analog_clock_renderer import AnalogClockRenderer
+from ..rendering.renderer_factory import create_renderer
+
+if TYPE_CHECKING:
+    from ..rendering.performance_hud import PerformanceHud
+    from .shared_tick import SharedTickScheduler, TickSubscription
+
+# 設定画面の変更は設定名ごとのイベント種別で発行する（種類ごとに集約するため）
+SETTING_EVENT_PREFIX = 'settings_changed.'
 
 class ClockApplication:
-    """メインアプリケーションクラス - Single Responsibility Principle"""
+    """メインアプリケーションクラス - Single Responsibility Principle
     
-    def __init__(self):
+    master・theme_manager・tick_host を渡すと、ClockHost が管理する1つの時計ウィンドウとして動作する
+    （Tk インタープリター・テーマ・ティックを他のウィンドウと共有し、mainloop は呼び出し側が回す）。
+    """
+    
+    def __init__(self, config_file: Optional[str] = None, master: Any = None,
+                 theme_manager: Optional[ThemeManager] = None, tick_host: Optional["SharedTickScheduler"] = None,
+                 on_closed: Optional[Callable[["ClockApplication"], None]] = None):
+        self._config_file = config_file
+        self._master = master
+        self._shared_theme_manager = theme_manager
+        self._tick_host = tick_host
+        self._on_closed = on_closed
         self._window_manager: Optional[IWindowManager] = None
         self._time_provider: Optional[ITimeProvider] = None
         self._renderer: Optional[IRenderer] = None
         self._config: Optional[ClockConfig] = None
         self._theme_manager: Optional[ThemeManager] = None
         self._event_manager: Optional[EventManager] = None
+        self._scheduler: Optional[Union[TickScheduler, "TickSubscription"]] = None
+        self._governor: Optional[FrameGovernor] = None
+        self._visibility_monitor: Optional[VisibilityMonitor] = None
+        self._digital_formatter: Optional[DigitalTimeFormatter] = None
+        self._frame_recorder = NullFrameRecorder()
+        self._performance_hud: Optional["PerformanceHud"] = None
+        self._last_digital_time = None
         self._is_running = False
+        self._is_shut_down = False
+        self._startup_started: Optional[float] = None
+        self._startup_marks: Dict[str, float] = {}  # 初期化開始からの経過時間（ms）
     
-    def initialize(self) -> None:
-        """アプリケーションを初期化"""
+    def initialize(self, renderer_type: str = "canvas") -> None:
+        """アプリケーションを初期化
+        
+        renderer_type: "canvas"（Tk ウィンドウに描画）または "display_list"（ヘッドレス）
+        """
+        self._startup_started = time.perf_counter()
+        self._startup_marks = {}
+        
         # Dependency Injection for easy testing and extensibility
-        self._config = ClockConfig()
-        self._time_provider = TimeProvider()
-        self._theme_manager = ThemeManager()
+        self._config = ClockConfig(self._config_file)
+        self._time_provider = TimeProvider(self._config.get("timezone", "local"))
+        self._theme_manager = self._shared_theme_manager or ThemeManager()
+        self._digital_formatter = DigitalTimeFormatter(self._config.get("digital_format", DEFAULT_DIGITAL_FORMAT))
+        # フレームごとの段階別の時間を固定長のリングバッファファイルへ記録（設定 "frame_log_enabled"）
+        self._frame_recorder = create_frame_recorder(self._config)
         
-        # Create window manager
-        self._window_manager = WindowManager(self._config)
+        if renderer_type != "canvas":
+            # ヘッドレス: ウィンドウを作らずメモリ上のディスプレイリストへ描画
+            self._renderer = create_renderer(renderer_type)
+            self._renderer.initialize(None, self._config)
+            return
+        
+        # Create window manager（Tk はウィンドウを使う場合だけ読み込む）
+        from .window_manager import WindowManager
+        self._window_manager = WindowManager(self._config, self._master)
         
         # Setup event management
         self._event_manager = EventManager()
         self._setup_events()
         
-        # Initialize window manager with callbacks
+        # Initialize window manager with callbacks（設定画面の変更はイベントとして発行する）
         self._window_manager.initialize(
             self._theme_manager.get_theme_names(),
-            self._on_theme_changed,
-            self._on_settings_changed,
+            self._publish_theme_changed,
+            self._publish_setting_changed,
             self._on_close
         )
+        # 以降のイベントは Tk のアイドル時にまとめて配信（同じ種類の連続したイベントは1回に集約）
+        self._event_manager.attach(self._window_manager.get_clock_root())
         
         # Initialize renderer
         clock_window = self._window_manager.get_clock_window()
         if clock_window:
-            self._renderer = AnalogClockRenderer()
+            self._renderer = create_renderer(renderer_type)
             self._renderer.initialize(clock_window.get_canvas(), self._config)
+            # ウィンドウの端のドラッグに合わせて時計を拡大縮小
+            clock_window.set_resize_callback(self._on_window_resized)
         
         # Set initial theme
         initial_theme = self._theme_manager.get_theme(self._config.get_current_theme())
         if initial_theme:
             self._window_manager.apply_theme(initial_theme)
+        self._mark_startup('window_ready')
+    
+    def _mark_startup(self, name: str) -> None:
+        """起動からの経過時間を記録（起動プロファイルにも反映）"""
+        if self._startup_started is not None:
+            self._startup_marks.setdefault(name, (time.perf_counter() - self._startup_started) * 1000.0)
+        mark_startup(name)
+    
+    def get_startup_stats(self) -> Dict[str, float]:
+        """初回フレームまでの時間（初期化開始からの ms）を取得
+        
+        window_ready: ウィンドウ生成完了（非表示のまま）, frame_ready: 初回フレーム描画完了,
+        mapped: ウィンドウ表示, first_paint: 表示後の最初の描画完了
+        """
+        return dict(self._startup_marks)
     
     def _setup_events(self) -> None:
         """イベントハンドラーを設定"""
-        self._event_manager.subscribe('theme_changed', self._on_theme_changed)
-        self._event_manager.subscribe('settings_changed', self._on_settings_changed)
-        self._event_manager.subscribe('close_application', self._on_close)
+        events = self._event_manager
+        # レイアウトを変えるイベントは、同じ周期の再描画より先に処理する
+        events.subscribe(SETTING_EVENT_PREFIX + 'size_changed', self._on_size_changed, priority=10)
+        events.subscribe(SETTING_EVENT_PREFIX + 'reset', self._on_reset, priority=10)
+        events.subscribe(SETTING_EVENT_PREFIX + 'show_digital_clock', self._on_digital_visibility_changed, priority=5)
+        events.subscribe('theme_changed', self._on_theme_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'always_on_top', self._on_topmost_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'enable_animations', self._on_animation_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'timezone', self._on_timezone_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'digital_format', self._on_digital_format_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'prerender_dial', self._on_prerender_dial_changed)
+        events.subscribe(SETTING_EVENT_PREFIX + 'show_performance_hud', self._on_performance_hud_changed)
+        events.subscribe('close_application', self._on_close)
+    
+    def _publish_theme_changed(self, theme_name: str) -> None:
+        """テーマ変更イベントを発行"""
+        self._event_manager.publish('theme_changed', theme_name)
+    
+    def _publish_setting_changed(self, setting_name: str, value) -> None:
+        """設定変更を設定ごとのイベントとして発行"""
+        self._event_manager.publish(SETTING_EVENT_PREFIX + setting_name, value)
+    
+    def get_event_stats(self) -> Dict[str, Any]:
+        """イベント配信の統計（集約数・ハンドラーごとの処理時間）を取得"""
+        return self._event_manager.get_stats() if self._event_manager else {}
     
     def _on_theme_changed(self, theme_name: str) -> None:
         """テーマ変更イベントハンドラー"""
         theme = self._theme_manager.get_theme(theme_name)
         if theme and self._window_manager and self._renderer:
             self._window_manager.apply_theme(theme)
-            self._renderer.clear_all()
-            self._renderer.render_clock_face(theme)
+            # 色の違いだけなら既存の文字盤アイテムを再スタイル（構造が違う役割だけ生成・削除）
+            self._renderer.restyle_clock_face(theme)
             self._config.set_current_theme(theme_name)
+            # 針は次のティックを待たずに新しいテーマで描き直す
+            self._update_clock()
+    
+    def _on_topmost_changed(self, value: bool) -> None:
+        """最前面表示の変更イベントハンドラー"""
+        self._apply_topmost_setting()
+    
+    def _on_digital_visibility_changed(self, value: bool) -> None:
+        """デジタル表示の切り替えイベントハンドラー"""
+        self._update_digital_display_visibility()
+    
+    def _on_animation_changed(self, value: bool) -> None:
+        """滑らかな秒針の切り替えイベントハンドラー"""
+        self._configure_animation()
+    
+    def _on_timezone_changed(self, value: Optional[str]) -> None:
+        """タイムゾーン変更イベントハンドラー"""
+        self._time_provider.set_timezone(value or "local")
+        self._last_digital_time = None
+    
+    def _on_digital_format_changed(self, value: Optional[str]) -> None:
+        """デジタル表示の書式変更イベントハンドラー"""
+        self._digital_formatter = DigitalTimeFormatter(value or DEFAULT_DIGITAL_FORMAT)
+        self._last_digital_time = None
     
-    def _on_settings_changed(self, setting_name: str, value) -> None:
-        """設定変更イベントハンドラー"""
-        if setting_name == "always_on_top":
-            self._apply_topmost_setting()
-        elif setting_name == "show_digital_clock":
-            self._update_digital_display_visibility()
-        elif setting_name == "size_changed":
-            self._handle_size_change()
-        elif setting_name == "reset":
-            self._handle_reset()
+    def _on_prerender_dial_changed(self, value: bool) -> None:
+        """文字盤の描画方式を切り替えて描き直す（針は次のティックで作り直される）"""
+        current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
+        if current_theme and self._renderer:
+            self._renderer.clear_all()
+            self._renderer.render_clock_face(current_theme)
+    
+    def _on_performance_hud_changed(self, value: bool) -> None:
+        """性能表示の切り替えイベントハンドラー"""
+        self._set_performance_hud(bool(value))
+    
+    def _set_performance_hud(self, visible: bool) -> None:
+        """時計のキャンバスに性能表示を重ねる/外す"""
+        if not visible:
+            if self._performance_hud:
+                self._performance_hud.stop()
+                self._performance_hud = None
+            return
+        clock_window = self._window_manager.get_clock_window() if self._window_manager else None
+        if self._performance_hud is None and clock_window:
+            from ..rendering.performance_hud import PerformanceHud
+            self._performance_hud = PerformanceHud(clock_window.get_canvas())
+            self._performance_hud.start()
+    
+    def _on_size_changed(self, value: int) -> None:
+        """サイズ変更イベントハンドラー（連続した変更は最後の1回だけ処理される）"""
+        self._handle_size_change()
+    
+    def _on_reset(self, value: bool) -> None:
+        """リセットイベントハンドラー"""
+        self._handle_reset()
     
     def _apply_topmost_setting(self) -> None:
         """常に最前面表示設定を適用"""
@@ -102,17 +238,27 @@ class ClockApplication:
         if self._window_manager and self._renderer:
             # ウィンドウサイズを更新
             self._window_manager.update_clock_size()
-            
-            # レンダラーを再初期化
-            clock_window = self._window_manager.get_clock_window()
-            if clock_window:
-                self._renderer.initialize(clock_window.get_canvas(), self._config)
-                
-                # 時計を再描画
-                current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
-                if current_theme:
-                    self._renderer.clear_all()
-                    self._renderer.render_clock_face(current_theme)
+            self._resize_clock_face()
+    
+    def _on_window_resized(self, size: int) -> None:
+        """ウィンドウの端のドラッグによるサイズ変更（フレーム間隔ごとに最新のサイズで呼ばれる）"""
+        if not (self._window_manager and self._renderer):
+            return
+        self._config.set_clock_size(size)
+        clock_window = self._window_manager.get_clock_window()
+        if clock_window:
+            # ウィンドウはドラッグ中の大きさのまま、キャンバスと時計だけを合わせる
+            clock_window.resize_canvas()
+            self._resize_clock_face()
+            # 針は次のティックを待たずに新しいサイズで描き直す
+            self._update_clock()
+    
+    def _resize_clock_face(self) -> None:
+        """文字盤を新しいサイズに合わせる（既存アイテムを変形し、品質が落ちる場合だけ描き直す）"""
+        clock_window = self._window_manager.get_clock_window()
+        current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
+        if clock_window and current_theme:
+            self._renderer.resize(clock_window.get_canvas(), self._config, current_theme)
     
     def _handle_reset(self) -> None:
         """リセットを処理"""
@@ -121,76 +267,254 @@ class ClockApplication:
         self._apply_topmost_setting()
         self._update_digital_display_visibility()
     
+    def _configure_animation(self) -> None:
+        """enable_animations 設定に応じて滑らかな秒針モードを切り替え"""
+        if self._config.get("enable_animations", True):
+            if self._governor is None:
+                self._governor = FrameGovernor(target_fps=int(self._config.get("animation_fps", 30)))
+            interval_ms = self._governor.get_interval_ms()
+        else:
+            self._governor = None
+            interval_ms = 1000
+        if self._scheduler:
+            self._scheduler.set_interval(interval_ms)
+    
     def _update_clock(self) -> None:
         """時計を更新"""
         if not self._is_running:
             return
-            
+        recorder = self._frame_recorder
+        recorder.begin_frame()
+        start = time.perf_counter()
+        if self._governor is None:
+            self._render_frame()
+            self._end_frame_record(start)
+            return
+        
+        # 滑らかな秒針モード: Tk の再描画を含めたフレーム時間でレートを調整
+        recorder.set_flag(FLAG_ANIMATED)
+        self._render_frame()
+        clock_root = self._window_manager.get_clock_root() if self._window_manager else None
+        if clock_root:
+            viewable = self._is_clock_visible(clock_root)
+            self._governor.set_hidden(not viewable)
+            if viewable:
+                clock_root.update_idletasks()
+            else:
+                recorder.set_flag(FLAG_HIDDEN)
+            recorder.mark(STAGE_FLUSH)
+        self._governor.record_frame((time.perf_counter() - start) * 1000.0)
+        if self._scheduler:
+            self._scheduler.set_interval(self._governor.get_interval_ms())
+        self._end_frame_record(start)
+    
+    def _is_clock_visible(self, clock_root) -> bool:
+        """時計ウィンドウが画面に見えているか（監視の開始前は Tk に問い合わせる）"""
+        if self._visibility_monitor:
+            return self._visibility_monitor.is_visible()
+        return bool(clock_root.winfo_viewable())
+    
+    def _on_visibility_changed(self, visible: bool) -> None:
+        """最小化・非表示・完全に隠れた間はティックを止め、再表示で即座に追いつく"""
+        if not self._is_running or not self._scheduler:
+            return
+        if self._governor:
+            self._governor.set_hidden(not visible)
+        if visible:
+            # 即座に1フレーム描画してから境界に揃えたティックを再開
+            self._scheduler.resume()
+            if self._governor:
+                # 表示前（withdraw 中）のティックで 1 Hz に落ちていても、次の 1 秒を待たずに待ち直す
+                self._scheduler.set_interval(self._governor.get_interval_ms())
+            if self._config.get("show_performance_hud", False):
+                self._set_performance_hud(True)
+        else:
+            self._scheduler.suspend()
+            if self._governor:
+                # 省略した起床回数は、従来の非表示中のレート（1 Hz）を基準に数える
+                self._scheduler.set_interval(self._governor.get_interval_ms())
+            # 性能表示の独自タイマーも止める（再表示時に作り直す）
+            self._set_performance_hud(False)
+    
+    def _end_frame_record(self, start: float) -> None:
+        """フレームの計測結果をティックの遅延・間隔と合わせて記録"""
+        if self._scheduler:
+            lateness_ms = self._scheduler.get_last_lateness_ms()
+            self._frame_recorder.end_frame(lateness_ms, self._scheduler.get_interval_ms())
+        else:
+            lateness_ms = 0.0
+            self._frame_recorder.end_frame()
+        if self._performance_hud:
+            self._performance_hud.record_frame((time.perf_counter() - start) * 1000.0, lateness_ms)
+    
+    def get_frame_log_stats(self) -> Dict[str, Any]:
+        """フレームログの記録先と書き込み済みレコード数を取得"""
+        return self._frame_recorder.get_stats()
+    
+    def render_frame(self) -> None:
+        """現在時刻で文字盤と針を1フレーム描画（ヘッドレスレンダラー向け）"""
+        if not self._renderer:
+            raise RuntimeError("Application must be initialized before rendering")
+        current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
+        if current_theme:
+            self._renderer.clear_all()
+            self._renderer.render_clock_face(current_theme)
+        self._render_frame()
+    
+    def get_renderer(self) -> Optional[IRenderer]:
+        """レンダラーを取得"""
+        return self._renderer
+    
+    def _render_frame(self) -> None:
+        """現在時刻で針とデジタル表示を更新"""
+        recorder = self._frame_recorder
         current_time = self._time_provider.get_current_time()
+        recorder.mark(STAGE_TIME)
         
-        # Update digital display
-        digital_time = self._time_provider.format_time(
-            current_time, 
-            "%Y年%m月%d日 %H:%M:%S"
-        )
-        if self._window_manager:
-            self._window_manager.update_digital_display(digital_time)
+        # Update digital display (秒が変わったときだけ)
+        whole_second = current_time.replace(microsecond=0)
+        if whole_second != self._last_digital_time:
+            self._last_digital_time = whole_second
+            # 日付部分はキャッシュし、変わった時刻フィールドだけを書き直す
+            digital_time = self._digital_formatter.format(current_time)
+            if self._window_manager:
+                self._window_manager.update_digital_display(digital_time)
+            recorder.set_flag(FLAG_DIGITAL_UPDATED)
+        recorder.mark(STAGE_FORMAT)
         
         # Update analog display
         hours = current_time.hour % 12
         minutes = current_time.minute
         seconds = current_time.second
+        if self._governor:
+            # 滑らかな秒針: 秒の小数部まで反映
+            seconds += current_time.microsecond / 1_000_000
         
         current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
         
         if self._renderer and current_theme:
-            self._renderer.clear_hands()
+            # レンダラーが前回の針を再利用・更新するため clear_hands は不要
             self._renderer.render_hands(hours, minutes, seconds, current_theme)
-        
-        # Schedule next update
-        if self._window_manager:
-            clock_root = self._window_manager.get_clock_root()
-            if clock_root:
-                clock_root.after(1000, self._update_clock)
+        recorder.mark(STAGE_HANDS)
+    
+    def get_tick_stats(self) -> dict:
+        """ティックスケジューラーの統計（遅延ヒストグラム、非表示中に省略した起床回数など）を取得"""
+        if self._scheduler:
+            return self._scheduler.get_stats()
+        return {}
+    
+    def get_animation_stats(self) -> dict:
+        """滑らかな秒針モードの統計（目標/実際のfps、フレーム時間）を取得"""
+        if self._governor:
+            return self._governor.get_stats()
+        return {}
+    
+    def get_config(self) -> Optional[ClockConfig]:
+        """設定を取得"""
+        return self._config
+    
+    def get_window_manager(self) -> Optional[IWindowManager]:
+        """ウィンドウマネージャーを取得"""
+        return self._window_manager
     
     def run(self) -> None:
         """アプリケーションを実行"""
+        self.start()
+        
+        # Start main loop
+        clock_root = self._window_manager.get_clock_root()
+        try:
+            if clock_root:
+                clock_root.mainloop()
+        finally:
+            self._is_running = False
+    
+    def start(self) -> None:
+        """初回フレームを描画してティックを開始し、ウィンドウを表示（mainloop は回さない）"""
         if not self._window_manager:
             raise RuntimeError("Application must be initialized before running")
         
         self._is_running = True
         
-        # Show clock window
-        self._window_manager.show_clock_window()
-        
-        # Initial render
+        # Initial render（ウィンドウは非表示のまま、文字盤と針を描き終えてから表示する）
         current_theme = self._theme_manager.get_theme(self._config.get_current_theme())
         if self._renderer and current_theme:
             self._renderer.render_clock_face(current_theme)
         
+        # Start clock updates (秒境界に揃えてティックを発行、最初のティックは即座に針を描く)
+        clock_root = self._window_manager.get_clock_root()
+        if clock_root:
+            # 非表示の間はティックを止める（最初のティックより前に監視を始め、表示された時点でレートを戻す）
+            self._visibility_monitor = VisibilityMonitor(clock_root, self._on_visibility_changed)
+            self._visibility_monitor.start()
+            if self._tick_host:
+                # ホスト上のウィンドウは1つのティックを共有する
+                self._scheduler = self._tick_host.subscribe(self._update_clock)
+            else:
+                self._scheduler = TickScheduler(clock_root, self._update_clock)
+            self._configure_animation()
+            self._scheduler.start()
+        self._mark_startup('frame_ready')
+        if self._config.get("show_performance_hud", False):
+            self._set_performance_hud(True)
+        
         # Apply initial settings
         self._apply_topmost_setting()
         
-        # Start clock updates
-        self._update_clock()
+        if clock_root:
+            self._watch_first_paint(clock_root)
+        if is_startup_profiling() and self._window_manager.get_clock_window():
+            watch_first_frame(self._window_manager.get_clock_window().get_canvas())
         
-        # Start main loop
-        try:
-            clock_root = self._window_manager.get_clock_root()
-            if clock_root:
-                clock_root.mainloop()
-        finally:
-            self._is_running = False
+        # Show clock window（サイズ・位置は生成時に確定済み）
+        self._window_manager.show_clock_window()
+    
+    def _watch_first_paint(self, clock_root) -> None:
+        """ウィンドウが表示され、最初の描画が終わった時点を記録"""
+        def on_map(event) -> None:
+            if event.widget is not clock_root:
+                return
+            clock_root.unbind('<Map>', bind_id)
+            self._mark_startup('mapped')
+            clock_root.after_idle(lambda: self._mark_startup('first_paint'))
+        
+        bind_id = clock_root.bind('<Map>', on_map, add='+')
     
     def _on_close(self) -> None:
         """アプリケーション終了イベント"""
         self.shutdown()
     
     def shutdown(self) -> None:
-        """アプリケーションを終了"""
+        """アプリケーションを終了（ホスト上のウィンドウはそのウィンドウだけを閉じる、2回目以降は何もしない）"""
+        if self._is_shut_down:
+            # メニューの「終了」の後に main の finally からも呼ばれる
+            return
+        self._is_shut_down = True
         self._is_running = False
+        if self._scheduler:
+            self._scheduler.stop()
+            if self._tick_host:
+                self._tick_host.unsubscribe(self._scheduler)
+                self._scheduler = None
+        if self._visibility_monitor:
+            self._visibility_monitor.stop()
+        if self._event_manager:
+            self._event_manager.detach()
+        self._set_performance_hud(False)
+        if self._window_manager:
+            # 次回起動時に同じ位置へ復元する
+            self._window_manager.save_window_position()
+        self._frame_recorder.close()
+        if self._config:
+            # 遅延中の設定書き込みを確定
+            self._config.shutdown()
         if self._window_manager:
             clock_root = self._window_manager.get_clock_root()
             if clock_root:
-                clock_root.quit()
-                clock_root.destroy()
\ No newline at end of file
+                if self._master is None:
+                    clock_root.quit()
+                clock_root.destroy()
+            self._window_manager = None
+        if self._on_closed:
+            on_closed, self._on_closed = self._on_closed, None
+            on_closed(self)
\ No newline at end of file
@@ -1,14 +1,62 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import os
+import secrets
+import threading
+import time
+
+# サイズプリセット（表示名, 時計のサイズpx）
+SIZE_PRESETS: List[Tuple[str, int]] = [
+    ("小", 250),
+    ("中", 350),
+    ("大", 450),
+    ("特大", 550)
+]
+MIN_CLOCK_SIZE = 200
+MAX_CLOCK_SIZE = 800
+
+def clock_size_for_window(width: int, height: int) -> int:
+    """ウィンドウの大きさに収まる時計サイズ（set_clock_size のウィンドウサイズの逆算、範囲内に制限）"""
+    return min(MAX_CLOCK_SIZE, max(MIN_CLOCK_SIZE, min(width - 50, height - 100)))
+
+# 既定で表示する地域（IANA タイムゾーン名）
+DEFAULT_WORLD_CLOCKS: List[str] = [
+    "Asia/Tokyo",
+    "Asia/Shanghai",
+    "Asia/Singapore",
+    "Asia/Kolkata",
+    "Asia/Dubai",
+    "Europe/Moscow",
+    "Europe/Berlin",
+    "Europe/London",
+    "America/Sao_Paulo",
+    "America/New_York",
+    "America/Chicago",
+    "America/Los_Angeles"
+]
 
 class ClockConfig:
     """設定管理クラス - Single Responsibility Principle"""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, persist: bool = True,
+                 write_delay: float = 0.5):
         self._config_file = config_file or "clock_config.json"
+        self._persist = persist  # False の場合はファイルを読み書きしない（ベンチマーク等）
         self._config: Dict[str, Any] = self._load_default_config()
-        self._load_config()
+        if self._persist:
+            self._load_config()
+        
+        # 遅延書き込み: set() の連続呼び出しを静穏期間後の1回の書き込みにまとめる
+        self._write_delay = write_delay
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()  # スナップショットの作成から書き込みまでを直列化
+        self._dirty = False
+        self._deadline = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self._set_calls = 0
+        self._changed_keys = 0  # 変更されたキーの数（1キーごとに書き込んだ場合の書き込み回数）
+        self._writes = 0
+        self._failed_writes = 0
     
     def _load_default_config(self) -> Dict[str, Any]:
         """デフォルト設定を読み込み"""
@@ -19,12 +67,23 @@ class ClockConfig:
             "clock_size": {"width": 350, "height": 350},
             "center_position": {"x": 175, "y": 175},
             "radius": 150,
+            "window_position": None,
             "timezone": "local",
             "save_settings": True,
             "show_digital_clock": True,
             "always_on_top": False,
             "enable_sounds": False,
-            "enable_animations": True
+            "enable_animations": True,
+            "animation_fps": 30,
+            "prerender_dial": False,
+            "show_performance_hud": False,
+            "frame_log_enabled": False,
+            "frame_log_path": "frame_log.bin",
+            "frame_log_capacity": 262144,
+            "digital_format": "%Y年%m月%d日 %H:%M:%S",
+            "world_clocks": list(DEFAULT_WORLD_CLOCKS),
+            "world_clock_cell_size": 160,
+            "world_clock_columns": 0
         }
     
     def _load_config(self) -> None:
@@ -38,26 +97,131 @@ class ClockConfig:
             # If loading fails, use default config
             pass
     
+    def _should_save(self) -> bool:
+        """ファイルへ保存するかどうか"""
+        return self._persist and self._config.get("save_settings", True)
+    
     def save_config(self) -> None:
-        """設定をファイルに保存"""
-        if not self._config.get("save_settings", True):
-            return
-            
-        try:
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-        except Exception:
-            # If saving fails, continue silently
-            pass
+        """設定をファイルに即座に保存"""
+        # 古いスナップショットが後から新しい書き込みを上書きしないよう、作成と書き込みを同じロックで行う
+        with self._write_lock:
+            with self._lock:
+                self._dirty = False
+                if not self._should_save():
+                    return
+                data = json.dumps(self._config, indent=2, ensure_ascii=False)
+            self._write_atomic(data)
+    
+    def _write_atomic(self, data: str) -> None:
+        """一時ファイルに書いてからリネームし、書き込み途中の破損を防ぐ（_write_lock 取得済みで呼び出す）"""
+        with self._write_lock:
+            directory = os.path.dirname(os.path.abspath(self._config_file))
+            temp_path = None
+            try:
+                path = os.path.join(directory, f".clock_config.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+                # 0666 で作成してカーネルに umask を適用させる（umask はプロセス全体のため変更しない）
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                temp_path = path
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    if os.path.exists(self._config_file):
+                        # 既存ファイルの権限を引き継ぐ
+                        os.chmod(temp_path, os.stat(self._config_file).st_mode & 0o777)
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._config_file)
+                self._writes += 1
+            except Exception:
+                # If saving fails, continue silently
+                self._failed_writes += 1
+                if temp_path and os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+    
+    def _schedule_save(self) -> None:
+        """静穏期間後の書き込みを予約（既に予約済みなら期限を延長）"""
+        with self._lock:
+            self._dirty = True
+            self._deadline = time.monotonic() + self._write_delay
+            if self._timer is None:
+                self._start_timer(self._write_delay)
+    
+    def _start_timer(self, delay: float) -> None:
+        """書き込み用タイマーを開始（ロック取得済みで呼び出す）"""
+        self._timer = threading.Timer(delay, self._on_write_timer)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _on_write_timer(self) -> None:
+        """タイマー発火時: 静穏期間が過ぎていれば書き込む"""
+        with self._lock:
+            remaining = self._deadline - time.monotonic()
+            if remaining > 0:
+                self._start_timer(remaining)
+                return
+            self._timer = None
+        self.flush()
+    
+    def flush(self) -> None:
+        """未保存の変更があれば即座に書き込む（タイマーが書き込み中なら終わるまで待つ）"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+            self.save_config()
+    
+    def shutdown(self) -> None:
+        """予約中の書き込みを取り消し、未保存の変更を書き込む"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+    
+    def get_persistence_stats(self) -> Dict[str, int]:
+        """書き込み統計（set 回数・変更されたキーの数・実際の書き込み回数・省略できた書き込み回数）を取得"""
+        return {
+            'set_calls': self._set_calls,
+            'changed_keys': self._changed_keys,
+            'writes': self._writes,
+            'failed_writes': self._failed_writes,
+            # set_values() でまとめた変更もキーごとに書き込んでいた場合と比べる
+            'writes_saved': max(0, self._changed_keys - self._writes),
+            'pending': int(self._dirty)
+        }
     
     def get(self, key: str, default: Any = None) -> Any:
         """設定値を取得"""
         return self._config.get(key, default)
     
+    def _is_unchanged(self, key: str, value: Any) -> bool:
+        """設定済みの値と同じかどうか（ロック取得済みで呼び出す）"""
+        return key in self._config and self._config[key] == value
+    
     def set(self, key: str, value: Any) -> None:
-        """設定値を設定"""
-        self._config[key] = value
-        self.save_config()
+        """設定値を設定（ファイルへの書き込みはまとめて遅延実行、値が変わらなければ何もしない）"""
+        with self._lock:
+            if self._is_unchanged(key, value):
+                return
+            self._config[key] = value
+            self._set_calls += 1
+            self._changed_keys += 1
+        if self._should_save():
+            self._schedule_save()
+    
+    def set_values(self, values: Dict[str, Any]) -> None:
+        """複数の設定値をまとめて設定（変わった値がなければ何もしない）"""
+        with self._lock:
+            changed = {key: value for key, value in values.items() if not self._is_unchanged(key, value)}
+            if not changed:
+                return
+            self._config.update(changed)
+            self._set_calls += 1
+            self._changed_keys += len(changed)
+        if self._should_save():
+            self._schedule_save()
     
     def get_default_theme(self) -> str:
         """デフォルトテーマを取得"""
@@ -83,6 +247,25 @@ class ClockConfig:
         """中心座標を取得"""
         return self._config.get("center_position", {"x": 175, "y": 175})
     
+    def set_clock_size(self, size: int) -> None:
+        """時計サイズと、それに連動するウィンドウサイズ・中心座標・半径を設定"""
+        # ウィンドウの端のドラッグでは連続して呼ばれるため、保存の予約は1回にまとめる
+        self.set_values({
+            "window_size": {"width": size + 50, "height": size + 100},
+            "clock_size": {"width": size, "height": size},
+            "center_position": {"x": size // 2, "y": size // 2},
+            "radius": (size - 50) // 2
+        })
+    
+    def get_window_position(self) -> Optional[Dict[str, int]]:
+        """前回終了時のウィンドウ位置を取得（未保存なら None）"""
+        return self._config.get("window_position")
+    
+    def set_window_position(self, x: int, y: int) -> None:
+        """ウィンドウ位置を設定"""
+        if self.get_window_position() != {"x": x, "y": y}:
+            self.set("window_position", {"x": x, "y": y})
+    
     def get_radius(self) -> int:
         """半径を取得"""
         return self._config.get("radius", 150)
\ No newline at end of file
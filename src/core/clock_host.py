@@ -0,0 +1,132 @@
+import tkinter as tk
+from typing import Any, Dict, List, Optional, Sequence
+from .clock_application import ClockApplication
+from .shared_tick import SharedTickScheduler
+from ..rendering.performance_hud import get_process_rss
+from ..themes.theme_manager import ThemeManager
+
+# 保存された位置の無いウィンドウを重ならないようにずらす量（px）
+CASCADE_OFFSET_PX = 30
+
+class ClockHost:
+    """1つのプロセス・1つの Tk インタープリターで複数の時計ウィンドウを動かすホスト - Single Responsibility Principle
+
+    ウィンドウごとに設定ファイル（テーマ・サイズ・最前面・タイムゾーン・位置）を持つ独立した Toplevel を作り、
+    テーマのオブジェクト、文字盤のレイアウト・発光スプライト・事前描画のキャッシュ（モジュール単位）と
+    1つのティックを共有する。最後のウィンドウを閉じると終了する。
+    """
+
+    def __init__(self, config_files: Sequence[str]):
+        if not config_files:
+            raise ValueError("At least one config file is required")
+        self._config_files = list(config_files)
+        self._master: Optional[tk.Tk] = None
+        self._theme_manager: Optional[ThemeManager] = None
+        self._tick: Optional[SharedTickScheduler] = None
+        self._applications: List[ClockApplication] = []
+        self._rss_before_windows: Optional[int] = None
+        self._rss_after_window: List[Optional[int]] = []  # ウィンドウを1つ表示するごとの RSS
+        self._is_running = False
+
+    def initialize(self) -> None:
+        """共有の Tk インタープリター・テーマ・ティックと、設定ファイルごとの時計ウィンドウを作成"""
+        # ウィンドウを持たない共有のルート（各時計はこの上の Toplevel）
+        self._master = tk.Tk()
+        self._master.withdraw()
+        self._rss_before_windows = get_process_rss()
+        self._theme_manager = ThemeManager()
+        self._tick = SharedTickScheduler(self._master)
+        for index, config_file in enumerate(self._config_files):
+            application = ClockApplication(config_file, self._master, self._theme_manager, self._tick,
+                                           self._on_window_closed)
+            application.initialize()
+            self._cascade(application, index)
+            self._applications.append(application)
+
+    def _cascade(self, application: ClockApplication, index: int) -> None:
+        """位置が保存されていないウィンドウを画面中央から少しずつずらして配置"""
+        config = application.get_config()
+        clock_root = application.get_window_manager().get_clock_root()
+        if index == 0 or config.get_window_position() or clock_root is None:
+            return
+        window_size = config.get_window_size()
+        offset = index * CASCADE_OFFSET_PX
+        x = max(0, (clock_root.winfo_screenwidth() - window_size['width']) // 2 + offset)
+        y = max(0, (clock_root.winfo_screenheight() - window_size['height']) // 2 + offset)
+        clock_root.geometry(f"+{x}+{y}")
+
+    def start(self) -> None:
+        """すべてのウィンドウの初回フレームを描画して表示（mainloop は回さない）"""
+        if not self._master:
+            raise RuntimeError("Host must be initialized before running")
+        self._is_running = True
+        self._rss_after_window = []
+        for application in list(self._applications):
+            application.start()
+            # ウィンドウの表示（Map）と初回の描画まで処理してから測る
+            self._master.update()
+            self._rss_after_window.append(get_process_rss())
+
+    def run(self) -> None:
+        """すべてのウィンドウを表示し、共有のメインループを実行"""
+        self.start()
+        try:
+            self._master.mainloop()
+        finally:
+            self._is_running = False
+
+    def _on_window_closed(self, application: ClockApplication) -> None:
+        """ウィンドウが閉じられた（最後の1つならメインループを終了）"""
+        if application in self._applications:
+            self._applications.remove(application)
+        if not self._applications and self._master:
+            self._master.quit()
+
+    def get_master(self) -> Optional[tk.Tk]:
+        """共有の Tk ルート（非表示）を取得"""
+        return self._master
+
+    def get_applications(self) -> List[ClockApplication]:
+        """開いている時計ウィンドウのアプリケーションの一覧を取得"""
+        return list(self._applications)
+
+    def get_tick_stats(self) -> Dict[str, Any]:
+        """共有のティックの統計（起床回数、ウィンドウごとのコールバック回数の合計）を取得"""
+        return self._tick.get_stats() if self._tick else {}
+
+    def get_memory_stats(self) -> Dict[str, Optional[float]]:
+        """メモリ使用量（RSS, バイト）と、ウィンドウ1つあたりの増分を取得
+
+        rss_first_window: 1つ目のウィンドウで増えた分（アプリのモジュールの読み込みを含む）
+        rss_per_additional_window: 2つ目以降のウィンドウ1つあたりの増分の平均
+        rss_single_process: 1つ目のウィンドウまでの RSS（時計ごとに別プロセスで起動した場合の1プロセス分の目安）
+        """
+        samples = self._rss_after_window
+        first = samples[0] if samples else None
+        last = samples[-1] if samples else None
+        per_additional = None
+        if first is not None and last is not None and len(samples) > 1:
+            per_additional = (last - first) / (len(samples) - 1)
+        return {
+            'windows': len(samples),
+            'rss': get_process_rss(),
+            'rss_before_windows': self._rss_before_windows,
+            'rss_first_window': (first - self._rss_before_windows
+                                 if first is not None and self._rss_before_windows is not None else None),
+            'rss_per_additional_window': per_additional,
+            'rss_single_process': first
+        }
+
+    def shutdown(self) -> None:
+        """すべてのウィンドウを閉じて終了"""
+        self._is_running = False
+        for application in list(self._applications):
+            application.shutdown()
+        if self._tick:
+            self._tick.stop()
+        if self._master:
+            try:
+                self._master.destroy()
+            except tk.TclError:
+                pass
+            self._master = None
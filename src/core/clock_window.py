@@ -1,7 +1,8 @@
+import re
 import tkinter as tk
-from typing import Optional
+from typing import Callable, Optional, Tuple
 from ..interfaces.theme_interface import ITheme
-from .clock_config import ClockConfig
+from .clock_config import ClockConfig, MAX_CLOCK_SIZE, MIN_CLOCK_SIZE, clock_size_for_window
 
 class ClockWindow:
     """時計表示専用ウィンドウクラス - Single Responsibility Principle"""
@@ -13,17 +14,23 @@ class ClockWindow:
         self._digital_label: Optional[tk.Label] = None
         self._digital_frame: Optional[tk.Frame] = None
         
+        # ウィンドウの端のドラッグによるサイズ変更（フレーム間隔ごとに最新のサイズだけを反映）
+        self._resize_callback: Optional[Callable[[int], None]] = None
+        self._pending_window_size: Optional[Tuple[int, int]] = None
+        self._resize_after_id: Optional[str] = None
+        
         self._setup_window()
         self._create_widgets()
     
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
         self._root.title("アナログ時計")
-        self._update_window_size()
-        self._root.resizable(False, False)
-        
-        # ウィンドウを中央に配置
-        self._center_window()
+        # 最終的なサイズと位置を一度で設定（レイアウトの往復を待たない）
+        self._apply_geometry()
+        self._root.resizable(True, True)
+        self._root.minsize(MIN_CLOCK_SIZE + 50, MIN_CLOCK_SIZE + 100)
+        self._root.maxsize(MAX_CLOCK_SIZE + 50, MAX_CLOCK_SIZE + 100)
+        self._root.bind('<Configure>', self._on_configure)
         
         # アイコン設定
         try:
@@ -31,18 +38,68 @@ class ClockWindow:
         except:
             pass
     
-    def _update_window_size(self) -> None:
-        """ウィンドウサイズを更新"""
+    def _compute_geometry(self) -> str:
+        """設定のサイズと前回の位置からジオメトリ文字列を計算（位置が無ければ画面中央）"""
         window_size = self._config.get_window_size()
-        self._root.geometry(f"{window_size['width']}x{window_size['height']}")
+        width, height = window_size['width'], window_size['height']
+        screen_width = self._root.winfo_screenwidth()
+        screen_height = self._root.winfo_screenheight()
+        
+        position = self._config.get_window_position()
+        if position:
+            # 画面構成が変わっていても画面内に収める
+            x = min(max(0, position['x']), max(0, screen_width - width))
+            y = min(max(0, position['y']), max(0, screen_height - height))
+        else:
+            x = (screen_width // 2) - (width // 2)
+            y = (screen_height // 2) - (height // 2)
+        return f"{width}x{height}+{x}+{y}"
     
-    def _center_window(self) -> None:
-        """ウィンドウを画面中央に配置"""
-        self._root.update_idletasks()
-        window_size = self._config.get_window_size()
-        x = (self._root.winfo_screenwidth() // 2) - (window_size['width'] // 2)
-        y = (self._root.winfo_screenheight() // 2) - (window_size['height'] // 2)
-        self._root.geometry(f"{window_size['width']}x{window_size['height']}+{x}+{y}")
+    def _apply_geometry(self) -> None:
+        """ウィンドウのサイズと位置を設定"""
+        self._root.geometry(self._compute_geometry())
+    
+    def remember_position(self) -> None:
+        """現在のウィンドウ位置を設定に保存（次回起動時に復元）"""
+        match = re.search(r'\+(-?\d+)\+(-?\d+)$', self._root.geometry())
+        if match:
+            self._config.set_window_position(int(match.group(1)), int(match.group(2)))
+    
+    def set_resize_callback(self, callback: Optional[Callable[[int], None]]) -> None:
+        """ウィンドウの端をドラッグしてサイズが変わったときのコールバック（新しい時計サイズを受け取る）を設定"""
+        self._resize_callback = callback
+    
+    def _on_configure(self, event: tk.Event) -> None:
+        """ウィンドウのサイズ変更を記録し、反映を1フレーム分の間隔だけ遅らせて予約"""
+        if event.widget is not self._root or self._resize_callback is None:
+            return
+        self._pending_window_size = (event.width, event.height)
+        if self._resize_after_id is None:
+            self._resize_after_id = self._root.after(self._get_resize_interval_ms(), self._apply_pending_resize)
+    
+    def _get_resize_interval_ms(self) -> int:
+        """ドラッグ中にサイズ変更を反映する間隔（滑らかな秒針モードのフレーム間隔）"""
+        return max(1, 1000 // max(1, int(self._config.get("animation_fps", 30))))
+    
+    def _apply_pending_resize(self) -> None:
+        """最後に記録したウィンドウサイズに時計サイズを合わせる"""
+        self._resize_after_id = None
+        if self._pending_window_size is None or self._resize_callback is None:
+            return
+        size = clock_size_for_window(*self._pending_window_size)
+        self._pending_window_size = None
+        # 位置の移動やプログラムからのサイズ設定では時計サイズは変わらない
+        if size != self._config.get_clock_size()['width']:
+            self._resize_callback(size)
+    
+    def resize_canvas(self) -> None:
+        """キャンバスを設定の時計サイズに合わせる（ウィンドウのサイズは変えない）"""
+        if self._canvas:
+            clock_size = self._config.get_clock_size()
+            self._canvas.config(
+                width=clock_size['width'],
+                height=clock_size['height']
+            )
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
@@ -71,18 +128,18 @@ class ClockWindow:
     
     def apply_theme(self, theme: ITheme) -> None:
         """テーマを適用"""
-        colors = theme.get_colors()
+        style = theme.get_style()
         
-        self._root.configure(bg=colors['bg'])
+        self._root.configure(bg=style.bg)
         
         if self._digital_frame:
-            self._digital_frame.configure(bg=colors['bg'])
+            self._digital_frame.configure(bg=style.bg)
         
         if self._digital_label:
-            self._digital_label.configure(bg=colors['bg'], fg=colors['digital_fg'])
+            self._digital_label.configure(bg=style.bg, fg=style.digital_fg)
         
         if self._canvas:
-            self._canvas.configure(bg=colors['canvas_bg'])
+            self._canvas.configure(bg=style.canvas_bg)
     
     def update_digital_display(self, time_text: str) -> None:
         """デジタル表示を更新"""
@@ -91,17 +148,13 @@ class ClockWindow:
     
     def update_size(self) -> None:
         """サイズを更新"""
-        # ウィンドウサイズを更新
-        self._update_window_size()
-        self._center_window()
+        # 現在の位置を保ったままウィンドウサイズを更新
+        if self._root.winfo_ismapped():
+            self.remember_position()
+        self._apply_geometry()
         
         # キャンバスサイズを更新
-        if self._canvas:
-            clock_size = self._config.get_clock_size()
-            self._canvas.config(
-                width=clock_size['width'],
-                height=clock_size['height']
-            )
+        self.resize_canvas()
         
         # デジタル表示の表示/非表示を更新
         if self._config.get("show_digital_clock", True):
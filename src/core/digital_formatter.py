@@ -0,0 +1,132 @@
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+# デジタル表示の既定の書式
+DEFAULT_DIGITAL_FORMAT = "%Y年%m月%d日 %H:%M:%S"
+
+# 2桁のゼロ埋め文字列の表（毎回の '%02d' 書式化を避ける）
+_TWO_DIGITS: Tuple[str, ...] = tuple('%02d' % value for value in range(100))
+
+# 日付だけに依存する書式指定子（日付が変わるまで結果をキャッシュできる）
+_DATE_DIRECTIVES = frozenset('aAbBCdDeFgGhjmuUVwWxyY')
+
+# 時刻の各フィールド: 指定子 → (変化する単位, 文字列にする関数)
+_SECOND, _MINUTE, _HOUR = 0, 1, 2
+_TIME_FIELDS: Dict[str, Tuple[int, Callable[[datetime], str]]] = {
+    'H': (_HOUR, lambda t: _TWO_DIGITS[t.hour]),
+    'I': (_HOUR, lambda t: _TWO_DIGITS[t.hour % 12 or 12]),
+    'p': (_HOUR, lambda t: t.strftime('%p')),
+    'M': (_MINUTE, lambda t: _TWO_DIGITS[t.minute]),
+    'S': (_SECOND, lambda t: _TWO_DIGITS[t.second]),
+}
+
+_DIRECTIVE_PATTERN = re.compile(r'%(.)', re.DOTALL)
+
+class DigitalTimeFormatter:
+    """デジタル表示用のコンパイル済みフォーマッター - Single Responsibility Principle
+
+    書式を「日付部分」と「時刻フィールド」に分解し、日付部分は日付が変わるまで
+    キャッシュ、時刻フィールドは時・分・秒のうち変わった単位のものだけを書き直す。
+    時刻に依存する未対応の指定子（%f, %z, %c など）を含む書式は毎回 strftime で整形する。
+    """
+
+    def __init__(self, format_string: str = DEFAULT_DIGITAL_FORMAT):
+        self._format_string = format_string
+        self._pieces: List[str] = []
+        self._date_pieces: List[Tuple[int, str]] = []  # (位置, 日付部分の書式)
+        # 単位（秒・分・時）ごとの (位置, 文字列にする関数)
+        self._slots: Tuple[List[Tuple[int, Callable[[datetime], str]]], ...] = ([], [], [])
+        self._compiled = self._compile(format_string)
+        self._year = -1
+        self._month = -1
+        self._day = -1
+        self._hour = -1
+        self._minute = -1
+        self._second = -1
+        self._last_text = ''
+        self._date_renders = 0
+        self._field_renders = 0
+
+    def _compile(self, format_string: str) -> bool:
+        """書式を分解（キャッシュできない書式なら False）"""
+        pieces: List[str] = []
+        date_format: List[str] = []
+
+        def flush_date() -> None:
+            if date_format:
+                self._date_pieces.append((len(pieces), ''.join(date_format)))
+                pieces.append('')
+                date_format.clear()
+
+        position = 0
+        for match in _DIRECTIVE_PATTERN.finditer(format_string):
+            # 指定子の間の固定文字列は日付部分に含めてまとめて整形する
+            date_format.append(format_string[position:match.start()])
+            directive = match.group(1)
+            if directive in _TIME_FIELDS:
+                flush_date()
+                unit, render = _TIME_FIELDS[directive]
+                self._slots[unit].append((len(pieces), render))
+                pieces.append('')
+            elif directive in _DATE_DIRECTIVES or directive == '%':
+                date_format.append(match.group(0))
+            else:
+                self._date_pieces = []
+                self._slots = ([], [], [])
+                return False
+            position = match.end()
+        date_format.append(format_string[position:].replace('%', '%%'))
+        flush_date()
+        self._pieces = pieces
+        return True
+
+    def get_format(self) -> str:
+        """書式文字列を取得"""
+        return self._format_string
+
+    def format(self, time: datetime) -> str:
+        """時刻を整形"""
+        if not self._compiled:
+            return time.strftime(self._format_string)
+
+        # 変わった単位を調べる（対応する指定子はすべて秒単位なので、同じ秒なら前回の結果を返す）
+        if time.second != self._second:
+            changed = _SECOND
+        else:
+            changed = -1
+        if time.minute != self._minute:
+            changed = _MINUTE
+        if time.hour != self._hour:
+            changed = _HOUR
+        if time.day != self._day or time.month != self._month or time.year != self._year:
+            # 日付が変わったときだけ日付部分を整形
+            self._year = time.year
+            self._month = time.month
+            self._day = time.day
+            self._date_renders += 1
+            for index, date_format in self._date_pieces:
+                self._pieces[index] = time.strftime(date_format)
+            changed = _HOUR
+        elif changed < 0:
+            return self._last_text
+
+        self._second = time.second
+        self._minute = time.minute
+        self._hour = time.hour
+        pieces = self._pieces
+        for unit in range(changed + 1):
+            for index, render in self._slots[unit]:
+                pieces[index] = render(time)
+                self._field_renders += 1
+
+        self._last_text = ''.join(pieces)
+        return self._last_text
+
+    def get_stats(self) -> Dict[str, int]:
+        """整形の統計（日付部分・時刻フィールドを書き直した回数）を取得"""
+        return {
+            'compiled': int(self._compiled),
+            'date_renders': self._date_renders,
+            'field_renders': self._field_renders
+        }
@@ -1,38 +1,187 @@
-from typing import Dict, List, Callable, Any
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+class _Subscription(NamedTuple):
+    """購読者（priority が大きいほど先に呼ばれる）"""
+    callback: Callable
+    priority: int
+    order: int
+
+class HandlerStats:
+    """ハンドラーごとの呼び出し回数と処理時間"""
+    
+    __slots__ = ('calls', 'errors', 'total_ms', 'max_ms', 'last_error')
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_error = ''
+    
+    def record(self, elapsed_ms: float) -> None:
+        """1回の呼び出しを記録"""
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """統計を辞書で取得"""
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_ms': self.total_ms,
+            'mean_ms': self.total_ms / self.calls if self.calls else 0.0,
+            'max_ms': self.max_ms,
+            'last_error': self.last_error
+        }
+
+def _handler_name(callback: Callable) -> str:
+    """統計に表示するハンドラー名"""
+    return getattr(callback, '__qualname__', None) or repr(callback)
 
 class EventManager:
-    """イベント管理クラス - Observer Pattern"""
+    """イベント管理クラス - Observer Pattern
+    
+    attach() で Tk のルートに接続すると、publish() したイベントはキューに積まれ、
+    after_idle でまとめて配信される。同じ種類のイベントが1回のアイドル周期内に
+    複数回発行された場合は最後の引数で1回だけ配信する（連続したサイズ変更で再描画は1回）。
+    接続前は従来どおり publish() の中で同期的に配信する。
+    """
     
     def __init__(self):
-        self._subscribers: Dict[str, List[Callable]] = {}
+        self._subscribers: Dict[str, List[_Subscription]] = {}
+        self._order = 0
+        self._root: Any = None
+        self._idle_id: Optional[str] = None
+        self._pending: "OrderedDict[str, Tuple[tuple, dict]]" = OrderedDict()
+        self._handler_stats: Dict[Tuple[str, str], HandlerStats] = {}
+        self._published = 0
+        self._coalesced = 0
+        self._dispatched = 0
+        self._idle_cycles = 0
     
-    def subscribe(self, event_type: str, callback: Callable) -> None:
-        """イベントにコールバックを登録"""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+    def attach(self, root: Any) -> None:
+        """Tk のルートに接続し、以降のイベントをアイドル時に配信"""
+        self.detach()
+        self._root = root
     
-    def unsubscribe(self, event_type: str, callback: Callable) -> None:
-        """イベントからコールバックを削除"""
-        if event_type in self._subscribers:
+    def detach(self) -> None:
+        """Tk のルートから切り離す（未配信のイベントは破棄）"""
+        if self._root is not None and self._idle_id is not None:
             try:
-                self._subscribers[event_type].remove(callback)
-            except ValueError:
+                self._root.after_cancel(self._idle_id)
+            except Exception:
                 pass
+        self._root = None
+        self._idle_id = None
+        self._pending.clear()
+    
+    def subscribe(self, event_type: str, callback: Callable, priority: int = 0) -> None:
+        """イベントにコールバックを登録（priority が大きいほど先に呼ばれる）"""
+        subscribers = self._subscribers.setdefault(event_type, [])
+        self._order += 1
+        subscribers.append(_Subscription(callback, priority, self._order))
+        subscribers.sort(key=lambda subscription: (-subscription.priority, subscription.order))
+    
+    def unsubscribe(self, event_type: str, callback: Callable) -> None:
+        """イベントからコールバックを削除"""
+        subscribers = self._subscribers.get(event_type)
+        if subscribers:
+            for index, subscription in enumerate(subscribers):
+                if subscription.callback == callback:
+                    del subscribers[index]
+                    break
     
     def publish(self, event_type: str, *args, **kwargs) -> None:
-        """イベントを発行"""
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(*args, **kwargs)
-                except Exception:
-                    # Continue with other callbacks even if one fails
-                    pass
+        """イベントを発行（接続済みなら次のアイドル時に配信）"""
+        self._published += 1
+        if self._root is None:
+            self.dispatch(event_type, *args, **kwargs)
+            return
+        if event_type in self._pending:
+            # 同じ周期内の重複は最後の引数だけを残す
+            self._coalesced += 1
+        self._pending[event_type] = (args, kwargs)
+        if self._idle_id is None:
+            self._idle_id = self._root.after_idle(self._dispatch_pending)
+    
+    def dispatch(self, event_type: str, *args, **kwargs) -> None:
+        """イベントを即座に配信"""
+        self._dispatched += 1
+        for subscription in list(self._subscribers.get(event_type, ())):
+            stats = self._get_handler_stats(event_type, subscription.callback)
+            start = time.perf_counter()
+            try:
+                subscription.callback(*args, **kwargs)
+            except Exception as error:
+                # Continue with other callbacks even if one fails
+                stats.errors += 1
+                stats.last_error = f"{type(error).__name__}: {error}"
+            stats.record((time.perf_counter() - start) * 1000.0)
+    
+    def _dispatch_pending(self) -> None:
+        """キューに積まれたイベントを配信（優先度の高い購読者を持つイベントから）"""
+        self._idle_id = None
+        self._idle_cycles += 1
+        pending = list(self._pending.items())
+        self._pending.clear()
+        pending.sort(key=lambda item: -self._event_priority(item[0]))
+        for event_type, (args, kwargs) in pending:
+            # 配信中に発行されたイベントは次のアイドル周期で配信される
+            self.dispatch(event_type, *args, **kwargs)
+    
+    def _event_priority(self, event_type: str) -> int:
+        """イベントの優先度（購読者の最大の priority）"""
+        subscribers = self._subscribers.get(event_type)
+        return subscribers[0].priority if subscribers else 0
+    
+    def _get_handler_stats(self, event_type: str, callback: Callable) -> HandlerStats:
+        """ハンドラーの統計を取得（無ければ作成）"""
+        key = (event_type, _handler_name(callback))
+        stats = self._handler_stats.get(key)
+        if stats is None:
+            stats = HandlerStats()
+            self._handler_stats[key] = stats
+        return stats
+    
+    def get_pending_count(self) -> int:
+        """未配信のイベント数を取得"""
+        return len(self._pending)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """配信統計（発行・集約・配信数とハンドラーごとの処理時間）を取得"""
+        return {
+            'published': self._published,
+            'coalesced': self._coalesced,
+            'dispatched': self._dispatched,
+            'idle_cycles': self._idle_cycles,
+            'pending': len(self._pending),
+            'handlers': {
+                f"{event_type}: {name}": stats.as_dict()
+                for (event_type, name), stats in sorted(
+                    self._handler_stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+            }
+        }
+    
+    def format_stats(self) -> str:
+        """ハンドラーごとの統計を表形式の文字列に整形（処理時間の合計が大きい順）"""
+        stats = self.get_stats()
+        lines = [
+            f"published {stats['published']}, coalesced {stats['coalesced']}, "
+            f"dispatched {stats['dispatched']}, idle cycles {stats['idle_cycles']}",
+            f"{'calls':>6} {'errors':>6} {'mean ms':>8} {'max ms':>8}  handler"
+        ]
+        for name, handler in stats['handlers'].items():
+            lines.append(f"{handler['calls']:>6} {handler['errors']:>6} {handler['mean_ms']:>8.2f} "
+                         f"{handler['max_ms']:>8.2f}  {name}")
+        return "\n".join(lines)
     
     def clear_subscribers(self, event_type: str = None) -> None:
         """購読者をクリア"""
         if event_type:
             self._subscribers.pop(event_type, None)
         else:
-            self._subscribers.clear()
\ No newline at end of file
+            self._subscribers.clear()
@@ -0,0 +1,97 @@
+import time
+from typing import Any, Callable, Dict, Sequence
+
+class FrameGovernor:
+    """フレーム予算に応じて描画レートを上げ下げするガバナー
+
+    フレーム時間の指数移動平均がフレーム周期に対する予算を超えたら一段下げ、
+    十分に余裕がある状態が続いたら目標レートまで一段ずつ戻す。
+    """
+
+    RATE_STEPS: Sequence[int] = (60, 30, 20, 15, 10, 5, 2, 1)
+
+    def __init__(self, target_fps: int = 30, budget_fraction: float = 0.5,
+                 step_up_delay: float = 5.0, step_down_delay: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self._rates = sorted({rate for rate in self.RATE_STEPS if rate <= max(1, target_fps)} | {max(1, target_fps)},
+                             reverse=True)
+        self._target_fps = self._rates[0]
+        self._budget_fraction = budget_fraction  # フレーム周期のうち描画に使ってよい割合
+        self._step_up_delay = step_up_delay
+        self._step_down_delay = step_down_delay
+        self._clock = clock
+
+        self._index = 0
+        self._hidden = False
+        self._frame_time_ewma = 0.0
+        self._last_change = clock()
+        self._rate_changes = 0
+
+        self._window_start = clock()
+        self._window_frames = 0
+        self._achieved_fps = 0.0
+
+    def record_frame(self, frame_time_ms: float) -> None:
+        """1フレームの描画時間を記録し、必要ならレートを調整"""
+        now = self._clock()
+        self._update_achieved(now)
+
+        if self._frame_time_ewma == 0.0:
+            self._frame_time_ewma = frame_time_ms
+        else:
+            self._frame_time_ewma += 0.2 * (frame_time_ms - self._frame_time_ewma)
+
+        if self._hidden:
+            return
+
+        since_change = now - self._last_change
+        if self._frame_time_ewma > self._budget_ms(self._index):
+            if since_change >= self._step_down_delay and self._index < len(self._rates) - 1:
+                self._set_index(self._index + 1, now)
+        elif self._index > 0 and since_change >= self._step_up_delay:
+            # 一段上のレートでも予算の7割以内に収まるなら戻す
+            if self._frame_time_ewma < self._budget_ms(self._index - 1) * 0.7:
+                self._set_index(self._index - 1, now)
+
+    def _budget_ms(self, index: int) -> float:
+        """指定レートでの1フレームあたりの予算（ミリ秒）"""
+        return 1000.0 / self._rates[index] * self._budget_fraction
+
+    def _set_index(self, index: int, now: float) -> None:
+        """レートを変更"""
+        self._index = index
+        self._last_change = now
+        self._rate_changes += 1
+
+    def _update_achieved(self, now: float) -> None:
+        """実際に達成したフレームレートを1秒ごとに集計"""
+        self._window_frames += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._achieved_fps = self._window_frames / elapsed
+            self._window_start = now
+            self._window_frames = 0
+
+    def set_hidden(self, hidden: bool) -> None:
+        """ウィンドウが非表示の間は 1 Hz に落とす"""
+        self._hidden = hidden
+
+    def get_fps(self) -> int:
+        """現在許可しているフレームレート"""
+        return 1 if self._hidden else self._rates[self._index]
+
+    def get_interval_ms(self) -> float:
+        """現在のフレーム間隔（ミリ秒）"""
+        return 1000.0 / self.get_fps()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ガバナーの統計を取得"""
+        return {
+            'target_fps': self._target_fps,
+            'current_fps': self.get_fps(),
+            'achieved_fps': self._achieved_fps,
+            'frame_time_ewma_ms': self._frame_time_ewma,
+            'budget_ms': self._budget_ms(self._index),
+            'rate_changes': self._rate_changes,
+            'hidden': self._hidden
+        }
@@ -0,0 +1,245 @@
+import mmap
+import os
+import struct
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# ファイル先頭のヘッダー: マジック, 版, ヘッダー長, レコード長, 容量, 書き込み済みレコード数
+FRAME_LOG_MAGIC = b'CLKFRAME'
+FRAME_LOG_VERSION = 1
+_HEADER = struct.Struct('<8sIIIIQ')
+_HEADER_SIZE = 64
+_COUNT_OFFSET = 24  # ヘッダー内の書き込み済みレコード数の位置
+
+# 1フレーム分のレコード: UNIX 時刻, 合計/遅延/各段階の時間（マイクロ秒）, フラグ, ティック間隔（ミリ秒）
+_RECORD = struct.Struct('<d6IHH')
+
+# 計測する段階（FrameRecord の *_us フィールドの順）
+STAGE_TIME = 0     # 時刻の取得
+STAGE_FORMAT = 1   # デジタル表示の整形と更新
+STAGE_HANDS = 2    # 針の描画（保持モードのため clear_hands は含まれない）
+STAGE_FLUSH = 3    # Tk のアイドル処理（update_idletasks）
+STAGE_NAMES = ('time', 'format', 'hands', 'flush')
+
+# フラグ
+FLAG_DIGITAL_UPDATED = 1  # デジタル表示を書き換えた
+FLAG_ANIMATED = 2         # 滑らかな秒針モード
+FLAG_HIDDEN = 4           # ウィンドウが非表示
+
+DEFAULT_FRAME_LOG_CAPACITY = 262144  # 約8MB（30fps で約2.4時間、1fps で約3日分）
+
+class FrameRecord(NamedTuple):
+    """1フレーム分の計測結果"""
+    timestamp: float
+    total_us: int
+    lateness_us: int  # ティックの目標時刻からの遅れ
+    time_us: int
+    format_us: int
+    hands_us: int
+    flush_us: int
+    flags: int
+    interval_ms: int
+
+class FrameRingBuffer:
+    """固定長のバイナリレコードを mmap したファイルに循環して書き込むリングバッファ
+
+    ファイルサイズは容量で決まり、古いレコードから上書きされるためログは増え続けない。
+    書き込みはメモリへのコピーのみで、ファイルへの反映は OS に任せる。
+    """
+
+    def __init__(self, path: str, capacity: int = DEFAULT_FRAME_LOG_CAPACITY, readonly: bool = False):
+        self._path = path
+        self._readonly = readonly
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        if readonly:
+            self._open_for_reading()
+        else:
+            self._open_for_writing(max(1, capacity))
+
+    def _open_for_writing(self, capacity: int) -> None:
+        """ファイルを開く（形式や容量が違う場合は作り直す）"""
+        size = _HEADER_SIZE + capacity * _RECORD.size
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        header = self._read_header(self._path)
+        reuse = header is not None and header[4] == capacity and os.path.getsize(self._path) == size
+        self._file = open(self._path, 'r+b' if reuse else 'w+b')
+        if not reuse:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+        if reuse:
+            # 前回の続きから書き込む（再起動を跨いで直近の履歴を残す）
+            self._count = header[5]
+        else:
+            self._count = 0
+            _HEADER.pack_into(self._map, 0, FRAME_LOG_MAGIC, FRAME_LOG_VERSION, _HEADER_SIZE,
+                              _RECORD.size, capacity, 0)
+        self._capacity = capacity
+
+    def _open_for_reading(self) -> None:
+        """既存のファイルを読み取り専用で開く"""
+        header = self._read_header(self._path)
+        if header is None:
+            raise ValueError(f"Not a frame log file: {self._path}")
+        self._file = open(self._path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._capacity = header[4]
+        self._count = header[5]
+
+    @staticmethod
+    def _read_header(path: str) -> Optional[tuple]:
+        """ヘッダーを読み込む（対応する形式でなければ None）"""
+        try:
+            with open(path, 'rb') as f:
+                header = _HEADER.unpack(f.read(_HEADER.size))
+        except (OSError, struct.error):
+            return None
+        magic, version, header_size, record_size = header[:4]
+        if (magic != FRAME_LOG_MAGIC or version != FRAME_LOG_VERSION
+                or header_size != _HEADER_SIZE or record_size != _RECORD.size):
+            return None
+        return header
+
+    def append(self, timestamp: float, total_us: int, lateness_us: int, time_us: int, format_us: int,
+               hands_us: int, flush_us: int, flags: int, interval_ms: int) -> None:
+        """レコードを追加（容量を超えたら最も古いレコードを上書き）"""
+        offset = _HEADER_SIZE + (self._count % self._capacity) * _RECORD.size
+        _RECORD.pack_into(self._map, offset, timestamp, total_us, lateness_us, time_us, format_us,
+                          hands_us, flush_us, flags, interval_ms)
+        # レコードを書き終えてから件数を進める（途中で終了しても壊れたレコードを読まない）
+        self._count += 1
+        struct.pack_into('<Q', self._map, _COUNT_OFFSET, self._count)
+
+    def read_records(self, last: Optional[int] = None) -> List[FrameRecord]:
+        """保持しているレコードを古い順に取得（last を指定すると直近 last 件）"""
+        if not self._readonly:
+            count = self._count
+        else:
+            count = struct.unpack_from('<Q', self._map, _COUNT_OFFSET)[0]
+        available = min(count, self._capacity)
+        if last is not None:
+            available = min(available, max(0, last))
+        records = []
+        for sequence in range(count - available, count):
+            offset = _HEADER_SIZE + (sequence % self._capacity) * _RECORD.size
+            records.append(FrameRecord(*_RECORD.unpack_from(self._map, offset)))
+        return records
+
+    def get_capacity(self) -> int:
+        """保持できるレコード数"""
+        return self._capacity
+
+    def get_count(self) -> int:
+        """これまでに書き込んだレコード数（上書きされた分を含む）"""
+        return self._count
+
+    def get_path(self) -> str:
+        """ファイルのパス"""
+        return self._path
+
+    def flush(self) -> None:
+        """変更をファイルに書き出す"""
+        if self._map is not None and not self._readonly:
+            self._map.flush()
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        if self._map is not None:
+            self.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def _to_us(seconds: float) -> int:
+    """秒をマイクロ秒の符号なし32bit整数に変換"""
+    return min(0xFFFFFFFF, max(0, int(seconds * 1_000_000)))
+
+class FrameRecorder:
+    """1フレームの各段階の時間を計測し、リングバッファに記録するクラス - Single Responsibility Principle"""
+
+    def __init__(self, ring: FrameRingBuffer, clock=time.perf_counter):
+        self._ring = ring
+        self._clock = clock
+        self._start = 0.0
+        self._last = 0.0
+        self._stages = [0.0, 0.0, 0.0, 0.0]
+        self._flags = 0
+
+    def begin_frame(self) -> None:
+        """フレームの計測を開始"""
+        self._start = self._last = self._clock()
+        self._stages = [0.0, 0.0, 0.0, 0.0]
+        self._flags = 0
+
+    def mark(self, stage: int) -> None:
+        """直前の印からの経過時間を段階 stage の時間として記録"""
+        now = self._clock()
+        self._stages[stage] += now - self._last
+        self._last = now
+
+    def set_flag(self, flag: int) -> None:
+        """フレームのフラグを設定"""
+        self._flags |= flag
+
+    def end_frame(self, lateness_ms: float = 0.0, interval_ms: float = 0.0) -> None:
+        """フレームの計測を終了してレコードを書き込む"""
+        stages = self._stages
+        self._ring.append(
+            time.time(),
+            _to_us(self._clock() - self._start),
+            _to_us(lateness_ms / 1000.0),
+            _to_us(stages[STAGE_TIME]),
+            _to_us(stages[STAGE_FORMAT]),
+            _to_us(stages[STAGE_HANDS]),
+            _to_us(stages[STAGE_FLUSH]),
+            self._flags,
+            min(0xFFFF, max(0, int(interval_ms)))
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """記録先の情報を取得"""
+        return {
+            'enabled': True,
+            'path': self._ring.get_path(),
+            'capacity': self._ring.get_capacity(),
+            'records_written': self._ring.get_count()
+        }
+
+    def close(self) -> None:
+        """記録を終了"""
+        self._ring.close()
+
+class NullFrameRecorder:
+    """記録しないときの何もしないレコーダー - Null Object Pattern"""
+
+    def begin_frame(self) -> None:
+        pass
+
+    def mark(self, stage: int) -> None:
+        pass
+
+    def set_flag(self, flag: int) -> None:
+        pass
+
+    def end_frame(self, lateness_ms: float = 0.0, interval_ms: float = 0.0) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'enabled': False}
+
+    def close(self) -> None:
+        pass
+
+def create_frame_recorder(config: Any) -> Any:
+    """設定 "frame_log_enabled" に応じてレコーダーを生成（開けなければ記録しない）"""
+    if not config.get("frame_log_enabled", False):
+        return NullFrameRecorder()
+    try:
+        ring = FrameRingBuffer(config.get("frame_log_path", "frame_log.bin"),
+                               int(config.get("frame_log_capacity", DEFAULT_FRAME_LOG_CAPACITY)))
+    except (OSError, ValueError):
+        return NullFrameRecorder()
+    return FrameRecorder(ring)
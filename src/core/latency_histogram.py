@@ -0,0 +1,58 @@
+import bisect
+from typing import Dict, List, Optional, Sequence
+
+class LatencyHistogram:
+    """遅延時間（ミリ秒）のヒストグラム"""
+
+    DEFAULT_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+    def __init__(self, bounds_ms: Optional[Sequence[float]] = None):
+        self._bounds: List[float] = sorted(bounds_ms or self.DEFAULT_BOUNDS_MS)
+        self.reset()
+
+    def reset(self) -> None:
+        """記録をリセット"""
+        # 最後のバケットは上限超過分
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """値を記録（負の値は0として扱う）"""
+        value_ms = max(0.0, value_ms)
+        self._counts[bisect.bisect_left(self._bounds, value_ms)] += 1
+        self._count += 1
+        self._total += value_ms
+        if value_ms > self._max:
+            self._max = value_ms
+
+    def get_counts(self) -> Dict[str, int]:
+        """バケットごとの件数を取得"""
+        counts = {}
+        for bound, count in zip(self._bounds, self._counts):
+            counts[f"<={bound:g}ms"] = count
+        counts[f">{self._bounds[-1]:g}ms"] = self._counts[-1]
+        return counts
+
+    def percentile(self, fraction: float) -> float:
+        """パーセンタイル値をバケット上限で近似して取得"""
+        if self._count == 0:
+            return 0.0
+        threshold = fraction * self._count
+        cumulative = 0
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return min(bound, self._max)
+        return self._max
+
+    def get_stats(self) -> Dict[str, float]:
+        """集計値を取得"""
+        return {
+            'count': self._count,
+            'mean_ms': self._total / self._count if self._count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': self._max
+        }
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Callable
-from .clock_config import ClockConfig
+from .clock_config import ClockConfig, SIZE_PRESETS, MIN_CLOCK_SIZE, MAX_CLOCK_SIZE
 
 class SettingsWindow:
     """設定ウィンドウクラス - Single Responsibility Principle"""
@@ -20,7 +20,7 @@ class SettingsWindow:
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
         self._root.title("時計設定")
-        self._root.geometry("350x400")
+        self._root.geometry("350x430")
         self._root.resizable(False, False)
         
         # ウィンドウを中央に配置
@@ -36,8 +36,8 @@ class SettingsWindow:
         """ウィンドウを画面中央に配置"""
         self._root.update_idletasks()
         x = (self._root.winfo_screenwidth() // 2) - (350 // 2)
-        y = (self._root.winfo_screenheight() // 2) - (400 // 2)
-        self._root.geometry(f'350x400+{x}+{y}')
+        y = (self._root.winfo_screenheight() // 2) - (430 // 2)
+        self._root.geometry(f'350x430+{x}+{y}')
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
@@ -103,6 +103,26 @@ class SettingsWindow:
             command=self._on_digital_change
         )
         digital_check.pack(anchor=tk.W)
+        
+        # 滑らかな秒針（アニメーション）
+        self._animation_var = tk.BooleanVar(value=self._config.get("enable_animations", True))
+        animation_check = tk.Checkbutton(
+            display_frame,
+            text="秒針を滑らかに動かす",
+            variable=self._animation_var,
+            command=self._on_animation_change
+        )
+        animation_check.pack(anchor=tk.W)
+        
+        # 文字盤を1枚の画像として事前描画
+        self._prerender_var = tk.BooleanVar(value=self._config.get("prerender_dial", False))
+        prerender_check = tk.Checkbutton(
+            display_frame,
+            text="文字盤を画像として描画（テーマ・サイズ切替を高速化）",
+            variable=self._prerender_var,
+            command=self._on_prerender_change
+        )
+        prerender_check.pack(anchor=tk.W)
     
     def _create_size_settings(self, parent: tk.Widget) -> None:
         """サイズ設定を作成"""
@@ -115,12 +135,7 @@ class SettingsWindow:
         size_frame_inner = tk.Frame(size_frame)
         size_frame_inner.pack(fill=tk.X, pady=(5, 10))
         
-        sizes = [
-            ("小", 250),
-            ("中", 350),
-            ("大", 450),
-            ("特大", 550)
-        ]
+        sizes = SIZE_PRESETS
         
         current_size = self._config.get_clock_size()["width"]
         self._size_var = tk.IntVar(value=current_size)
@@ -190,6 +205,16 @@ class SettingsWindow:
         self._config.set("show_digital_clock", self._digital_var.get())
         self._on_settings_changed("show_digital_clock", self._digital_var.get())
     
+    def _on_animation_change(self) -> None:
+        """滑らかな秒針の切り替えイベント"""
+        self._config.set("enable_animations", self._animation_var.get())
+        self._on_settings_changed("enable_animations", self._animation_var.get())
+    
+    def _on_prerender_change(self) -> None:
+        """文字盤の事前描画の切り替えイベント"""
+        self._config.set("prerender_dial", self._prerender_var.get())
+        self._on_settings_changed("prerender_dial", self._prerender_var.get())
+    
     def _on_size_change(self) -> None:
         """サイズ変更イベント"""
         size = self._size_var.get()
@@ -200,21 +225,18 @@ class SettingsWindow:
         """カスタムサイズ適用イベント"""
         try:
             size = int(self._custom_size_var.get())
-            if 200 <= size <= 800:  # サイズ制限
+            if MIN_CLOCK_SIZE <= size <= MAX_CLOCK_SIZE:  # サイズ制限
                 self._size_var.set(size)
                 self._apply_size_change(size)
             else:
-                messagebox.showwarning("範囲エラー", "サイズは200から800の範囲で入力してください。")
+                messagebox.showwarning("範囲エラー", f"サイズは{MIN_CLOCK_SIZE}から{MAX_CLOCK_SIZE}の範囲で入力してください。")
         except ValueError:
             messagebox.showerror("入力エラー", "数値を入力してください。")
     
     def _apply_size_change(self, size: int) -> None:
         """サイズ変更を適用"""
         # 設定を更新
-        self._config.set("window_size", {"width": size + 50, "height": size + 100})
-        self._config.set("clock_size", {"width": size, "height": size})
-        self._config.set("center_position", {"x": size // 2, "y": size // 2})
-        self._config.set("radius", (size - 50) // 2)
+        self._config.set_clock_size(size)
         
         # イベントを発行
         self._on_settings_changed("size_changed", size)
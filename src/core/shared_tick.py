@@ -0,0 +1,211 @@
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+from .latency_histogram import LatencyHistogram
+from .tick_scheduler import TickScheduler
+
+class TickSubscription:
+    """共有ティックの購読（1つの時計ウィンドウ分）- TickScheduler と同じ操作で使える
+
+    購読ごとに間隔を持ち、共有のティックのうち自分の間隔の境界をまたいだものだけで
+    コールバックを呼ぶ。停止・一時停止した購読は共有のティックの間隔の計算から外れる。
+    """
+
+    def __init__(self, host: "SharedTickScheduler", callback: Callable[[], None], interval_ms: float = 1000,
+                 clock: Callable[[], float] = time.time):
+        self._host = host
+        self._callback = callback
+        self._interval_ms = interval_ms
+        self._clock = clock
+        self._running = False
+        self._last_fired: Optional[float] = None
+        self._lateness = LatencyHistogram()
+        self._last_lateness_ms = 0.0
+        self._ticks = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+        self._suspended_at: Optional[float] = None
+        self._suspensions = 0
+        self._suspended_seconds = 0.0
+        self._wakeups_avoided = 0
+
+    def start(self) -> None:
+        """即座に1回コールバックを呼び、以降は共有のティックで呼ぶ"""
+        if self._running:
+            return
+        self._running = True
+        self._fire(self._clock(), None)
+        self._host._update_interval()
+
+    def stop(self) -> None:
+        """購読を停止"""
+        self._running = False
+        self._suspended_at = None
+        self._host._update_interval()
+
+    def suspend(self) -> None:
+        """一時停止（他に動いている購読が無ければ共有のティックも止まる）"""
+        if not self._running:
+            return
+        self._running = False
+        self._suspended_at = self._clock()
+        self._suspensions += 1
+        self._host._update_interval()
+
+    def resume(self) -> None:
+        """停止中に省略したティック数を数え、即座に1回コールバックを呼んで再開"""
+        if self._suspended_at is None:
+            return
+        elapsed = max(0.0, self._clock() - self._suspended_at)
+        self._suspended_at = None
+        self._suspended_seconds += elapsed
+        self._wakeups_avoided += int(elapsed * 1000.0 / self._interval_ms)
+        self.start()
+
+    def is_running(self) -> bool:
+        """実行中かどうか"""
+        return self._running
+
+    def is_suspended(self) -> bool:
+        """一時停止中かどうか"""
+        return self._suspended_at is not None
+
+    def set_interval(self, interval_ms: float) -> None:
+        """この購読の間隔を変更（共有のティックの間隔も見直す）"""
+        if interval_ms == self._interval_ms:
+            return
+        self._interval_ms = interval_ms
+        self._host._update_interval()
+
+    def get_interval_ms(self) -> float:
+        """この購読の間隔（ミリ秒）"""
+        return self._interval_ms
+
+    def get_last_lateness_ms(self) -> float:
+        """直近のティックの遅延（自分の間隔の境界からの遅れ、ミリ秒）"""
+        return self._last_lateness_ms
+
+    def _slot(self, timestamp: float) -> int:
+        """時刻が自分の間隔の何番目の区間にあるか"""
+        return math.floor(timestamp * 1000.0 / self._interval_ms)
+
+    def _is_due(self, now: float) -> bool:
+        """前回のコールバックから自分の間隔の境界をまたいだかどうか"""
+        return self._running and (self._last_fired is None or self._slot(now) != self._slot(self._last_fired))
+
+    def _fire(self, now: float, lateness_ms: Optional[float]) -> None:
+        """コールバックを呼ぶ（例外は記録して他の購読の処理を続ける）"""
+        self._last_fired = now
+        if lateness_ms is not None:
+            self._last_lateness_ms = lateness_ms
+            self._lateness.record(lateness_ms)
+        self._ticks += 1
+        try:
+            self._callback()
+        except Exception as error:
+            self._errors += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+
+    def _on_tick(self, now: float) -> bool:
+        """共有のティックで呼ばれ、自分の境界をまたいでいればコールバックを呼ぶ（呼んだかどうかを返す）"""
+        if not self._is_due(now):
+            return False
+        boundary = self._slot(now) * self._interval_ms / 1000.0
+        self._fire(now, (now - boundary) * 1000.0)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """購読の統計を取得（TickScheduler.get_stats と同じキー + 共有のティックの統計）"""
+        suspended_seconds = self._suspended_seconds
+        wakeups_avoided = self._wakeups_avoided
+        if self._suspended_at is not None:
+            elapsed = max(0.0, self._clock() - self._suspended_at)
+            suspended_seconds += elapsed
+            wakeups_avoided += int(elapsed * 1000.0 / self._interval_ms)
+        return {
+            'ticks': self._ticks,
+            'errors': self._errors,
+            'last_error': self._last_error,
+            'suspended': self._suspended_at is not None,
+            'suspensions': self._suspensions,
+            'suspended_seconds': suspended_seconds,
+            'wakeups_avoided': wakeups_avoided,
+            'interval_ms': self._interval_ms,
+            'lateness': self._lateness.get_stats(),
+            'lateness_histogram': self._lateness.get_counts(),
+            'shared': self._host.get_stats()
+        }
+
+class SharedTickScheduler:
+    """複数の時計ウィンドウで1つのティックを共有するスケジューラー - Observer Pattern
+
+    1つの TickScheduler を動いている購読の最短の間隔で回し、1回の起床で全購読を処理する。
+    すべての購読が停止・一時停止している間は TickScheduler も一時停止して起床しない。
+    """
+
+    def __init__(self, root: Any, guard_ms: int = 2, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._subscriptions: List[TickSubscription] = []
+        self._scheduler = TickScheduler(root, self._dispatch, guard_ms=guard_ms, clock=clock)
+        self._dispatching = False
+        self._callbacks = 0
+
+    def subscribe(self, callback: Callable[[], None], interval_ms: float = 1000) -> TickSubscription:
+        """購読を追加（start() を呼ぶまでコールバックは呼ばれない）"""
+        subscription = TickSubscription(self, callback, interval_ms, self._clock)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TickSubscription) -> None:
+        """購読を削除"""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+            subscription.stop()
+
+    def get_subscriptions(self) -> List[TickSubscription]:
+        """購読の一覧を取得"""
+        return list(self._subscriptions)
+
+    def stop(self) -> None:
+        """共有のティックを停止"""
+        self._scheduler.stop()
+
+    def _dispatch(self) -> None:
+        """共有のティック: 境界をまたいだ購読のコールバックを呼び、間隔を見直す"""
+        now = self._clock()
+        self._dispatching = True
+        try:
+            for subscription in list(self._subscriptions):
+                if subscription._on_tick(now):
+                    self._callbacks += 1
+        finally:
+            self._dispatching = False
+        self._update_interval()
+
+    def _update_interval(self) -> None:
+        """動いている購読の最短の間隔でティックを回す（無ければ一時停止）"""
+        intervals = [subscription.get_interval_ms() for subscription in self._subscriptions
+                     if subscription.is_running()]
+        if not intervals:
+            if self._scheduler.is_running():
+                self._scheduler.suspend()
+            return
+        self._scheduler.set_interval(min(intervals))
+        if self._dispatching:
+            return  # 配信中の変更は配信の最後に反映する
+        if self._scheduler.is_suspended():
+            self._scheduler.resume()
+        elif not self._scheduler.is_running():
+            self._scheduler.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """共有のティックの統計（起床回数、購読ごとのコールバック回数の合計）を取得"""
+        stats = self._scheduler.get_stats()
+        stats.update({
+            'subscriptions': len(self._subscriptions),
+            'running_subscriptions': sum(1 for subscription in self._subscriptions if subscription.is_running()),
+            'callbacks': self._callbacks,
+            # 時計ごとのタイマーなら別々に起床していたコールバックの数
+            'wakeups_shared': max(0, self._callbacks - stats['ticks'])
+        })
+        return stats
@@ -0,0 +1,179 @@
+import os
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+class ImportRecord(NamedTuple):
+    """1モジュールの import 時間"""
+    name: str
+    self_ms: float       # そのモジュール自身の実行時間
+    inclusive_ms: float  # 内部で import したモジュールを含む時間
+    depth: int
+
+class _TimingLoader:
+    """exec_module の時間を計測するローダーのプロキシ"""
+
+    def __init__(self, loader: Any, name: str, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        self._profiler._enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+class _ImportTimer(MetaPathFinder):
+    """sys.meta_path の先頭に置き、見つかったモジュールのローダーを計測用に包む"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimingLoader(spec.loader, fullname, self._profiler)
+            return spec
+        return None
+
+def _process_age_ms() -> Optional[float]:
+    """プロセス起動からの経過時間（Linux の /proc がある場合のみ）"""
+    try:
+        with open('/proc/self/stat', 'rb') as f:
+            # comm にスペースを含む場合があるため ')' 以降を分割
+            fields = f.read().rsplit(b')', 1)[1].split()
+        with open('/proc/uptime', 'rb') as f:
+            uptime = float(f.read().split()[0])
+        start_ticks = int(fields[19])
+        return (uptime - start_ticks / os.sysconf('SC_CLK_TCK')) * 1000.0
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class StartupProfiler:
+    """起動時間の計測クラス - モジュールごとの import 時間と初回描画までの時間を記録"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._start = clock()
+        self._process_age_ms = _process_age_ms()  # 計測開始までにかかったインタプリタ起動時間
+        self._timer: Optional[_ImportTimer] = None
+        self._stack: List[List[float]] = []
+        self._records: List[ImportRecord] = []
+        self._marks: Dict[str, float] = {}
+
+    def install(self) -> None:
+        """import の計測を開始"""
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self) -> None:
+        """import の計測を終了"""
+        if self._timer is not None:
+            try:
+                sys.meta_path.remove(self._timer)
+            except ValueError:
+                pass
+            self._timer = None
+
+    def _enter(self) -> None:
+        # [開始時刻, 子モジュールの合計時間]
+        self._stack.append([self._clock(), 0.0])
+
+    def _exit(self, name: str) -> None:
+        start, children = self._stack.pop()
+        inclusive = (self._clock() - start) * 1000.0
+        if self._stack:
+            self._stack[-1][1] += inclusive
+        self._records.append(ImportRecord(name, inclusive - children, inclusive, len(self._stack)))
+
+    def mark(self, name: str) -> None:
+        """計測開始からの経過時間を名前付きで記録"""
+        self._marks.setdefault(name, (self._clock() - self._start) * 1000.0)
+
+    def get_report(self) -> Dict[str, Any]:
+        """計測結果を取得"""
+        return {
+            'process_age_at_start_ms': self._process_age_ms,
+            'import_total_ms': sum(record.inclusive_ms for record in self._records if record.depth == 0),
+            'modules': len(self._records),
+            'marks': dict(self._marks),
+            'imports': [record._asdict() for record in
+                        sorted(self._records, key=lambda record: record.inclusive_ms, reverse=True)]
+        }
+
+    def format_report(self, top: int = 25) -> str:
+        """計測結果を表形式の文字列に整形"""
+        report = self.get_report()
+        lines = ["=== 起動プロファイル ==="]
+        if report['process_age_at_start_ms'] is not None:
+            lines.append(f"インタプリタ起動〜計測開始: {report['process_age_at_start_ms']:8.1f} ms")
+        lines.append(f"import 合計 ({report['modules']} モジュール): {report['import_total_ms']:8.1f} ms")
+        for name, elapsed in report['marks'].items():
+            lines.append(f"{name:<24} {elapsed:8.1f} ms")
+        lines.append("")
+        lines.append(f"{'self ms':>8} {'total ms':>9}  module")
+        for record in report['imports'][:top]:
+            lines.append(f"{record['self_ms']:>8.2f} {record['inclusive_ms']:>9.2f}  "
+                         f"{'  ' * record['depth']}{record['name']}")
+        return "\n".join(lines)
+
+# main.py から --startup-profile で開始したプロファイラー（無効なら None）
+_active_profiler: Optional[StartupProfiler] = None
+_on_first_frame: Optional[Callable[[StartupProfiler], None]] = None
+
+def start_startup_profile(on_first_frame: Optional[Callable[[StartupProfiler], None]] = None) -> StartupProfiler:
+    """起動プロファイルを開始（初回描画時に on_first_frame を呼ぶ）"""
+    global _active_profiler, _on_first_frame
+    _active_profiler = StartupProfiler()
+    _active_profiler.install()
+    _on_first_frame = on_first_frame
+    return _active_profiler
+
+def is_startup_profiling() -> bool:
+    """起動プロファイルの計測中かどうか"""
+    return _active_profiler is not None
+
+def mark_startup(name: str) -> None:
+    """起動プロファイルに経過時間を記録（計測中でなければ何もしない）"""
+    if _active_profiler is not None:
+        _active_profiler.mark(name)
+
+def mark_first_frame() -> None:
+    """初回描画の完了を記録し、計測を終了"""
+    global _active_profiler, _on_first_frame
+    profiler, callback = _active_profiler, _on_first_frame
+    if profiler is None:
+        return
+    _active_profiler = None
+    _on_first_frame = None
+    profiler.mark('first_frame')
+    profiler.uninstall()
+    if callback is not None:
+        callback(profiler)
+
+def watch_first_frame(widget: Any) -> None:
+    """ウィジェットが初めて表示・描画された時点を初回描画として記録"""
+    mark_startup('run')
+
+    def on_expose(event: Any) -> None:
+        widget.unbind('<Expose>', bind_id)
+        mark_startup('exposed')
+        # 再描画はアイドル時に行われるため、その後に完了を記録
+        widget.after_idle(mark_first_frame)
+
+    bind_id = widget.bind('<Expose>', on_expose, add='+')
@@ -0,0 +1,166 @@
+import math
+import time
+from typing import Any, Callable, Dict, Optional
+from .latency_histogram import LatencyHistogram
+
+class TickScheduler:
+    """壁時計の秒境界に揃えてティックを発行するスケジューラー
+
+    after(1000) の連鎖と違い、毎回「次の境界までの残り時間」を現在時刻から
+    計算し直すため、描画時間やタイマーの遅れが累積しない。
+    """
+
+    def __init__(self, root: Any, callback: Callable[[], None], interval_ms: float = 1000,
+                 guard_ms: int = 2, clock: Callable[[], float] = time.time):
+        self._root = root
+        self._callback = callback
+        self._interval_ms = interval_ms
+        self._guard_ms = guard_ms  # 境界の直前に発火しないための余裕
+        self._clock = clock
+        self._after_id: Optional[str] = None
+        self._target: float = 0.0
+        self._running = False
+        self._lateness = LatencyHistogram()
+        self._last_lateness_ms = 0.0
+        self._ticks = 0
+        self._missed_ticks = 0
+        self._early_wakeups = 0
+        self._suspended_at: Optional[float] = None
+        self._suspensions = 0
+        self._suspended_seconds = 0.0
+        self._wakeups_avoided = 0
+
+    def start(self) -> None:
+        """即座に1回ティックを発行し、以降は境界に揃えて発行"""
+        if self._running:
+            return
+        self._running = True
+        self._ticks += 1
+        self._callback()
+        self._schedule_next()
+
+    def stop(self) -> None:
+        """ティックを停止"""
+        self._running = False
+        self._suspended_at = None
+        self._cancel_timer()
+
+    def suspend(self) -> None:
+        """待機中のタイマーも取り消してティックを止める（resume まで一度も起床しない）"""
+        if not self._running:
+            return
+        self._running = False
+        self._cancel_timer()
+        self._suspended_at = self._clock()
+        self._suspensions += 1
+
+    def resume(self) -> None:
+        """停止中に省略したティック数を数え、即座に1回ティックを発行して再開"""
+        if self._suspended_at is None:
+            return
+        elapsed = max(0.0, self._clock() - self._suspended_at)
+        self._suspended_at = None
+        self._suspended_seconds += elapsed
+        self._wakeups_avoided += int(elapsed * 1000.0 / self._interval_ms)
+        # 停止していた間の境界は取りこぼし（missed_ticks）に数えない
+        self._target = 0.0
+        self.start()
+
+    def is_suspended(self) -> bool:
+        """一時停止中かどうか"""
+        return self._suspended_at is not None
+
+    def _cancel_timer(self) -> None:
+        """待機中のタイマーを取り消す"""
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def set_interval(self, interval_ms: float) -> None:
+        """ティック間隔を変更（待機中なら新しい間隔の境界で待ち直す）"""
+        if interval_ms == self._interval_ms:
+            return
+        self._interval_ms = interval_ms
+        self._target = 0.0
+        if self._running and self._after_id is not None:
+            self._cancel_timer()
+            self._schedule_next()
+
+    def get_interval_ms(self) -> float:
+        """現在のティック間隔（ミリ秒）"""
+        return self._interval_ms
+
+    def is_running(self) -> bool:
+        """実行中かどうか"""
+        return self._running
+
+    def _schedule_next(self) -> None:
+        """次の境界に合わせてタイマーを設定"""
+        now = self._clock()
+        interval = self._interval_ms / 1000.0
+        target = (math.floor(now / interval) + 1) * interval
+        if self._target and target - self._target > interval * 1.5:
+            # 処理が長引いて境界を飛ばした
+            self._missed_ticks += int(round((target - self._target) / interval)) - 1
+        self._target = target
+        self._arm(target - now)
+
+    def _arm(self, remaining: float) -> None:
+        """残り時間（秒）後に発火するタイマーを設定"""
+        delay_ms = max(0, int(math.ceil(remaining * 1000))) + self._guard_ms
+        self._after_id = self._root.after(delay_ms, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """タイマー発火時の処理"""
+        self._after_id = None
+        if not self._running:
+            return
+
+        now = self._clock()
+        if now < self._target:
+            # 早すぎる発火: 同じ秒を二度表示しないよう残り時間だけ待ち直す
+            self._early_wakeups += 1
+            self._arm(self._target - now)
+            return
+
+        self._last_lateness_ms = (now - self._target) * 1000.0
+        self._lateness.record(self._last_lateness_ms)
+        self._ticks += 1
+        try:
+            self._callback()
+        finally:
+            # コールバック内で停止・再開された場合は再開時に予約済み
+            if self._running and self._after_id is None:
+                self._schedule_next()
+
+    def get_last_lateness_ms(self) -> float:
+        """直近のティックの遅延（ミリ秒）"""
+        return self._last_lateness_ms
+
+    def get_lateness_histogram(self) -> LatencyHistogram:
+        """ティック遅延（目標時刻と実際の発火時刻の差）のヒストグラムを取得"""
+        return self._lateness
+
+    def get_stats(self) -> Dict[str, Any]:
+        """スケジューラー統計を取得（一時停止中の分も含めて省略したティック数を数える）"""
+        suspended_seconds = self._suspended_seconds
+        wakeups_avoided = self._wakeups_avoided
+        if self._suspended_at is not None:
+            elapsed = max(0.0, self._clock() - self._suspended_at)
+            suspended_seconds += elapsed
+            wakeups_avoided += int(elapsed * 1000.0 / self._interval_ms)
+        return {
+            'ticks': self._ticks,
+            'missed_ticks': self._missed_ticks,
+            'early_wakeups': self._early_wakeups,
+            'suspended': self._suspended_at is not None,
+            'suspensions': self._suspensions,
+            'suspended_seconds': suspended_seconds,
+            'wakeups_avoided': wakeups_avoided,
+            'interval_ms': self._interval_ms,
+            'lateness': self._lateness.get_stats(),
+            'lateness_histogram': self._lateness.get_counts()
+        }
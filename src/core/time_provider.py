@@ -1,29 +1,79 @@
+import logging
+import sys
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from ..interfaces.time_provider_interface import ITimeProvider
+from .zone_offsets import ZoneOffsetCache, get_zone_offset_cache
+
+logger = logging.getLogger(__name__)
+
+def resolve_timezone(timezone_name: str) -> Optional[ZoneInfo]:
+    """IANA タイムゾーン名を解決（"local" は None = ローカル時刻、解決できない名前は ValueError）"""
+    if timezone_name == "local":
+        return None
+    try:
+        return ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
+        # Windows にはシステムの tz データベースが無いため tzdata パッケージが必要
+        hint = " (install the tzdata package)" if sys.platform == "win32" else ""
+        raise ValueError(f"Unknown timezone: {timezone_name}{hint}") from None
 
 class TimeProvider(ITimeProvider):
-    """時間提供クラス - Single Responsibility Principle"""
+    """時間提供クラス - Single Responsibility Principle
+    
+    IANA タイムゾーン名（"Asia/Tokyo" など）を指定すると、UTC オフセットと次の切り替え時刻を
+    キャッシュして現地時刻を求める。"local" はシステムのローカル時刻。
+    """
     
     def __init__(self, default_timezone: Optional[str] = None):
         self._timezone = default_timezone or "local"
+        self._offsets: Optional[ZoneOffsetCache] = self._resolve_offsets(self._timezone)
+    
+    @classmethod
+    def _resolve_offsets(cls, timezone_name: str) -> Optional[ZoneOffsetCache]:
+        """タイムゾーンのオフセットキャッシュを取得（ローカル時刻なら None）"""
+        zone = cls._resolve_zone(timezone_name)
+        return get_zone_offset_cache(zone) if zone is not None else None
+    
+    @staticmethod
+    def _resolve_zone(timezone_name: str) -> Optional[ZoneInfo]:
+        """IANA タイムゾーン名を解決（"local" は None、解決できない名前は警告してローカル時刻）"""
+        try:
+            return resolve_timezone(timezone_name)
+        except ValueError as error:
+            logger.warning("%s; falling back to local time", error)
+            return None
     
     def get_current_time(self) -> datetime:
         """現在時刻を取得"""
-        if self._timezone == "local":
-            return datetime.now()
-        else:
-            # Future: timezone support
+        if self._offsets is None:
             return datetime.now()
+        return self._offsets.to_local(time.time())
+    
+    def get_time_at(self, timestamp: float) -> datetime:
+        """UNIX 時刻をこのタイムゾーンの時刻に変換（複数の時計で同じ時刻を共有する場合に使用）"""
+        if self._offsets is None:
+            return datetime.fromtimestamp(timestamp)
+        # 次の切り替え時刻まではオフセットの加算だけで求まる
+        return self._offsets.to_local(timestamp)
     
     def set_timezone(self, timezone_name: str) -> None:
         """タイムゾーンを設定"""
         self._timezone = timezone_name
+        self._offsets = self._resolve_offsets(timezone_name)
     
     def get_timezone(self) -> str:
         """現在のタイムゾーンを取得"""
         return self._timezone
     
+    def get_offset_stats(self) -> Dict[str, Any]:
+        """オフセットキャッシュの統計（tz データベース参照回数など）を取得"""
+        if self._offsets is None:
+            return {}
+        return self._offsets.get_stats()
+    
     def format_time(self, time: datetime, format_string: str) -> str:
         """時刻をフォーマット"""
         return time.strftime(format_string)
\ No newline at end of file
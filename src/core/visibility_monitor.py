@@ -0,0 +1,79 @@
+from typing import Any, Callable, Dict
+
+# Visibility イベントの state のうち、ウィンドウが画面に全く見えていないもの
+FULLY_OBSCURED = 'VisibilityFullyObscured'
+
+class VisibilityMonitor:
+    """ウィンドウが画面に見えているかを Map/Unmap/Visibility イベントで追跡するクラス - Observer Pattern
+
+    最小化・withdraw（Unmap）や他のウィンドウに完全に隠れた状態（VisibilityFullyObscured）を
+    非表示とし、表示状態が変わったときだけ callback(visible) を呼ぶ。ポーリングは行わない。
+    """
+
+    def __init__(self, root: Any, callback: Callable[[bool], None]):
+        self._root = root
+        self._callback = callback
+        # 子ウィジェットのイベントを受けず、他の <Map> のバインドの解除にも影響されないよう
+        # ルートだけに専用のバインドタグを付ける
+        self._bind_tag = f"visibility-monitor-{id(self)}"
+        self._mapped = bool(root.winfo_ismapped())
+        self._obscured = False
+        self._attached = False
+        self._changes = 0
+
+    def start(self) -> None:
+        """イベントの監視を開始"""
+        if self._attached:
+            return
+        self._root.bind_class(self._bind_tag, '<Map>', self._on_map)
+        self._root.bind_class(self._bind_tag, '<Unmap>', self._on_unmap)
+        self._root.bind_class(self._bind_tag, '<Visibility>', self._on_visibility)
+        self._root.bindtags(self._root.bindtags() + (self._bind_tag,))
+        self._attached = True
+
+    def stop(self) -> None:
+        """イベントの監視を終了"""
+        if not self._attached:
+            return
+        self._attached = False
+        try:
+            self._root.bindtags(tuple(tag for tag in self._root.bindtags() if tag != self._bind_tag))
+            for sequence in ('<Map>', '<Unmap>', '<Visibility>'):
+                self._root.unbind_class(self._bind_tag, sequence)
+        except Exception:
+            pass  # ウィンドウが既に破棄されている
+
+    def is_visible(self) -> bool:
+        """ウィンドウが画面に見えているかどうか"""
+        return self._mapped and not self._obscured
+
+    def _on_map(self, event: Any) -> None:
+        """表示（deiconify・最小化からの復元）"""
+        self._update(mapped=True, obscured=False)
+
+    def _on_unmap(self, event: Any) -> None:
+        """非表示（withdraw・最小化）"""
+        self._update(mapped=False, obscured=self._obscured)
+
+    def _on_visibility(self, event: Any) -> None:
+        """他のウィンドウとの重なりの変化"""
+        self._update(mapped=True, obscured=event.state == FULLY_OBSCURED)
+
+    def _update(self, mapped: bool, obscured: bool) -> None:
+        """状態を更新し、見えているかどうかが変わったときだけ通知"""
+        was_visible = self.is_visible()
+        self._mapped = mapped
+        self._obscured = obscured
+        visible = self.is_visible()
+        if visible != was_visible:
+            self._changes += 1
+            self._callback(visible)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """監視の状態を取得"""
+        return {
+            'visible': self.is_visible(),
+            'mapped': self._mapped,
+            'obscured': self._obscured,
+            'changes': self._changes
+        }
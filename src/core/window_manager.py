@@ -1,20 +1,26 @@
 import tkinter as tk
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable, Union
 from ..interfaces.window_manager_interface import IWindowManager
 from .clock_window import ClockWindow
-from .settings_window import SettingsWindow
 from .clock_config import ClockConfig
 from ..interfaces.theme_interface import ITheme
 
+if TYPE_CHECKING:
+    # 設定画面は開かれたときに読み込む（起動時の import を減らす）
+    from .settings_window import SettingsWindow
+
 class WindowManager(IWindowManager):
     """ウィンドウ管理クラス - Single Responsibility Principle"""
     
-    def __init__(self, config: ClockConfig):
+    def __init__(self, config: ClockConfig, master: Optional[tk.Tk] = None):
         self._config = config
+        # master を指定すると時計ウィンドウはその Tk インタープリター上の Toplevel になる（複数ウィンドウのホスト）
+        self._master = master
         self._clock_window: Optional[ClockWindow] = None
-        self._settings_window: Optional[SettingsWindow] = None
-        self._clock_root: Optional[tk.Tk] = None
+        self._settings_window: Optional["SettingsWindow"] = None
+        self._clock_root: Optional[Union[tk.Tk, tk.Toplevel]] = None
         self._settings_root: Optional[tk.Toplevel] = None
+        self._hud_var: Optional[tk.BooleanVar] = None
         
         # Callbacks
         self._on_theme_changed: Optional[Callable] = None
@@ -36,7 +42,9 @@ class WindowManager(IWindowManager):
     
     def _create_clock_window(self) -> None:
         """時計ウィンドウを作成"""
-        self._clock_root = tk.Tk()
+        self._clock_root = tk.Toplevel(self._master) if self._master else tk.Tk()
+        # 最初のフレームを描き終えるまで表示しない（空のウィンドウを見せない）
+        self._clock_root.withdraw()
         self._clock_window = ClockWindow(self._clock_root, self._config)
         
         # 右クリックメニューを設定
@@ -49,6 +57,11 @@ class WindowManager(IWindowManager):
         """右クリックメニューを設定"""
         context_menu = tk.Menu(self._clock_root, tearoff=0)
         context_menu.add_command(label="設定", command=self.show_settings_window)
+        
+        # 現地で動作の重さを確認するための性能表示（フレーム時間・遅延・更新レート・アイテム数・RSS）
+        self._hud_var = tk.BooleanVar(master=self._clock_root, value=self._config.get("show_performance_hud", False))
+        context_menu.add_checkbutton(label="パフォーマンス表示", variable=self._hud_var,
+                                     command=self._on_performance_hud_toggled)
         context_menu.add_separator()
         context_menu.add_command(label="終了", command=self._on_close_callback)
         
@@ -69,6 +82,11 @@ class WindowManager(IWindowManager):
             self._clock_root.deiconify()
             self._apply_window_settings()
     
+    def save_window_position(self) -> None:
+        """時計ウィンドウの位置を設定に保存"""
+        if self._clock_window and self._clock_root and self._clock_root.winfo_ismapped():
+            self._clock_window.remember_position()
+    
     def hide_clock_window(self) -> None:
         """時計ウィンドウを非表示"""
         if self._clock_root:
@@ -83,6 +101,13 @@ class WindowManager(IWindowManager):
             self._settings_root.deiconify()
             self._settings_root.lift()
     
+    def _on_performance_hud_toggled(self) -> None:
+        """性能表示の切り替え"""
+        visible = self._hud_var.get()
+        self._config.set("show_performance_hud", visible)
+        if self._on_settings_changed:
+            self._on_settings_changed("show_performance_hud", visible)
+    
     def hide_settings_window(self) -> None:
         """設定ウィンドウを非表示"""
         if self._settings_root:
@@ -92,6 +117,7 @@ class WindowManager(IWindowManager):
         """設定ウィンドウを作成"""
         if self._clock_root is None:
             return
+        from .settings_window import SettingsWindow
             
         self._settings_root = tk.Toplevel(self._clock_root)
         self._settings_window = SettingsWindow(
@@ -130,11 +156,11 @@ class WindowManager(IWindowManager):
         """時計ウィンドウを取得"""
         return self._clock_window
     
-    def get_settings_window(self) -> Optional[SettingsWindow]:
+    def get_settings_window(self) -> Optional["SettingsWindow"]:
         """設定ウィンドウを取得"""
         return self._settings_window
     
-    def get_clock_root(self) -> Optional[tk.Tk]:
+    def get_clock_root(self) -> Optional[Union[tk.Tk, tk.Toplevel]]:
         """時計ルートウィンドウを取得"""
         return self._clock_root
     
@@ -0,0 +1,138 @@
+import tkinter as tk
+from typing import List, Optional, Sequence
+from .clock_config import ClockConfig, DEFAULT_WORLD_CLOCKS
+from .tick_scheduler import TickScheduler
+from .time_provider import resolve_timezone
+from .visibility_monitor import VisibilityMonitor
+from .startup_profiler import is_startup_profiling, watch_first_frame
+from .world_clock_grid import WorldClockGrid
+from ..interfaces.theme_interface import ITheme
+from ..themes.theme_manager import ThemeManager
+
+class WorldClockApplication:
+    """世界時計（複数の時計を1つのウィンドウに並べるダッシュボード）アプリケーション"""
+
+    def __init__(self, timezones: Optional[Sequence[str]] = None):
+        self._timezones = list(timezones) if timezones else None
+        self._config: Optional[ClockConfig] = None
+        self._theme_manager: Optional[ThemeManager] = None
+        self._root: Optional[tk.Tk] = None
+        self._canvas: Optional[tk.Canvas] = None
+        self._grid: Optional[WorldClockGrid] = None
+        self._theme: Optional[ITheme] = None
+        self._scheduler: Optional[TickScheduler] = None
+        self._visibility_monitor: Optional[VisibilityMonitor] = None
+        self._is_running = False
+
+    def initialize(self) -> None:
+        """ウィンドウとグリッドを初期化"""
+        self._config = ClockConfig()
+        self._theme_manager = ThemeManager()
+        timezones: List[str] = self._timezones or list(self._config.get("world_clocks", DEFAULT_WORLD_CLOCKS))
+        # 解決できない地域をローカル時刻で表示しないよう、ウィンドウを作る前に確認する
+        for timezone_name in timezones:
+            resolve_timezone(timezone_name)
+        columns = int(self._config.get("world_clock_columns", 0)) or None
+        self._grid = WorldClockGrid(timezones, int(self._config.get("world_clock_cell_size", 160)), columns)
+
+        self._root = tk.Tk()
+        self._root.title(f"世界時計 ({len(timezones)})")
+        self._root.protocol("WM_DELETE_WINDOW", self.shutdown)
+
+        # 画面に収まらない場合はスクロールできるようにする
+        width, height = self._grid.get_canvas_size()
+        view_width = min(width, int(self._root.winfo_screenwidth() * 0.9))
+        view_height = min(height, int(self._root.winfo_screenheight() * 0.85))
+        self._canvas = tk.Canvas(self._root, width=view_width, height=view_height,
+                                 highlightthickness=0, scrollregion=(0, 0, width, height))
+        if height > view_height:
+            scrollbar = tk.Scrollbar(self._root, orient=tk.VERTICAL, command=self._canvas.yview)
+            self._canvas.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._grid.attach(self._canvas)
+
+        self._setup_context_menu()
+        self._apply_theme(self._config.get_current_theme())
+
+    def _setup_context_menu(self) -> None:
+        """右クリックメニュー（テーマ切り替え・終了）を設定"""
+        context_menu = tk.Menu(self._root, tearoff=0)
+        for theme_name in self._theme_manager.get_theme_names():
+            context_menu.add_command(label=theme_name,
+                                     command=lambda name=theme_name: self._apply_theme(name))
+        context_menu.add_separator()
+        context_menu.add_command(label="終了", command=self.shutdown)
+
+        def show_context_menu(event):
+            try:
+                context_menu.tk_popup(event.x_root, event.y_root)
+            finally:
+                context_menu.grab_release()
+
+        self._canvas.bind("<Button-3>", show_context_menu)
+
+    def _apply_theme(self, theme_name: str) -> None:
+        """テーマを適用してすべての時計を描き直す"""
+        theme = self._theme_manager.get_theme(theme_name)
+        if theme is None:
+            return
+        self._theme = theme
+        style = theme.get_style()
+        self._root.configure(bg=style.bg)
+        self._canvas.configure(bg=style.canvas_bg)
+        self._grid.render_all(theme)
+
+    def _update_clocks(self) -> None:
+        """すべての時計の針を更新（壁時計の読み取りは1ティックにつき1回）"""
+        if not self._is_running:
+            return
+        if self._theme:
+            self._grid.render_tick(self._theme)
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        """最小化・非表示の間はティックを止め、再表示で即座に全時計を更新"""
+        if not self._is_running or not self._scheduler:
+            return
+        if visible:
+            self._scheduler.resume()
+        else:
+            self._scheduler.suspend()
+
+    def get_tick_stats(self) -> dict:
+        """ティックスケジューラーの統計（非表示中に省略した起床回数など）を取得"""
+        return self._scheduler.get_stats() if self._scheduler else {}
+
+    def get_grid(self) -> Optional[WorldClockGrid]:
+        """時計グリッドを取得"""
+        return self._grid
+
+    def run(self) -> None:
+        """アプリケーションを実行"""
+        if not self._root:
+            raise RuntimeError("Application must be initialized before running")
+        self._is_running = True
+        self._scheduler = TickScheduler(self._root, self._update_clocks)
+        self._scheduler.start()
+        self._visibility_monitor = VisibilityMonitor(self._root, self._on_visibility_changed)
+        self._visibility_monitor.start()
+        if is_startup_profiling():
+            watch_first_frame(self._canvas)
+        try:
+            self._root.mainloop()
+        finally:
+            self._is_running = False
+
+    def shutdown(self) -> None:
+        """アプリケーションを終了"""
+        self._is_running = False
+        if self._scheduler:
+            self._scheduler.stop()
+        if self._visibility_monitor:
+            self._visibility_monitor.stop()
+        if self._config:
+            self._config.shutdown()
+        if self._root:
+            self._root.quit()
+            self._root.destroy()
+            self._root = None
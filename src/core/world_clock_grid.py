@@ -0,0 +1,122 @@
+import math
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .time_provider import TimeProvider
+from ..interfaces.theme_interface import ITheme
+from ..rendering.analog_clock_renderer import AnalogClockRenderer
+
+def zone_label(timezone_name: str) -> str:
+    """タイムゾーン名から表示用の地域名を作成（"America/New_York" → "New York"）"""
+    if timezone_name == "local":
+        return "ローカル"
+    return timezone_name.rsplit('/', 1)[-1].replace('_', ' ')
+
+def compute_grid_layout(count: int, cell_width: int, cell_height: int,
+                        columns: Optional[int] = None) -> List[Tuple[int, int]]:
+    """各セルの左上座標を行優先で計算（columns 未指定ならほぼ正方形に並べる）"""
+    if count <= 0:
+        return []
+    columns = columns or int(math.ceil(math.sqrt(count)))
+    return [((index % columns) * cell_width, (index // columns) * cell_height) for index in range(count)]
+
+class WorldClock(NamedTuple):
+    """グリッド内の1つの時計"""
+    timezone: str
+    renderer: AnalogClockRenderer
+    time_provider: TimeProvider
+    center_x: int
+    center_y: int
+
+class WorldClockGrid:
+    """複数の時計を1つのキャンバスに並べ、1回のティックでまとめて更新する - Single Responsibility Principle
+
+    ティックごとに壁時計を一度だけ読み、各時計の時刻はその値からタイムゾーン変換で求める。
+    """
+
+    LABEL_HEIGHT = 18
+    PADDING = 6
+
+    def __init__(self, timezones: Sequence[str], cell_size: int = 160, columns: Optional[int] = None,
+                 clock: Callable[[], float] = time.time):
+        self._timezones = list(timezones)
+        self._cell_size = cell_size
+        self._columns = columns or int(math.ceil(math.sqrt(max(1, len(self._timezones)))))
+        self._clock = clock
+        self._canvas: Any = None
+        self._clocks: List[WorldClock] = []
+        self._ticks = 0
+        self._last_tick_ms = 0.0
+
+    def get_canvas_size(self) -> Tuple[int, int]:
+        """グリッド全体の大きさ（幅, 高さ）を取得"""
+        rows = int(math.ceil(len(self._timezones) / self._columns)) if self._timezones else 0
+        return self._columns * self._cell_size, rows * (self._cell_size + self.LABEL_HEIGHT)
+
+    def get_radius(self) -> int:
+        """各時計の半径"""
+        return max(10, self._cell_size // 2 - self.PADDING)
+
+    def attach(self, canvas: Any) -> None:
+        """描画先のキャンバスを設定し、時計ごとのレンダラーを配置"""
+        self._canvas = canvas
+        cell_height = self._cell_size + self.LABEL_HEIGHT
+        radius = self.get_radius()
+        self._clocks = []
+        layout = compute_grid_layout(len(self._timezones), self._cell_size, cell_height, self._columns)
+        for index, (timezone_name, (left, top)) in enumerate(zip(self._timezones, layout)):
+            center_x = left + self._cell_size // 2
+            center_y = top + self._cell_size // 2
+            # 同じキャンバスを共有するため、時計ごとのタグでアイテムを区別する
+            renderer = AnalogClockRenderer(item_tag=f"clock{index}")
+            renderer.initialize_at(canvas, center_x, center_y, radius)
+            self._clocks.append(WorldClock(timezone_name, renderer, TimeProvider(timezone_name),
+                                           center_x, center_y))
+
+    def get_clocks(self) -> List[WorldClock]:
+        """配置済みの時計一覧を取得"""
+        return list(self._clocks)
+
+    def render_all(self, theme: ITheme) -> None:
+        """すべての時計の文字盤・地域名・針を描き直す"""
+        if self._canvas is None:
+            raise RuntimeError("Grid must be attached to a canvas before rendering")
+        # 時計ごとに削除するとタグ検索が N 回になるため一括で消去する
+        self._canvas.delete("all")
+        style = theme.get_style()
+        label_font = ('Arial', max(8, min(12, self._cell_size // 14)))
+        for world_clock in self._clocks:
+            world_clock.renderer.forget_items()
+            world_clock.renderer.render_clock_face(theme)
+            self._canvas.create_text(
+                world_clock.center_x,
+                world_clock.center_y + self._cell_size // 2 + self.LABEL_HEIGHT // 2 - 2,
+                text=zone_label(world_clock.timezone),
+                font=label_font,
+                fill=style.digital_fg,
+                tags='labels'
+            )
+        self.render_tick(theme)
+
+    def render_tick(self, theme: ITheme) -> None:
+        """壁時計を一度だけ読み、すべての時計の針を更新"""
+        start = time.perf_counter()
+        timestamp = self._clock()
+        for world_clock in self._clocks:
+            current_time = world_clock.time_provider.get_time_at(timestamp)
+            world_clock.renderer.render_hands(
+                current_time.hour % 12, current_time.minute, current_time.second, theme
+            )
+        self._ticks += 1
+        self._last_tick_ms = (time.perf_counter() - start) * 1000.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """グリッドの統計（時計数・ティック数・直近のティック時間）を取得"""
+        return {
+            'clocks': len(self._clocks),
+            'columns': self._columns,
+            'ticks': self._ticks,
+            'last_tick_ms': self._last_tick_ms,
+            'hands_skipped_total': sum(
+                world_clock.renderer.get_render_stats()['hands_skipped_total'] for world_clock in self._clocks
+            )
+        }
@@ -0,0 +1,99 @@
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
+
+# UTC オフセットを加算した秒数を naive な datetime に変換する基準
+_EPOCH = datetime(1970, 1, 1)
+
+class ZoneOffsetCache:
+    """タイムゾーンの現在の UTC オフセットと次の切り替え時刻をキャッシュするクラス
+
+    切り替え（夏時間の開始・終了など）までは UNIX 時刻にオフセットを足すだけで
+    現地時刻を求め、tz データベースの参照は切り替えを跨いだときだけ行う。
+    """
+
+    PROBE_STEP = 7 * 24 * 3600  # 切り替えを探す刻み（7日）
+    HORIZON = 400 * 24 * 3600   # これより先に切り替えがなければ期限で再確認
+
+    def __init__(self, zone: ZoneInfo):
+        self._zone = zone
+        self._offset = 0.0
+        self._valid_from = 0.0
+        self._valid_until = -1.0
+        self._lookups = 0
+        self._conversions = 0
+
+    def get_offset(self, timestamp: float) -> float:
+        """UNIX 時刻における UTC オフセット（秒）を取得"""
+        if not self._valid_from <= timestamp < self._valid_until:
+            self._refresh(timestamp)
+        return self._offset
+
+    def to_local(self, timestamp: float) -> datetime:
+        """UNIX 時刻を現地時刻（naive な datetime）に変換"""
+        self._conversions += 1
+        return _EPOCH + timedelta(seconds=timestamp + self.get_offset(timestamp))
+
+    def _offset_at(self, timestamp: float) -> float:
+        """tz データベースから UTC オフセット（秒）を取得"""
+        self._lookups += 1
+        return datetime.fromtimestamp(timestamp, self._zone).utcoffset().total_seconds()
+
+    def _refresh(self, timestamp: float) -> None:
+        """現在のオフセットと次の切り替え時刻を求め直す"""
+        offset = self._offset_at(timestamp)
+        # 切り替えは整数秒で起こるため整数秒で探索する
+        start = math.floor(timestamp)
+        low = start
+        high: Optional[int] = None
+        # 一定の刻みで先を調べ、オフセットが変わる区間を見つける
+        while low - start < self.HORIZON:
+            probe = min(low + self.PROBE_STEP, start + self.HORIZON)
+            if self._offset_at(probe) != offset:
+                high = probe
+                break
+            low = probe
+
+        if high is None:
+            valid_until = float(start + self.HORIZON)
+        else:
+            # 二分探索で切り替えの瞬間（新しいオフセットになる最初の秒）を特定
+            while high - low > 1:
+                middle = (low + high) // 2
+                if self._offset_at(middle) == offset:
+                    low = middle
+                else:
+                    high = middle
+            valid_until = float(high)
+
+        self._offset = offset
+        self._valid_from = timestamp
+        self._valid_until = valid_until
+
+    def get_next_transition(self) -> Optional[float]:
+        """キャッシュしている次の切り替え時刻（UNIX 時刻、未計算なら None）"""
+        return self._valid_until if self._valid_until > self._valid_from else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計（tz データベース参照回数・変換回数）を取得"""
+        return {
+            'offset_seconds': self._offset,
+            'next_transition': self.get_next_transition(),
+            'lookups': self._lookups,
+            'conversions': self._conversions
+        }
+
+# タイムゾーン名ごとに共有するキャッシュ（同じ地域の時計が複数あっても参照は1回）
+_caches: Dict[str, ZoneOffsetCache] = {}
+_caches_lock = threading.Lock()
+
+def get_zone_offset_cache(zone: ZoneInfo) -> ZoneOffsetCache:
+    """タイムゾーンの共有オフセットキャッシュを取得"""
+    with _caches_lock:
+        cache = _caches.get(zone.key)
+        if cache is None:
+            cache = ZoneOffsetCache(zone)
+            _caches[zone.key] = cache
+        return cache
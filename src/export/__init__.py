@@ -0,0 +1,33 @@
+# Frame export (PNG sequence / animated GIF, headless)
+# 各要素は初回アクセス時に読み込む（PEP 562）
+
+from importlib import import_module
+from typing import Any, Dict, List
+
+# 公開名 -> 定義モジュール
+_LAZY_EXPORTS: Dict[str, str] = {
+    'ExportSettings': '.frame_pipeline',
+    'ClockFrameRenderer': '.frame_pipeline',
+    'FramePipeline': '.frame_pipeline',
+    'export_frames': '.frame_pipeline',
+    'iter_frame_times': '.frame_pipeline',
+    'parse_time_of_day': '.frame_pipeline',
+    'encode_png': '.png_writer',
+    'encode_gif_frame': '.gif_writer',
+    'GifWriter': '.gif_writer'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    """公開名を初回アクセス時に読み込む"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
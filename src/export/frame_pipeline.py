@@ -0,0 +1,201 @@
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+from ..core.clock_config import ClockConfig
+from ..rendering.display_list_raster import copy_raster, create_background, rasterize_primitives
+from ..rendering.display_list_renderer import DisplayListRenderer
+from ..rendering.raster import Raster
+from ..themes.theme_manager import ThemeManager
+from .gif_writer import GifWriter, encode_gif_frame
+from .png_writer import encode_png
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+class ExportSettings(NamedTuple):
+    """書き出しの設定（ワーカープロセスへそのまま渡す）- 不変オブジェクト"""
+    theme_name: str
+    size: int              # 時計のサイズpx（アプリの設定 "clock_size" と同じ）
+    start: float           # 開始時刻（0時からの秒）
+    end: float             # 終了時刻（この時刻は含まない。開始より前なら翌日の時刻）
+    step: float            # フレームの時刻の刻み（秒）
+    image_format: str      # 'png' または 'gif'
+    delay_cs: int = 100    # GIF の1フレームの表示時間（1/100秒）
+
+def parse_time_of_day(text: str) -> float:
+    """"HH:MM[:SS[.fff]]" を0時からの秒に変換"""
+    parts = text.split(':')
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Invalid time of day: {text!r}")
+    hours, minutes = int(parts[0]), int(parts[1])
+    seconds = float(parts[2]) if len(parts) == 3 else 0.0
+    if not (0 <= hours < 24 and 0 <= minutes < 60 and 0 <= seconds < 60):
+        raise ValueError(f"Invalid time of day: {text!r}")
+    return hours * 3600 + minutes * 60 + seconds
+
+def iter_frame_times(start: float, end: float, step: float) -> Iterator[Tuple[int, float]]:
+    """(フレーム番号, 0時からの秒) を順に生成（区間の長さに関係なくメモリを使わない）"""
+    if step <= 0:
+        raise ValueError("step must be positive")
+    if end <= start:
+        end += SECONDS_PER_DAY
+    index = 0
+    while True:
+        # 刻みの加算を繰り返すと誤差が溜まるため、番号から計算する
+        seconds = start + index * step
+        if seconds >= end:
+            return
+        yield index, seconds % SECONDS_PER_DAY
+        index += 1
+
+def count_frames(settings: ExportSettings) -> int:
+    """書き出すフレーム数"""
+    end = settings.end if settings.end > settings.start else settings.end + SECONDS_PER_DAY
+    return max(0, int(-(-(end - settings.start) // settings.step)))
+
+class ClockFrameRenderer:
+    """時刻ごとのフレームをラスター化するクラス - Single Responsibility Principle
+
+    ライブの時計と同じ AnalogClockRenderer の描画ロジックでディスプレイリストを作り、
+    文字盤は一度だけラスター化して、フレームごとには複製に針だけを描き足す。
+    """
+
+    def __init__(self, settings: ExportSettings):
+        self._settings = settings
+        self._theme = ThemeManager().get_theme(settings.theme_name)
+        if self._theme is None:
+            raise ValueError(f"Unknown theme: {settings.theme_name}")
+        config = ClockConfig(persist=False)
+        config.set_clock_size(settings.size)
+        config.set("prerender_dial", False)
+        self._renderer = DisplayListRenderer()
+        self._renderer.initialize(None, config)
+        self._canvas = self._renderer.get_canvas()
+        self._hands_tag = self._renderer.get_hands_tag()
+        self._renderer.render_clock_face(self._theme)
+        self._face = create_background(self._canvas.winfo_width(), self._canvas.winfo_height(),
+                                       self._theme.get_style().canvas_bg)
+        rasterize_primitives(self._face, self._canvas.get_display_list())
+
+    def render(self, seconds_of_day: float) -> Raster:
+        """0時からの秒の時刻のフレームをラスター化"""
+        hours, remainder = divmod(seconds_of_day, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        # 滑らかな秒針と同じく秒の小数部まで反映
+        self._renderer.render_hands(int(hours) % 12, int(minutes), seconds, self._theme)
+        frame = copy_raster(self._face)
+        rasterize_primitives(frame, (primitive for primitive in self._canvas.get_display_list()
+                                     if self._hands_tag in primitive.tags))
+        return frame
+
+    def encode(self, seconds_of_day: float) -> bytes:
+        """フレームをラスター化して設定の形式に変換"""
+        frame = self.render(seconds_of_day)
+        if self._settings.image_format == 'gif':
+            return encode_gif_frame(frame, self._settings.delay_cs)
+        return encode_png(frame)
+
+# ワーカープロセスごとに一度だけ生成するレンダラー
+_worker_renderer: Optional[ClockFrameRenderer] = None
+
+def _init_worker(settings: ExportSettings) -> None:
+    """ワーカープロセスの初期化（文字盤のラスター化はここで一度だけ）"""
+    global _worker_renderer
+    _worker_renderer = ClockFrameRenderer(settings)
+
+def _encode_frame(job: Tuple[int, float]) -> Tuple[int, bytes]:
+    """ワーカーで1フレームを変換（戻り値は圧縮済みのバイト列のみ）"""
+    index, seconds_of_day = job
+    return index, _worker_renderer.encode(seconds_of_day)
+
+class FramePipeline:
+    """フレームの時刻→ラスター化→変換をプロセスプールで並列に流すパイプライン
+
+    投入済みで未回収のフレームを max_in_flight 個までに制限し、結果はフレーム順に返すため、
+    クリップの長さに関係なくメモリ使用量は一定になる。workers が 1 以下ならプロセス内で処理する。
+    """
+
+    def __init__(self, settings: ExportSettings, workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None):
+        self._settings = settings
+        self._workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self._max_in_flight = max(1, max_in_flight if max_in_flight is not None else self._workers * 2)
+        self._peak_in_flight = 0
+
+    def run(self, jobs: Optional[Iterable[Tuple[int, float]]] = None) -> Iterator[Tuple[int, bytes]]:
+        """変換済みのフレームを (フレーム番号, バイト列) でフレーム順に生成"""
+        if jobs is None:
+            jobs = iter_frame_times(self._settings.start, self._settings.end, self._settings.step)
+        if self._workers <= 1:
+            _init_worker(self._settings)
+            for job in jobs:
+                self._peak_in_flight = 1
+                yield _encode_frame(job)
+            return
+
+        import multiprocessing
+        pool = multiprocessing.Pool(self._workers, initializer=_init_worker, initargs=(self._settings,))
+        try:
+            pending: Deque[Any] = deque()
+            for job in jobs:
+                pending.append(pool.apply_async(_encode_frame, (job,)))
+                self._peak_in_flight = max(self._peak_in_flight, len(pending))
+                if len(pending) >= self._max_in_flight:
+                    # 最も古いフレームの完了を待ってから次を投入（背圧）
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+            pool.close()
+        except BaseException:
+            # 途中で止めた場合（消費側の中断を含む）は処理中のフレームを破棄
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def get_stats(self) -> Dict[str, int]:
+        """ワーカー数と同時に処理したフレーム数の上限/最大"""
+        return {
+            'workers': self._workers,
+            'max_in_flight': self._max_in_flight,
+            'peak_in_flight': self._peak_in_flight
+        }
+
+def export_frames(settings: ExportSettings, output: str, workers: Optional[int] = None,
+                  max_in_flight: Optional[int] = None,
+                  progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """時刻の区間をPNG連番（output はディレクトリ）またはアニメーション GIF（output はファイル）に書き出す"""
+    pipeline = FramePipeline(settings, workers, max_in_flight)
+    total = count_frames(settings)
+    started = time.perf_counter()
+    frames = 0
+    written = 0
+    if settings.image_format == 'gif':
+        with open(output, 'wb') as stream:
+            writer = GifWriter(stream, settings.size, settings.size)
+            for _, data in pipeline.run():
+                writer.write_frame(data)
+                frames += 1
+                written += len(data)
+                if progress:
+                    progress(frames, total)
+            writer.close()
+    else:
+        os.makedirs(output, exist_ok=True)
+        digits = max(6, len(str(total)))
+        for index, data in pipeline.run():
+            with open(os.path.join(output, f"frame_{index:0{digits}d}.png"), 'wb') as f:
+                f.write(data)
+            frames += 1
+            written += len(data)
+            if progress:
+                progress(frames, total)
+    elapsed = time.perf_counter() - started
+    stats = pipeline.get_stats()
+    stats.update({
+        'frames': frames,
+        'bytes_written': written,
+        'elapsed_s': elapsed,
+        'frames_per_second': frames / elapsed if elapsed > 0 else 0.0
+    })
+    return stats
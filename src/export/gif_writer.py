@@ -0,0 +1,136 @@
+import struct
+from collections import Counter
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from ..rendering.raster import Raster
+from .png_writer import raster_to_rgb
+
+RGBBytes = bytes  # 3バイトの色
+
+def quantize(rgb: bytes, max_colors: int = 256) -> Tuple[List[RGBBytes], bytes]:
+    """RGB の列をパレット（出現回数の多い色から最大 max_colors 色）とインデックスの列に変換
+
+    時計の画像は大半が少数の単色で、残りはアンチエイリアスの中間色のため、
+    パレットに入らない色は最も近いパレットの色に置き換える（色ごとに一度だけ探索）。
+    """
+    colors = [rgb[i:i + 3] for i in range(0, len(rgb), 3)]
+    palette = [color for color, _ in Counter(colors).most_common(max_colors)]
+    lookup: Dict[RGBBytes, int] = {color: index for index, color in enumerate(palette)}
+    indices = bytearray(len(colors))
+    for position, color in enumerate(colors):
+        index = lookup.get(color)
+        if index is None:
+            index = _nearest(palette, color)
+            lookup[color] = index
+        indices[position] = index
+    return palette, bytes(indices)
+
+def _nearest(palette: List[RGBBytes], color: RGBBytes) -> int:
+    """パレットのうち最も近い色のインデックス"""
+    r, g, b = color
+    best_index = 0
+    best_distance = None
+    for index, (pr, pg, pb) in enumerate(palette):
+        distance = (pr - r) ** 2 + (pg - g) ** 2 + (pb - b) ** 2
+        if best_distance is None or distance < best_distance:
+            best_index = index
+            best_distance = distance
+    return best_index
+
+def lzw_encode(indices: bytes, min_code_size: int) -> bytes:
+    """GIF の可変長 LZW でインデックスの列を圧縮（255 バイトごとのサブブロックに分割済み）"""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    output = bytearray()
+    bit_buffer = 0
+    bit_count = 0
+
+    def emit(code: int, size: int) -> None:
+        nonlocal bit_buffer, bit_count
+        bit_buffer |= code << bit_count
+        bit_count += size
+        while bit_count >= 8:
+            output.append(bit_buffer & 0xFF)
+            bit_buffer >>= 8
+            bit_count -= 8
+
+    code_size = min_code_size + 1
+    table: Dict[Tuple[int, int], int] = {}
+    next_code = end_code + 1
+    emit(clear_code, code_size)
+    prefix = -1
+    for value in indices:
+        if prefix < 0:
+            prefix = value
+            continue
+        code = table.get((prefix, value))
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix, code_size)
+        if next_code < 4096:
+            table[(prefix, value)] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            # 表が一杯になったら初期化して続ける
+            emit(clear_code, code_size)
+            table = {}
+            next_code = end_code + 1
+            code_size = min_code_size + 1
+        prefix = value
+    if prefix >= 0:
+        emit(prefix, code_size)
+        # 復号側は最後のコードを読んだ後にも表を1つ伸ばすため、終了コードの幅もそれに合わせる
+        if next_code == (1 << code_size) and code_size < 12:
+            code_size += 1
+    emit(end_code, code_size)
+    if bit_count:
+        output.append(bit_buffer & 0xFF)
+
+    blocks = bytearray()
+    for start in range(0, len(output), 255):
+        block = output[start:start + 255]
+        blocks.append(len(block))
+        blocks += block
+    blocks.append(0)
+    return bytes(blocks)
+
+def encode_gif_frame(raster: Raster, delay_cs: int) -> bytes:
+    """1フレーム分のブロック（表示時間・画像記述子・ローカルパレット・画像データ）を生成
+
+    フレームごとに独立して生成できるため、複数のプロセスで並列に変換できる。
+    """
+    palette, indices = quantize(bytes(raster_to_rgb(raster)))
+    # パレットの大きさは 2 の累乗（2〜256 色）
+    bits = max(1, (len(palette) - 1).bit_length())
+    table = b''.join(palette) + b'\x00\x00\x00' * ((1 << bits) - len(palette))
+    min_code_size = max(2, bits)
+    control = b'\x21\xf9\x04' + struct.pack('<BHBB', 0x04, max(0, delay_cs), 0, 0)  # 前のフレームを残す
+    descriptor = b'\x2c' + struct.pack('<HHHHB', 0, 0, raster.width, raster.height, 0x80 | (bits - 1))
+    return control + descriptor + table + bytes((min_code_size,)) + lzw_encode(indices, min_code_size)
+
+class GifWriter:
+    """アニメーション GIF をフレームごとにファイルへ書き込むクラス（フレームを保持しない）"""
+
+    def __init__(self, stream: BinaryIO, width: int, height: int, loop: Optional[int] = 0):
+        self._stream = stream
+        self._frames = 0
+        # 全体のパレットは持たず、各フレームのローカルパレットを使う
+        stream.write(b'GIF89a' + struct.pack('<HHBBB', width, height, 0x70, 0, 0))
+        if loop is not None:
+            # NETSCAPE2.0 拡張: 繰り返し回数（0 は無限）
+            stream.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+
+    def write_frame(self, frame: bytes) -> None:
+        """encode_gif_frame で生成したフレームを追加"""
+        self._stream.write(frame)
+        self._frames += 1
+
+    def close(self) -> None:
+        """終端を書き込む"""
+        self._stream.write(b'\x3b')
+
+    def get_frame_count(self) -> int:
+        """書き込んだフレーム数"""
+        return self._frames
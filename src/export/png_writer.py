@@ -0,0 +1,33 @@
+import struct
+import zlib
+from ..rendering.raster import Raster
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    """PNG のチャンク（長さ・種類・データ・CRC）を生成"""
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+def raster_to_rgb(raster: Raster) -> bytearray:
+    """RGBA のピクセルからアルファを除いた RGB の列を取得（背景で塗った不透明なラスター向け）"""
+    pixels = raster.pixels
+    rgb = bytearray(raster.width * raster.height * 3)
+    rgb[0::3] = pixels[0::4]
+    rgb[1::3] = pixels[1::4]
+    rgb[2::3] = pixels[2::4]
+    return rgb
+
+def encode_png(raster: Raster, compress_level: int = 6) -> bytes:
+    """不透明なラスターを 8bit RGB の PNG に変換（標準ライブラリの zlib のみ使用）"""
+    width, height = raster.width, raster.height
+    rgb = raster_to_rgb(raster)
+    stride = width * 3
+    # 各行の先頭にフィルター種別 0（なし）を付ける
+    scanlines = b''.join(b'\x00' + rgb[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return b''.join((
+        _PNG_SIGNATURE,
+        _chunk(b'IHDR', header),
+        _chunk(b'IDAT', zlib.compress(scanlines, compress_level)),
+        _chunk(b'IEND', b'')
+    ))
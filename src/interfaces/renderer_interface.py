@@ -15,8 +15,8 @@ class IRenderer(ABC):
         pass
     
     @abstractmethod
-    def render_hands(self, hours: int, minutes: int, seconds: int, theme: Any) -> None:
-        """時計の針を描画"""
+    def render_hands(self, hours: int, minutes: int, seconds: float, theme: Any) -> None:
+        """時計の針を描画（前回描画した針は置き換える）"""
         pass
     
     @abstractmethod
@@ -27,4 +27,23 @@ class IRenderer(ABC):
     @abstractmethod
     def clear_all(self) -> None:
         """すべてをクリア"""
-        pass
\ No newline at end of file
+        pass
+    
+    def resize(self, canvas: Any, config: Any, theme: Any) -> bool:
+        """サイズ変更に追従（既存アイテムを変形できた場合は True）
+        
+        既定の実装は再初期化して文字盤を描き直す。
+        """
+        self.initialize(canvas, config)
+        self.clear_all()
+        self.render_clock_face(theme)
+        return False
+    
+    def restyle_clock_face(self, theme: Any) -> bool:
+        """テーマ変更を文字盤に反映（既存アイテムの属性変更で済んだ場合は True）
+        
+        既定の実装はすべてを消去して描き直す。
+        """
+        self.clear_all()
+        self.render_clock_face(theme)
+        return False
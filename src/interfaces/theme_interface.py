@@ -24,6 +24,11 @@ class ITheme(ABC):
         """針の設定を取得"""
         pass
     
+    @abstractmethod
+    def get_style(self) -> Any:
+        """コンパイル済みのスタイル（不変オブジェクト）を取得"""
+        pass
+    
     @abstractmethod
     def apply_special_effects(self, canvas, draw_func, *args, **kwargs) -> Any:
         """特殊効果を適用（ネオンテーマの発光効果など）"""
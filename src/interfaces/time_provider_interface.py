@@ -10,6 +10,11 @@ class ITimeProvider(ABC):
         """現在時刻を取得"""
         pass
     
+    @abstractmethod
+    def get_time_at(self, timestamp: float) -> datetime:
+        """UNIX 時刻をこのタイムゾーンの時刻に変換"""
+        pass
+    
     @abstractmethod
     def set_timezone(self, timezone: str) -> None:
         """タイムゾーンを設定"""
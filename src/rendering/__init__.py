@@ -1,5 +1,55 @@
 # Rendering system components
+# 各要素は初回アクセス時に読み込む（PEP 562）。使わないバックエンドを起動時に読み込まないため
 
-from .analog_clock_renderer import AnalogClockRenderer
+from importlib import import_module
+from typing import Any, Dict, List
 
-__all__ = ['AnalogClockRenderer']
\ No newline at end of file
+# 公開名 -> 定義モジュール
+_LAZY_EXPORTS: Dict[str, str] = {
+    'AnalogClockRenderer': '.analog_clock_renderer',
+    'RenderStats': '.render_stats',
+    'LRUCache': '.lru_cache',
+    'DialGeometry': '.dial_geometry',
+    'get_dial_geometry': '.dial_geometry',
+    'get_geometry_cache_stats': '.dial_geometry',
+    'HandEndpoints': '.hand_geometry',
+    'compute_hand_endpoints': '.hand_geometry',
+    'DisplayListCanvas': '.display_list',
+    'OvalPrimitive': '.display_list',
+    'LinePrimitive': '.display_list',
+    'TextPrimitive': '.display_list',
+    'ImagePrimitive': '.display_list',
+    'DisplayListRenderer': '.display_list_renderer',
+    'rasterize_primitives': '.display_list_raster',
+    'Raster': '.raster',
+    'GlowSprite': '.glow_sprites',
+    'GlowSpriteCache': '.glow_sprites',
+    'GlowSpriteWarmer': '.glow_sprites',
+    'get_glow_sprite_cache': '.glow_sprites',
+    'DialImage': '.dial_raster',
+    'DialImageCache': '.dial_raster',
+    'get_dial_image_cache': '.dial_raster',
+    'rasterize_dial': '.dial_raster',
+    'PerformanceHud': '.performance_hud',
+    'FrameSampler': '.performance_hud',
+    'get_process_rss': '.performance_hud',
+    'ResolvedStyle': '.resolved_style',
+    'resolve_style': '.resolved_style',
+    'create_renderer': '.renderer_factory',
+    'get_renderer_types': '.renderer_factory'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    """公開名を初回アクセス時に読み込む"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,189 +1,721 @@
-import tkinter as tk
 import math
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from ..interfaces.renderer_interface import IRenderer
 from ..interfaces.theme_interface import ITheme
-from ..core.clock_config import ClockConfig
+
+if TYPE_CHECKING:
+    # 型ヒント専用（ヘッドレス環境では tkinter を読み込まない）
+    import tkinter as tk
+    from ..core.clock_config import ClockConfig
+from .render_stats import RenderStats
+from .dial_geometry import DialGeometry, get_dial_geometry
+from .hand_geometry import hand_angles, hand_end_point
+from .resolved_style import ResolvedStyle, resolve_style
+from .glow_sprites import (GLOW_LOOKAHEAD_BUCKETS, GlowSprite, GlowSpriteWarmer, angle_bucket_size,
+                           get_glow_sprite_cache, glow_cycle_nbytes, glow_segment_nbytes, glow_sprite_steps,
+                           rasterize_glow_ring, rasterize_glow_segment, rasterize_glow_segment_steps)
+from .dial_raster import get_dial_image_cache, rasterize_dial
+from .raster import Raster, raster_to_photo_image, raster_to_photo_image_steps
+from ..themes.theme_style import ThemeStyle
+
+# 変形した文字盤と正確なレイアウトとのずれがこれを超えたら作り直す（ピクセル）
+SCALE_TOLERANCE_PX = 1.0
+
+# 文字盤アイテムの役割（生成順 = 重なり順）
+FACE_ROLES = ('outline', 'glow', 'glow_ring', 'numeral', 'hour_mark', 'minute_mark')
 
 class AnalogClockRenderer(IRenderer):
     """アナログ時計の描画クラス - Single Responsibility Principle"""
     
-    def __init__(self):
-        self._canvas: tk.Canvas = None
-        self._config: ClockConfig = None
+    def __init__(self, retained_hands: bool = True, glow_sprites: bool = True,
+                 item_tag: Optional[str] = None, prerender_dial: Optional[bool] = None):
+        self._canvas: "tk.Canvas" = None
+        self._config: "ClockConfig" = None
         self._center_x: int = 175
         self._center_y: int = 175
         self._radius: int = 150
+        self._geometry: Optional[DialGeometry] = None
+        self._geometry_key: Optional[Tuple] = None
+        
+        # 1つのキャンバスを複数のレンダラーで共有する場合はアイテムにタグを付けて区別する
+        self._item_tag = item_tag
+        self._hands_tag = f"{item_tag}-hands" if item_tag else 'hands'
+        
+        # 保持モード: 針のアイテムは一度だけ生成し、以降は座標のみ更新する
+        self._retained_hands = retained_hands
+        self._hand_items: Dict[str, List[int]] = {}
+        self._hands_key: Optional[Tuple] = None
+        self._hand_angles: Dict[str, float] = {}  # 最後に描画した針の角度
+        self._face_tag = f"{item_tag}-face" if item_tag else 'face'
+        self._face_items: Dict[str, List[int]] = {}  # 役割（外周・数字・目盛りなど）ごとの文字盤アイテム
+        self._face_geometry: Optional[DialGeometry] = None  # 文字盤アイテムを生成したときのレイアウト
+        self._face_style: Optional[ThemeStyle] = None
+        self._face_attributes: Dict[str, Any] = {}  # 変形後に調整した線幅・フォント
+        self._stats = RenderStats()
+        
+        # 発光効果: 重ね描きの代わりにキャッシュしたスプライト画像を使う
+        self._glow_sprites = glow_sprites
+        self._sprite_cache = get_glow_sprite_cache()
+        self._sprite_keys: Dict[str, Tuple] = {}
+        self._displayed_sprites: Dict[str, Any] = {}  # 表示中の画像を破棄させない参照
+        # 足りないスプライトはティックの合間に生成し、直前の角速度から次のスプライトを先読みする
+        self._sprite_warmer = GlowSpriteWarmer(self._sprite_cache)
+        self._glow_angles: Dict[str, float] = {}  # 発光スプライトを最後に合わせた角度
+        self._wanted_sprites: Dict[str, Tuple] = {}  # 生成を待っているスプライトのキー
+        
+        # 事前描画の文字盤: 静的な文字盤全体を1枚の画像アイテムにする（None なら設定 "prerender_dial" に従う）
+        self._prerender_dial = prerender_dial
+        self._dial_cache = get_dial_image_cache()
     
-    def initialize(self, canvas: tk.Canvas, config: ClockConfig) -> None:
+    def initialize(self, canvas: "tk.Canvas", config: "ClockConfig") -> None:
         """レンダラーを初期化"""
-        self._canvas = canvas
-        self._config = config
-        
         # 設定からパラメータを取得
         center_pos = config.get_center_position()
-        self._center_x = center_pos['x']
-        self._center_y = center_pos['y']
-        self._radius = config.get_radius()
+        self._config = config
+        self.initialize_at(canvas, center_pos['x'], center_pos['y'], config.get_radius())
+    
+    def initialize_at(self, canvas: "tk.Canvas", center_x: int, center_y: int, radius: int) -> None:
+        """キャンバス上の指定した位置・半径に描画するよう初期化"""
+        if canvas is not self._canvas:
+            # 別キャンバスのアイテムIDは無効
+            self._hand_items = {}
+            self._hand_angles = {}
+            self._forget_face_items()
+            self._sprite_keys = {}
+            self._displayed_sprites = {}
+            self._forget_glow_warming()
+            self._sprite_warmer.detach()
+            if hasattr(canvas, 'after'):
+                self._sprite_warmer.attach(canvas, self._on_glow_sprite_ready)
+        self._canvas = canvas
+        self.set_geometry(center_x, center_y, radius)
+    
+    def set_geometry(self, center_x: int, center_y: int, radius: int) -> None:
+        """描画する時計の中心と半径を設定"""
+        self._center_x = center_x
+        self._center_y = center_y
+        self._radius = radius
+        
+        # サイズが変わった可能性があるため次回描画時に針を作り直す
+        self._hands_key = None
+    
+    def get_hands_tag(self) -> str:
+        """針のアイテムに付けるタグ"""
+        return self._hands_tag
+    
+    def get_render_stats(self) -> Dict[str, int]:
+        """描画統計（アイテム生成/削除数）を取得"""
+        return self._stats.get_stats()
+    
+    def get_sprite_cache_stats(self) -> Dict[str, int]:
+        """発光スプライトキャッシュの統計（ヒット/ミス・バイト数）を取得"""
+        return self._sprite_cache.get_stats()
+    
+    def get_sprite_warmer_stats(self) -> Dict[str, Any]:
+        """ティックの合間に行う発光スプライトの生成の統計を取得"""
+        return self._sprite_warmer.get_stats()
+    
+    def warm_glow_sprites(self, budget_ms: Optional[float] = None) -> bool:
+        """依頼済みの発光スプライトを生成（タイマーの無い描画先用、残りがあるかどうかを返す）"""
+        return self._sprite_warmer.run(budget_ms)
+    
+    def get_dial_cache_stats(self) -> Dict[str, Any]:
+        """事前描画した文字盤キャッシュの統計（ヒット/ミス・バイト数・再構築時間）を取得"""
+        return self._dial_cache.get_stats()
+    
+    def _create_item(self, factory: Callable, *args, **kwargs) -> int:
+        """キャンバスアイテムを生成し統計に記録"""
+        item = factory(*args, **kwargs)
+        self._stats.record_created()
+        return item
     
     def render_clock_face(self, theme: ITheme) -> None:
         """時計の文字盤を描画"""
-        colors = theme.get_colors()
-        font_settings = theme.get_font_settings()
+        style = theme.get_style()
+        if self._use_prerendered_dial():
+            # 文字盤全体を (スタイル, 半径) ごとにキャッシュした1枚の画像で描画
+            self._draw_prerendered_dial(style)
+            return
+        
+        geometry = self._get_geometry(style)
+        resolved = resolve_style(style, self._radius)
+        
+        self._face_style = style
+        self._face_geometry = geometry
+        self._face_attributes = {
+            'outline_width': geometry.outline_width,
+            'numeral_font': resolved.numeral_font,
+            'hour_mark_width': geometry.hour_mark_width
+        }
         
         # 外側の円（文字盤）
-        self._canvas.create_oval(
-            self._center_x - self._radius,
-            self._center_y - self._radius,
-            self._center_x + self._radius,
-            self._center_y + self._radius,
-            fill=colors['face'],
-            outline=colors['outline'],
-            width=max(1, self._radius // 50)  # サイズに応じて線の太さを調整
+        self._create_face_item(
+            'outline',
+            self._canvas.create_oval,
+            *geometry.outline_bbox,
+            fill=style.face,
+            outline=style.outline,
+            width=geometry.outline_width
         )
         
         # テーマ固有の特殊効果を適用（文字盤用）
-        self._apply_face_special_effects(theme)
+        self._apply_face_special_effects(style, geometry)
         
         # 時間の数字を描画
-        self._draw_hour_numbers(theme)
+        self._draw_hour_numbers(resolved, geometry)
         
         # 時間の目盛りを描画
-        self._draw_hour_marks(theme)
+        self._draw_hour_marks(style, geometry)
+        
+        # 分の目盛りを描画（分の目盛りを持つテーマのみ）
+        if style.has_minute_marks:
+            self._draw_minute_marks(style, geometry)
+    
+    def resize(self, canvas: "tk.Canvas", config: "ClockConfig", theme: ITheme) -> bool:
+        """サイズ変更に追従（既存の文字盤アイテムを変形できれば True、作り直した場合は False）
+        
+        文字盤は canvas.scale/move で座標を変形し、変わった線幅・フォントだけを itemconfigure する。
+        丸めによる配置のずれが許容値を超える場合や、画像の文字盤など変形できない場合は作り直す。
+        """
+        built = self._face_geometry
+        old_x, old_y, old_radius = self._center_x, self._center_y, self._radius
+        self._config = config
+        center_pos = config.get_center_position()
+        self.initialize_at(canvas, center_pos['x'], center_pos['y'], config.get_radius())
+        style = theme.get_style()
+        
+        if built is None or style != self._face_style or not self._can_scale_face(built, style):
+            self.clear_all()
+            self.render_clock_face(theme)
+            self._stats.record_face_rebuilt()
+            return False
+        
+        # 針は次の描画で新しいサイズのアイテムに作り直す
+        self._delete_hand_items()
+        if (self._center_x, self._center_y, self._radius) != (old_x, old_y, old_radius):
+            factor = self._radius / old_radius
+            self._canvas.scale(self._face_tag, old_x, old_y, factor, factor)
+            self._canvas.move(self._face_tag, self._center_x - old_x, self._center_y - old_y)
+            self._restyle_scaled_face(style, self._get_geometry(style))
+        self._stats.record_face_scaled()
+        return True
+    
+    def _can_scale_face(self, built: DialGeometry, style: ThemeStyle) -> bool:
+        """生成済みの文字盤を変形して新しいサイズに使えるかどうか"""
+        if not self._face_items or 'dial' in self._face_items:
+            return False
+        exact = self._get_geometry(style)
+        if len(exact.glow_bboxes) != len(built.glow_bboxes) and 'glow' in self._face_items:
+            return False
+        return _scaled_deviation(built, exact) <= SCALE_TOLERANCE_PX
+    
+    def _restyle_scaled_face(self, style: ThemeStyle, geometry: DialGeometry) -> None:
+        """変形した文字盤のうち、サイズで決まる線幅・フォント・発光リングだけを更新"""
+        attributes = self._face_attributes
+        numeral_font = resolve_style(style, self._radius).numeral_font
+        updates = (
+            ('outline', 'outline_width', geometry.outline_width, 'width'),
+            ('numeral', 'numeral_font', numeral_font, 'font'),
+            ('hour_mark', 'hour_mark_width', geometry.hour_mark_width, 'width')
+        )
+        for role, attribute, value, option in updates:
+            if attributes.get(attribute) != value:
+                if role in self._face_items:
+                    self._canvas.itemconfigure(self._role_tag(role), **{option: value})
+                attributes[attribute] = value
+        if 'glow_ring' in self._face_items:
+            # 発光リングは画像のため、新しい半径のスプライトに差し替える
+            item = self._face_items['glow_ring'][0]
+            sprite = self._get_glow_ring_sprite(style, geometry)
+            self._displayed_sprites['ring'] = sprite
+            self._canvas.itemconfigure(item, image=sprite.image)
+            self._canvas.coords(item, self._center_x + sprite.offset_x, self._center_y + sprite.offset_y)
+    
+    def restyle_clock_face(self, theme: ITheme) -> bool:
+        """テーマ変更を既存の文字盤アイテムの再スタイルで反映（作り直した場合は False）
+        
+        色・線幅・フォントは役割のタグごとの itemconfigure で変更し、分の目盛りや発光の有無など
+        構造が違う役割のアイテムだけを生成・削除する。針はテーマが変わるため次の描画で作り直される。
+        """
+        style = theme.get_style()
+        built = self._face_geometry
+        if built is None or not self._face_items or self._use_prerendered_dial():
+            self._rebuild_face(theme)
+            return False
+        if style == self._face_style:
+            return True
+        
+        geometry = self._get_geometry(style)
+        if (style.has_glow and not self._glow_sprites and 'glow' not in self._face_items
+                and len(built.glow_bboxes) != len(geometry.glow_bboxes)):
+            # 変形済みの文字盤に足すと発光の層の数が合わない
+            self._rebuild_face(theme)
+            return False
+        resolved = resolve_style(style, self._radius)
+        restyled, recreated = self._restyle_glow(style, geometry, built)
+        restyled += self._restyle_role('outline', fill=style.face, outline=style.outline,
+                                       width=geometry.outline_width)
+        restyled += self._restyle_role('numeral', fill=style.numbers, font=resolved.numeral_font)
+        restyled += self._restyle_role('hour_mark', fill=style.marks, width=geometry.hour_mark_width)
+        if style.has_minute_marks and 'minute_mark' not in self._face_items:
+            self._draw_minute_marks(style, built)
+            recreated += self._place_new_face_items('minute_mark', built)
+        elif not style.has_minute_marks:
+            self._delete_face_role('minute_mark')
+        else:
+            restyled += self._restyle_role('minute_mark', fill=style.marks)
         
-        # 分の目盛りを描画（ミニマルテーマ以外）
-        if theme.get_name() != "ミニマル":
-            self._draw_minute_marks(theme)
+        self._face_style = style
+        self._face_attributes = {
+            'outline_width': geometry.outline_width,
+            'numeral_font': resolved.numeral_font,
+            'hour_mark_width': geometry.hour_mark_width
+        }
+        self._stats.record_face_restyled(restyled, recreated)
+        return True
+    
+    def _rebuild_face(self, theme: ITheme) -> None:
+        """文字盤と針を削除して描き直す"""
+        self.clear_all()
+        self.render_clock_face(theme)
+        self._stats.record_face_restyled(0, self._count_face_items())
+    
+    def _restyle_role(self, role: str, **options: Any) -> int:
+        """役割のタグを付けたアイテムの属性を1回の itemconfigure で変更し、対象のアイテム数を返す"""
+        items = self._face_items.get(role)
+        if not items:
+            return 0
+        self._canvas.itemconfigure(self._role_tag(role), **options)
+        return len(items)
+    
+    def _restyle_glow(self, style: ThemeStyle, geometry: DialGeometry,
+                      built: DialGeometry) -> Tuple[int, int]:
+        """発光効果を新しいスタイルに合わせ、(再スタイルした数, 新たに生成した数) を返す"""
+        wanted = None
+        if style.has_glow:
+            wanted = 'glow_ring' if self._glow_sprites else 'glow'
+        for role in ('glow', 'glow_ring'):
+            if role != wanted:
+                self._delete_face_role(role)
+        if wanted is None:
+            return 0, 0
+        if wanted == 'glow_ring':
+            if 'glow_ring' not in self._face_items:
+                # スプライトは現在の半径で生成し、中心に合わせて配置される
+                self._draw_glow_ring(style, geometry)
+                return 0, self._place_new_face_items('glow_ring', None)
+            # 外周の色が変わったスプライトに差し替える
+            sprite = self._get_glow_ring_sprite(style, geometry)
+            self._displayed_sprites['ring'] = sprite
+            return self._restyle_role('glow_ring', image=sprite.image), 0
+        if 'glow' not in self._face_items:
+            self._apply_face_special_effects(style, built)
+            return 0, self._place_new_face_items('glow', built)
+        return self._restyle_role('glow', outline=style.outline), 0
+    
+    def _place_new_face_items(self, role: str, built: Optional[DialGeometry]) -> int:
+        """新たに生成した役割のアイテムを重なり順の位置へ移し、生成したアイテム数を返す
+        
+        built を指定した場合は、そのレイアウトで生成したアイテムを他の文字盤アイテムと同じく
+        現在の中心・半径へ変形する。
+        """
+        items = self._face_items.get(role, [])
+        tag = self._role_tag(role)
+        if built is not None and (built.center_x, built.center_y, built.radius) != (
+                self._center_x, self._center_y, self._radius):
+            factor = self._radius / built.radius
+            self._canvas.scale(tag, built.center_x, built.center_y, factor, factor)
+            self._canvas.move(tag, self._center_x - built.center_x, self._center_y - built.center_y)
+        # 直前の役割のアイテムのすぐ上へ（針より下に保つ）
+        below = None
+        for other in FACE_ROLES[:FACE_ROLES.index(role)]:
+            if self._face_items.get(other):
+                below = self._role_tag(other)
+        if below is not None:
+            self._canvas.tag_raise(tag, below)
+        else:
+            self._canvas.tag_lower(tag)
+        return len(items)
+    
+    def _delete_face_role(self, role: str) -> None:
+        """役割のアイテムを削除"""
+        items = self._face_items.pop(role, None)
+        if items:
+            self._canvas.delete(self._role_tag(role))
+            self._stats.record_deleted(len(items))
+            if role == 'glow_ring':
+                self._displayed_sprites.pop('ring', None)
+    
+    def _use_prerendered_dial(self) -> bool:
+        """文字盤を事前描画した画像で描くかどうか"""
+        if self._prerender_dial is not None:
+            return self._prerender_dial
+        return bool(self._config and self._config.get("prerender_dial", False))
+    
+    def _draw_prerendered_dial(self, style: ThemeStyle) -> None:
+        """事前描画した文字盤の画像アイテムを生成"""
+        radius = self._radius
+        dial = self._dial_cache.get_dial(
+            (self._image_kind(), style, radius),
+            lambda: rasterize_dial(style, radius),
+            lambda raster: self._make_image(raster, style.canvas_bg)
+        )
+        self._displayed_sprites['dial'] = dial
+        self._face_style = style
+        self._face_geometry = None  # 画像は変形できないため、サイズ変更時は作り直す
+        self._create_face_item(
+            'dial',
+            self._canvas.create_image,
+            self._center_x + dial.offset_x,
+            self._center_y + dial.offset_y,
+            image=dial.image,
+            anchor='nw'
+        )
+    
+    def _get_geometry(self, style: ThemeStyle) -> DialGeometry:
+        """現在のサイズとスタイルに対応する文字盤レイアウトを取得"""
+        key = (self._center_x, self._center_y, self._radius, style.compact_dial)
+        if key != self._geometry_key:
+            # 多数の時計が共有キャッシュを使い回しても毎ティック再計算しないよう直近の結果を保持
+            self._geometry = get_dial_geometry(self._center_x, self._center_y, self._radius, style.compact_dial)
+            self._geometry_key = key
+        return self._geometry
+    
+    def _create_face_item(self, role: str, factory: Callable, *args, **kwargs) -> int:
+        """文字盤アイテムを生成（まとめて変形・再スタイルできるよう文字盤と役割のタグを付ける）"""
+        tags = (self._face_tag, self._role_tag(role))
+        kwargs['tags'] = (self._item_tag,) + tags if self._item_tag else tags
+        item = self._create_item(factory, *args, **kwargs)
+        self._face_items.setdefault(role, []).append(item)
+        return item
+    
+    def _role_tag(self, role: str) -> str:
+        """文字盤アイテムの役割ごとのタグ"""
+        return f"{self._face_tag}-{role}"
+    
+    def _count_face_items(self) -> int:
+        """文字盤アイテムの数"""
+        return sum(len(items) for items in self._face_items.values())
     
-    def _apply_face_special_effects(self, theme: ITheme) -> None:
+    def _forget_face_items(self) -> None:
+        """文字盤アイテムの記録を破棄"""
+        self._face_items = {}
+        self._face_geometry = None
+        self._face_style = None
+        self._face_attributes = {}
+    
+    def _apply_face_special_effects(self, style: ThemeStyle, geometry: DialGeometry) -> None:
         """文字盤に特殊効果を適用"""
-        if theme.get_name() == "ネオン":
-            colors = theme.get_colors()
-            # ネオン発光効果
-            glow_layers = max(2, self._radius // 75)  # サイズに応じて発光レイヤー数を調整
-            for i in range(glow_layers):
-                self._canvas.create_oval(
-                    self._center_x - self._radius - i,
-                    self._center_y - self._radius - i,
-                    self._center_x + self._radius + i,
-                    self._center_y + self._radius + i,
+        if style.has_glow and self._glow_sprites:
+            # 発光効果のリング（ラスター化した1枚の画像）
+            self._draw_glow_ring(style, geometry)
+        elif style.has_glow:
+            # 発光効果のリング
+            for bbox in geometry.glow_bboxes:
+                self._create_face_item(
+                    'glow',
+                    self._canvas.create_oval,
+                    *bbox,
                     fill='',
-                    outline=colors['outline'],
+                    outline=style.outline,
                     width=1
                 )
     
-    def _draw_hour_numbers(self, theme: ITheme) -> None:
+    def _draw_glow_ring(self, style: ThemeStyle, geometry: DialGeometry) -> None:
+        """外周の発光リングをスプライトで描画"""
+        sprite = self._get_glow_ring_sprite(style, geometry)
+        self._displayed_sprites['ring'] = sprite
+        self._create_face_item(
+            'glow_ring',
+            self._canvas.create_image,
+            self._center_x + sprite.offset_x,
+            self._center_y + sprite.offset_y,
+            image=sprite.image,
+            anchor='nw'
+        )
+    
+    def _get_glow_ring_sprite(self, style: ThemeStyle, geometry: DialGeometry) -> GlowSprite:
+        """外周の発光リングのスプライトを取得"""
+        # 外周線の外側から広げる（下地は文字盤の外側の背景色）
+        inner = geometry.radius + (geometry.outline_width + 1) // 2
+        key = ('ring', self._image_kind(), style.outline, style.canvas_bg, inner, geometry.glow_spread)
+        return self._sprite_cache.get_sprite(
+            key,
+            lambda: rasterize_glow_ring(inner, style.outline, geometry.glow_spread),
+            lambda raster: self._make_image(raster, style.canvas_bg)
+        )
+    
+    def _image_kind(self) -> str:
+        """描画先で使う画像の種類（キャッシュキー用）"""
+        return 'raster' if hasattr(self._canvas, 'image_from_raster') else 'photo'
+    
+    def _make_image(self, raster: Raster, matte: str) -> Any:
+        """ラスターを描画先の画像に変換"""
+        image_from_raster = getattr(self._canvas, 'image_from_raster', None)
+        if image_from_raster is not None:
+            return image_from_raster(raster, matte)
+        return raster_to_photo_image(raster, self._canvas, matte)
+    
+    def _make_image_steps(self, raster: Raster, matte: str) -> Any:
+        """_make_image を中断できるジェネレーター"""
+        image_from_raster = getattr(self._canvas, 'image_from_raster', None)
+        if image_from_raster is not None:
+            return image_from_raster(raster, matte)
+        return (yield from raster_to_photo_image_steps(raster, self._canvas, matte))
+    
+    def _draw_hour_numbers(self, resolved: ResolvedStyle, geometry: DialGeometry) -> None:
         """時間の数字を描画"""
-        colors = theme.get_colors()
-        font_settings = theme.get_font_settings()
-        
-        # サイズに応じてフォントサイズを調整
-        font_size = max(10, self._radius // 10)
-        if theme.get_name() == "ミニマル":
-            font_size = max(12, self._radius // 8)
-        
-        for hour in range(1, 13):
-            angle = math.radians(90 - (hour * 30))
-            distance = self._radius - max(20, self._radius // 7.5)  # サイズに応じて距離を調整
-            x = self._center_x + distance * math.cos(angle)
-            y = self._center_y - distance * math.sin(angle)
-            
-            self._canvas.create_text(
+        for hour, (x, y) in enumerate(geometry.numeral_positions, start=1):
+            self._create_face_item(
+                'numeral',
+                self._canvas.create_text,
                 x, y,
                 text=str(hour),
-                font=(font_settings['family'], font_size, font_settings['weight']),
-                fill=colors['numbers']
+                font=resolved.numeral_font,
+                fill=resolved.style.numbers
             )
     
-    def _draw_hour_marks(self, theme: ITheme) -> None:
+    def _draw_hour_marks(self, style: ThemeStyle, geometry: DialGeometry) -> None:
         """時間の目盛りを描画"""
-        colors = theme.get_colors()
-        
-        mark_width = max(1, self._radius // 75) if theme.get_name() == "ミニマル" else max(2, self._radius // 50)
-        mark_length = max(8, self._radius // 18)
-        
-        for hour in range(12):
-            angle = math.radians(hour * 30)
-            x1 = self._center_x + (self._radius - mark_length) * math.cos(angle)
-            y1 = self._center_y + (self._radius - mark_length) * math.sin(angle)
-            x2 = self._center_x + (self._radius - max(3, mark_length // 3)) * math.cos(angle)
-            y2 = self._center_y + (self._radius - max(3, mark_length // 3)) * math.sin(angle)
-            
-            self._canvas.create_line(
-                x1, y1, x2, y2,
-                fill=colors['marks'],
-                width=mark_width
+        for segment in geometry.hour_marks:
+            self._create_face_item(
+                'hour_mark',
+                self._canvas.create_line,
+                *segment,
+                fill=style.marks,
+                width=geometry.hour_mark_width
             )
     
-    def _draw_minute_marks(self, theme: ITheme) -> None:
+    def _draw_minute_marks(self, style: ThemeStyle, geometry: DialGeometry) -> None:
         """分の目盛りを描画"""
-        colors = theme.get_colors()
-        
-        mark_length = max(4, self._radius // 30)
-        
-        for minute in range(60):
-            if minute % 5 != 0:  # 5分刻み以外の目盛り
-                angle = math.radians(minute * 6)
-                x1 = self._center_x + (self._radius - mark_length) * math.cos(angle)
-                y1 = self._center_y + (self._radius - mark_length) * math.sin(angle)
-                x2 = self._center_x + (self._radius - max(2, mark_length // 2)) * math.cos(angle)
-                y2 = self._center_y + (self._radius - max(2, mark_length // 2)) * math.sin(angle)
-                
-                self._canvas.create_line(
-                    x1, y1, x2, y2,
-                    fill=colors['marks'],
-                    width=1
-                )
+        for segment in geometry.minute_marks:
+            self._create_face_item(
+                'minute_mark',
+                self._canvas.create_line,
+                *segment,
+                fill=style.marks,
+                width=1
+            )
     
-    def render_hands(self, hours: int, minutes: int, seconds: int, theme: ITheme) -> None:
-        """時計の針を描画"""
+    def render_hands(self, hours: int, minutes: int, seconds: float, theme: ITheme) -> None:
+        """時計の針を描画（前回描画した針は置き換える）"""
+        self._stats.begin_frame()
+        
         # 針の角度を計算
-        second_angle = seconds * 6  # 秒針: 6度/秒
-        minute_angle = minutes * 6 + seconds * 0.1  # 分針: 6度/分 + 滑らかな動き
-        hour_angle = hours * 30 + minutes * 0.5  # 時針: 30度/時間 + 滑らかな動き
+        hour_angle, minute_angle, second_angle = hand_angles(hours, minutes, seconds)
         
-        colors = theme.get_colors()
-        hand_settings = theme.get_hand_settings()
+        # サイズに応じた針の長さ
+        geometry = self._get_geometry(theme.get_style())
         
-        # サイズに応じて針の長さと太さを調整
-        scale_factor = self._radius / 150  # ベースサイズ150で正規化
+        hands_key = (theme, self._center_x, self._center_y, self._radius)
+        if not self._retained_hands or hands_key != self._hands_key or not self._hand_items:
+            self._delete_hand_items()
+            self._create_hands(hour_angle, minute_angle, second_angle, geometry, theme)
+            self._hands_key = hands_key
+            return
         
-        hour_length = int(80 * scale_factor)
-        minute_length = int(110 * scale_factor)
-        second_length = int(120 * scale_factor)
+        # 保持モード: 角度が変わった針の座標だけを更新（時針は1分に1回しか動かない）
+        self._update_hand('hour', hour_angle, geometry.hour_length)
+        self._update_hand('minute', minute_angle, geometry.minute_length)
+        self._update_hand('second', second_angle, geometry.second_length)
+    
+    def _update_hand(self, hand: str, angle: float, length: int) -> None:
+        """前回描画時から角度が変わった場合のみ針を移動"""
+        if self._hand_angles.get(hand) == angle:
+            # 座標を変えなければ Tk は再描画領域を作らない
+            self._stats.record_hand_skipped()
+            return
+        self._move_hand(hand, angle, length)
+        self._hand_angles[hand] = angle
+        self._stats.record_hand_updated()
+    
+    def _create_hands(self, hour_angle: float, minute_angle: float, second_angle: float,
+                      geometry: DialGeometry, theme: ITheme) -> None:
+        """針と中心の円のアイテムを生成"""
+        style = theme.get_style()
+        resolved = resolve_style(style, self._radius)
+        
+        if style.has_glow and self._glow_sprites:
+            # 発光スプライトはすべての針の下に置く
+            self._create_glow_sprite('hour', hour_angle, geometry.hour_length, resolved.hour_width, style.hour_hand, style, geometry)
+            self._create_glow_sprite('minute', minute_angle, geometry.minute_length, resolved.minute_width, style.minute_hand, style, geometry)
+            self._create_glow_sprite('second', second_angle, geometry.second_length, resolved.second_width, style.second_hand, style, geometry)
+            self._reserve_glow_sprites(geometry, resolved)
+            effects_theme = None
+        else:
+            self._sprite_cache.release(self)
+            effects_theme = theme
         
-        hour_width = max(1, int(hand_settings['hour_width'] * scale_factor))
-        minute_width = max(1, int(hand_settings['minute_width'] * scale_factor))
-        second_width = max(1, int(hand_settings['second_width'] * scale_factor))
+        self._hand_angles = {'hour': hour_angle, 'minute': minute_angle, 'second': second_angle}
         
         # 針を描画
-        self._draw_hand(hour_angle, hour_length, hour_width, colors['hour_hand'], theme, 'hands')
-        self._draw_hand(minute_angle, minute_length, minute_width, colors['minute_hand'], theme, 'hands')
-        self._draw_hand(second_angle, second_length, second_width, colors['second_hand'], theme, 'hands')
+        self._hand_items['hour'] = self._draw_hand(hour_angle, geometry.hour_length, resolved.hour_width, style.hour_hand, effects_theme, self._hands_tag)
+        self._hand_items['minute'] = self._draw_hand(minute_angle, geometry.minute_length, resolved.minute_width, style.minute_hand, effects_theme, self._hands_tag)
+        self._hand_items['second'] = self._draw_hand(second_angle, geometry.second_length, resolved.second_width, style.second_hand, effects_theme, self._hands_tag)
         
         # 中心の円を描画
-        center_size = max(4, int((6 if theme.get_name() == "ミニマル" else 8) * scale_factor))
-        self._canvas.create_oval(
+        center_size = geometry.center_size
+        self._hand_items['center'] = [self._create_item(
+            self._canvas.create_oval,
             self._center_x - center_size,
             self._center_y - center_size,
             self._center_x + center_size,
             self._center_y + center_size,
-            fill=colors['center'],
-            outline=colors['center'],
-            width=max(1, int(2 * scale_factor)),
-            tags='hands'
+            fill=style.center,
+            outline=style.center,
+            width=geometry.center_width,
+            tags=self._hands_tag
+        )]
+    
+    def _hand_end_point(self, angle: float, length: int) -> Tuple[float, float]:
+        """針の先端座標を計算"""
+        return hand_end_point(self._center_x, self._center_y, angle, length)
+    
+    def _glow_sprite_key(self, hand: str, angle: float, length: int, width: int, color: str,
+                         style: ThemeStyle, geometry: DialGeometry) -> Tuple:
+        """針の発光スプライトのキャッシュキー（角度は刻み幅に丸める）"""
+        # にじみの半分までのずれは見分けられないため、その範囲で角度をまとめる
+        bucket_size = angle_bucket_size(length, geometry.glow_spread / 2.0)
+        bucket = self._angle_bucket(angle, bucket_size)
+        return ('hand', self._image_kind(), color, style.face, length, width, geometry.glow_spread, bucket_size, bucket)
+    
+    @staticmethod
+    def _angle_bucket(angle: float, bucket_size: float) -> int:
+        """角度を刻み幅に丸めた番号"""
+        return int(round((angle % 360.0) / bucket_size)) % int(math.ceil(360.0 / bucket_size))
+    
+    def _get_glow_sprite(self, key: Tuple) -> GlowSprite:
+        """キーに対応する針の発光スプライトを取得（無ければその場で生成）"""
+        _, _, color, matte, length, width, spread, bucket_size, bucket = key
+        return self._sprite_cache.get_sprite(
+            key,
+            lambda: rasterize_glow_segment(bucket * bucket_size, length, width, color, spread),
+            lambda raster: self._make_image(raster, matte)
+        )
+    
+    def _glow_sprite_steps(self, key: Tuple) -> Any:
+        """キーに対応する針の発光スプライトを少しずつ生成するジェネレーター"""
+        _, _, color, matte, length, width, spread, bucket_size, bucket = key
+        return glow_sprite_steps(
+            rasterize_glow_segment_steps(bucket * bucket_size, length, width, color, spread),
+            lambda raster: self._make_image_steps(raster, matte)
         )
     
-    def _draw_hand(self, angle: float, length: int, width: int, color: str, theme: ITheme, tag: str) -> None:
-        """時計の針を描画"""
-        angle_rad = math.radians(90 - angle)
-        end_x = self._center_x + length * math.cos(angle_rad)
-        end_y = self._center_y - length * math.sin(angle_rad)
+    def _find_glow_sprite(self, key: Tuple) -> Optional[GlowSprite]:
+        """ティック中に使う発光スプライトを取得（タイマーで生成できる場合、無ければ依頼して None）"""
+        if not self._sprite_warmer.is_attached():
+            return self._get_glow_sprite(key)
+        sprite = self._sprite_cache.get_cached(key)
+        if sprite is None:
+            self._sprite_warmer.request(key, lambda: self._glow_sprite_steps(key), urgent=True)
+        return sprite
+    
+    def _reserve_glow_sprites(self, geometry: DialGeometry, resolved: ResolvedStyle) -> None:
+        """秒針の1周分と時針・分針の先読み分のスプライトが収まるようキャッシュの上限を予約"""
+        working_sets = {}
+        for hand, length, width in (('hour', geometry.hour_length, resolved.hour_width),
+                                    ('minute', geometry.minute_length, resolved.minute_width),
+                                    ('second', geometry.second_length, resolved.second_width)):
+            key = self._sprite_keys[hand]
+            if hand == 'second':
+                nbytes = glow_cycle_nbytes(length, width, geometry.glow_spread, key[-2])
+            else:
+                # 斜め45度のスプライトが最も大きい
+                nbytes = GLOW_LOOKAHEAD_BUCKETS * glow_segment_nbytes(45.0, length, width, geometry.glow_spread)
+            working_sets[key[:-1]] = nbytes
+        self._sprite_cache.reserve(self, working_sets)
+    
+    def _create_glow_sprite(self, hand: str, angle: float, length: int, width: int, color: str,
+                            style: ThemeStyle, geometry: DialGeometry) -> None:
+        """針の発光スプライトの画像アイテムを生成"""
+        key = self._glow_sprite_key(hand, angle, length, width, color, style, geometry)
+        sprite = self._get_glow_sprite(key)
+        self._sprite_keys[hand] = key
+        self._displayed_sprites[hand] = sprite
+        self._glow_angles[hand] = angle
+        self._prefetch_glow_sprites(key[:-1], key[-1], angle, angle)
+        self._hand_items[hand + '_glow'] = [self._create_item(
+            self._canvas.create_image,
+            self._center_x + sprite.offset_x,
+            self._center_y + sprite.offset_y,
+            image=sprite.image,
+            anchor='nw',
+            tags=self._hands_tag
+        )]
+    
+    def _move_glow_sprite(self, hand: str, angle: float, length: int) -> None:
+        """角度の刻みが変わったときだけ発光スプライトを差し替え、次のスプライトを先読みする"""
+        key = self._sprite_keys.get(hand)
+        if not self._hand_items.get(hand + '_glow') or key is None:
+            return
+        previous_angle = self._glow_angles.get(hand, angle)
+        self._glow_angles[hand] = angle
+        bucket_size = key[-2]
+        bucket = self._angle_bucket(angle, bucket_size)
+        if bucket != key[-1]:
+            self._show_glow_sprite(hand, key[:-1] + (bucket,))
+        else:
+            self._wanted_sprites.pop(hand, None)
+        self._prefetch_glow_sprites(key[:-1], bucket, angle, previous_angle)
+    
+    def _show_glow_sprite(self, hand: str, key: Tuple) -> None:
+        """発光スプライトを差し替える（生成を待つ間は今のスプライトのまま）"""
+        sprite = self._find_glow_sprite(key)
+        if sprite is None:
+            self._wanted_sprites[hand] = key
+            return
+        self._wanted_sprites.pop(hand, None)
+        items = self._hand_items[hand + '_glow']
+        self._sprite_keys[hand] = key
+        self._displayed_sprites[hand] = sprite
+        self._canvas.itemconfigure(items[0], image=sprite.image)
+        self._canvas.coords(items[0], self._center_x + sprite.offset_x, self._center_y + sprite.offset_y)
+    
+    def _prefetch_glow_sprites(self, prefix: Tuple, bucket: int, angle: float, previous_angle: float) -> None:
+        """次のフレームの角度（直前と同じだけ進む）のスプライトを先に生成させる"""
+        bucket_size = prefix[-1]
+        step = (angle - previous_angle) % 360.0
+        if step > 180.0:
+            step = 0.0  # 逆回り・時刻の飛び（時刻合わせなど）は予測しない
+        next_bucket = self._angle_bucket(angle + step, bucket_size)
+        if next_bucket == bucket:
+            # 刻みより遅い針（時針・分針）は時計回りの隣の刻み
+            next_bucket = (bucket + 1) % int(math.ceil(360.0 / bucket_size))
+        next_key = prefix + (next_bucket,)
+        self._sprite_warmer.request(next_key, lambda: self._glow_sprite_steps(next_key))
+    
+    def _on_glow_sprite_ready(self, key: Tuple) -> None:
+        """待っていた発光スプライトができたら次のティックを待たずに差し替える"""
+        for hand, wanted in list(self._wanted_sprites.items()):
+            if wanted == key and self._hand_items.get(hand + '_glow'):
+                self._show_glow_sprite(hand, key)
+    
+    def _forget_glow_warming(self) -> None:
+        """針を作り直すときに先読みと生成待ちを破棄"""
+        self._glow_angles = {}
+        self._wanted_sprites = {}
+        self._sprite_warmer.clear()
+    
+    def _draw_hand(self, angle: float, length: int, width: int, color: str,
+                   theme: Optional[ITheme], tag: str) -> List[int]:
+        """時計の針を描画し、生成したアイテムIDを返す（theme が None なら特殊効果なし）"""
+        end_x, end_y = self._hand_end_point(angle, length)
+        items: List[int] = []
+        
+        def create_line(*args, **kwargs) -> int:
+            item = self._create_item(self._canvas.create_line, *args, **kwargs)
+            items.append(item)
+            return item
+        
+        if theme is None:
+            create_line(self._center_x, self._center_y, end_x, end_y,
+                        fill=color, width=width, capstyle='round', tags=tag)
+            return items
         
-        # テーマ固有の特殊効果を適用
+        # テーマ固有の特殊効果を適用（発光効果では複数のアイテムが生成される）
         theme.apply_special_effects(
             self._canvas,
-            self._canvas.create_line,
+            create_line,
             self._center_x, self._center_y,
             end_x, end_y,
             fill=color,
@@ -191,11 +723,71 @@ class AnalogClockRenderer(IRenderer):
             capstyle='round',
             tags=tag
         )
+        return items
+    
+    def _move_hand(self, hand: str, angle: float, length: int) -> None:
+        """既存の針アイテムを新しい角度へ移動"""
+        end_x, end_y = self._hand_end_point(angle, length)
+        for item in self._hand_items.get(hand, ()):
+            self._canvas.coords(item, self._center_x, self._center_y, end_x, end_y)
+        self._move_glow_sprite(hand, angle, length)
+    
+    def _delete_hand_items(self) -> None:
+        """保持している針アイテムを削除"""
+        count = sum(len(items) for items in self._hand_items.values())
+        if count:
+            self._canvas.delete(self._hands_tag)
+            self._stats.record_deleted(count)
+        self._hand_items = {}
+        self._hand_angles = {}
+        self._hands_key = None
+        self._sprite_keys = {}
+        self._forget_glow_warming()
+        for hand in ('hour', 'minute', 'second'):
+            self._displayed_sprites.pop(hand, None)
     
     def clear_hands(self) -> None:
         """針をクリア"""
-        self._canvas.delete('hands')
+        self._delete_hand_items()
     
     def clear_all(self) -> None:
         """すべてをクリア"""
-        self._canvas.delete("all")
\ No newline at end of file
+        self._stats.record_deleted(
+            self._count_face_items() + sum(len(items) for items in self._hand_items.values())
+        )
+        if self._item_tag:
+            self._canvas.delete(self._item_tag)
+            self._canvas.delete(self._hands_tag)
+        else:
+            self._canvas.delete("all")
+        self.forget_items()
+    
+    def forget_items(self) -> None:
+        """キャンバスが外部で一括消去された後、保持していたアイテムを破棄済みとして扱う"""
+        self._hand_items = {}
+        self._hand_angles = {}
+        self._hands_key = None
+        self._sprite_keys = {}
+        self._displayed_sprites = {}
+        self._forget_glow_warming()
+        self._forget_face_items()
+
+def _scaled_deviation(built: DialGeometry, exact: DialGeometry) -> float:
+    """生成時のレイアウトを新しい中心・半径へ相似変形したときの、正確なレイアウトとの最大のずれ"""
+    factor = exact.radius / built.radius
+    
+    def transform_x(x: float) -> float:
+        return exact.center_x + (x - built.center_x) * factor
+    
+    def transform_y(y: float) -> float:
+        return exact.center_y + (y - built.center_y) * factor
+    
+    deviation = 0.0
+    pairs = [(built.numeral_positions, exact.numeral_positions), (built.hour_marks, exact.hour_marks),
+             (built.minute_marks, exact.minute_marks), (built.glow_bboxes, exact.glow_bboxes)]
+    for built_points, exact_points in pairs:
+        for before, after in zip(built_points, exact_points):
+            for index, value in enumerate(before):
+                moved = transform_x(value) if index % 2 == 0 else transform_y(value)
+                deviation = max(deviation, abs(moved - after[index]))
+    return deviation
@@ -0,0 +1,132 @@
+import math
+from typing import Dict, NamedTuple, Tuple
+from .hand_geometry import hand_lengths
+from .lru_cache import LRUCache
+
+Point = Tuple[float, float]
+Segment = Tuple[float, float, float, float]
+BBox = Tuple[float, float, float, float]
+
+class DialGeometry(NamedTuple):
+    """文字盤のレイアウト（座標・フォントサイズ・線幅）- 不変オブジェクト"""
+    center_x: int
+    center_y: int
+    radius: int
+    outline_bbox: BBox
+    outline_width: int
+    glow_bboxes: Tuple[BBox, ...]
+    glow_spread: int
+    numeral_positions: Tuple[Point, ...]  # 1時から12時の順
+    numeral_font_size: int
+    hour_marks: Tuple[Segment, ...]
+    hour_mark_width: int
+    minute_marks: Tuple[Segment, ...]
+    hour_length: int
+    minute_length: int
+    second_length: int
+    center_size: int
+    center_width: int
+    scale_factor: float
+
+_geometry_cache = LRUCache(maxsize=32)
+
+def get_dial_geometry(center_x: int, center_y: int, radius: int, compact: bool = False) -> DialGeometry:
+    """文字盤のレイアウトを取得（(半径, 中心, スタイル) ごとにキャッシュ）"""
+    key = (radius, center_x, center_y, compact)
+    geometry = _geometry_cache.get(key)
+    if geometry is None:
+        geometry = _compute_dial_geometry(center_x, center_y, radius, compact)
+        _geometry_cache.put(key, geometry)
+    return geometry
+
+def get_geometry_cache_stats() -> Dict[str, int]:
+    """レイアウトキャッシュのヒット/ミス数を取得"""
+    return _geometry_cache.get_stats()
+
+def clear_geometry_cache() -> None:
+    """レイアウトキャッシュをクリア"""
+    _geometry_cache.clear()
+
+def numeral_font_size(radius: int, compact: bool = False) -> int:
+    """サイズに応じた数字のフォントサイズ"""
+    return max(12, radius // 8) if compact else max(10, radius // 10)
+
+def _compute_dial_geometry(center_x: int, center_y: int, radius: int, compact: bool) -> DialGeometry:
+    """文字盤のレイアウトを計算"""
+    # 外側の円（サイズに応じて線の太さを調整）
+    outline_bbox = (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+    outline_width = max(1, radius // 50)
+
+    # 発光効果のリング（サイズに応じてレイヤー数を調整）
+    glow_layers = max(2, radius // 75)
+    glow_bboxes = tuple(
+        (center_x - radius - i, center_y - radius - i, center_x + radius + i, center_y + radius + i)
+        for i in range(glow_layers)
+    )
+    # 発光スプライトのにじみ幅
+    glow_spread = max(3, radius // 25)
+
+    # 時間の数字
+    font_size = numeral_font_size(radius, compact)
+    distance = radius - max(20, radius // 7.5)
+    numeral_positions = []
+    for hour in range(1, 13):
+        angle = math.radians(90 - (hour * 30))
+        numeral_positions.append((
+            center_x + distance * math.cos(angle),
+            center_y - distance * math.sin(angle)
+        ))
+
+    # 時間の目盛り
+    hour_mark_width = max(1, radius // 75) if compact else max(2, radius // 50)
+    mark_length = max(8, radius // 18)
+    hour_marks = tuple(
+        _radial_segment(center_x, center_y, hour * 30,
+                        radius - mark_length, radius - max(3, mark_length // 3))
+        for hour in range(12)
+    )
+
+    # 分の目盛り（5分刻み以外）
+    minute_mark_length = max(4, radius // 30)
+    minute_marks = tuple(
+        _radial_segment(center_x, center_y, minute * 6,
+                        radius - minute_mark_length, radius - max(2, minute_mark_length // 2))
+        for minute in range(60) if minute % 5 != 0
+    )
+
+    # 針（ベースサイズ150で正規化）
+    scale_factor = radius / 150
+    hour_length, minute_length, second_length = hand_lengths(radius)
+
+    return DialGeometry(
+        center_x=center_x,
+        center_y=center_y,
+        radius=radius,
+        outline_bbox=outline_bbox,
+        outline_width=outline_width,
+        glow_bboxes=glow_bboxes,
+        glow_spread=glow_spread,
+        numeral_positions=tuple(numeral_positions),
+        numeral_font_size=font_size,
+        hour_marks=hour_marks,
+        hour_mark_width=hour_mark_width,
+        minute_marks=minute_marks,
+        hour_length=hour_length,
+        minute_length=minute_length,
+        second_length=second_length,
+        center_size=max(4, int((6 if compact else 8) * scale_factor)),
+        center_width=max(1, int(2 * scale_factor)),
+        scale_factor=scale_factor
+    )
+
+def _radial_segment(center_x: int, center_y: int, degrees: float, inner: float, outer: float) -> Segment:
+    """中心から放射状に伸びる線分を計算"""
+    angle = math.radians(degrees)
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    return (
+        center_x + inner * cos_a,
+        center_y + inner * sin_a,
+        center_x + outer * cos_a,
+        center_y + outer * sin_a
+    )
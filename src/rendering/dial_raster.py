@@ -0,0 +1,257 @@
+import math
+import time
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Sequence, Tuple
+from .dial_geometry import DialGeometry, get_dial_geometry
+from .glow_sprites import rasterize_glow_ring
+from .lru_cache import LRUCache
+from .raster import RGB, Raster, blend_over, parse_color
+from .resolved_style import resolve_style
+from ..themes.theme_style import ThemeStyle
+
+Stroke = Sequence[Tuple[float, float]]
+
+# 数字のストロークフォント（高さ1、幅0.6の枠内の折れ線。y は下向き）
+_GLYPH_WIDTH = 0.6
+_GLYPH_ADVANCE = 0.8
+_STROKE_GLYPHS: Dict[str, Tuple[Stroke, ...]] = {
+    '0': (((0.15, 0.0), (0.45, 0.0), (0.6, 0.15), (0.6, 0.85), (0.45, 1.0), (0.15, 1.0),
+           (0.0, 0.85), (0.0, 0.15), (0.15, 0.0)),),
+    '1': (((0.15, 0.2), (0.35, 0.0), (0.35, 1.0)),),
+    '2': (((0.0, 0.15), (0.15, 0.0), (0.45, 0.0), (0.6, 0.15), (0.6, 0.4), (0.0, 1.0), (0.6, 1.0)),),
+    '3': (((0.0, 0.1), (0.15, 0.0), (0.45, 0.0), (0.6, 0.15), (0.6, 0.35), (0.45, 0.5), (0.2, 0.5)),
+          ((0.45, 0.5), (0.6, 0.65), (0.6, 0.85), (0.45, 1.0), (0.15, 1.0), (0.0, 0.9))),
+    '4': (((0.45, 1.0), (0.45, 0.0), (0.0, 0.7), (0.6, 0.7)),),
+    '5': (((0.6, 0.0), (0.05, 0.0), (0.0, 0.45), (0.45, 0.4), (0.6, 0.55), (0.6, 0.85),
+           (0.45, 1.0), (0.15, 1.0), (0.0, 0.9)),),
+    '6': (((0.55, 0.05), (0.4, 0.0), (0.15, 0.0), (0.0, 0.2), (0.0, 0.85), (0.15, 1.0), (0.45, 1.0),
+           (0.6, 0.85), (0.6, 0.6), (0.45, 0.45), (0.15, 0.45), (0.0, 0.55)),),
+    '7': (((0.0, 0.0), (0.6, 0.0), (0.2, 1.0)),),
+    '8': (((0.15, 0.0), (0.45, 0.0), (0.6, 0.12), (0.6, 0.35), (0.45, 0.47), (0.15, 0.47),
+           (0.0, 0.35), (0.0, 0.12), (0.15, 0.0)),
+          ((0.15, 0.47), (0.0, 0.6), (0.0, 0.87), (0.15, 1.0), (0.45, 1.0), (0.6, 0.87),
+           (0.6, 0.6), (0.45, 0.47))),
+    '9': (((0.05, 0.95), (0.2, 1.0), (0.45, 1.0), (0.6, 0.8), (0.6, 0.15), (0.45, 0.0), (0.15, 0.0),
+           (0.0, 0.15), (0.0, 0.4), (0.15, 0.55), (0.45, 0.55), (0.6, 0.45)),),
+}
+
+def _coverage(signed_distance: float) -> float:
+    """図形の境界からの符号付き距離（内側が負）をピクセルの被覆率に変換"""
+    coverage = 0.5 - signed_distance
+    return 0.0 if coverage <= 0.0 else 1.0 if coverage >= 1.0 else coverage
+
+def fill_circle(raster: Raster, center_x: float, center_y: float, radius: float, rgb: RGB) -> None:
+    """円を塗りつぶす（内側は行単位で一括、縁だけピクセルごとに被覆率を計算）"""
+    for py in range(max(0, int(center_y - radius - 1)), min(raster.height, int(center_y + radius + 2))):
+        y = py + 0.5 - center_y
+        if abs(y) > radius + 0.5:
+            continue
+        half = math.sqrt(max(0.0, radius * radius - y * y))
+        # 四隅まで円の内側に収まるピクセルは不透明で塗る
+        inner = math.sqrt(max(0.0, (radius - 0.75) ** 2 - y * y)) - 0.75 if abs(y) < radius - 0.75 else -1.0
+        solid_start = int(math.ceil(center_x - inner - 0.5)) if inner > 0 else 0
+        solid_stop = int(math.floor(center_x + inner - 0.5)) + 1 if inner > 0 else 0
+        raster.fill_row(py, solid_start, solid_stop, rgb)
+        for px in range(max(0, int(center_x - half - 1)), min(raster.width, int(center_x + half + 2))):
+            if solid_start <= px < solid_stop:
+                continue
+            x = px + 0.5 - center_x
+            raster.blend_pixel(px, py, rgb, _coverage(math.sqrt(x * x + y * y) - radius))
+
+def stroke_circle(raster: Raster, center_x: float, center_y: float, radius: float,
+                  width: float, rgb: RGB) -> None:
+    """円周を線幅 width で描く（Tk と同じく線は円周を中心に両側へ広がる）"""
+    half_width = width / 2.0
+    outer = radius + half_width
+    inner = max(0.0, radius - half_width)
+    for py in range(max(0, int(center_y - outer - 1)), min(raster.height, int(center_y + outer + 2))):
+        y = py + 0.5 - center_y
+        y_sq = y * y
+        if y_sq > (outer + 1) ** 2:
+            continue
+        x_outer = math.sqrt(max(0.0, (outer + 1) ** 2 - y_sq))
+        inner_limit = inner - 1
+        if inner_limit > 0 and y_sq < inner_limit * inner_limit:
+            # 左右の弧の帯だけを走査
+            x_inner = math.sqrt(inner_limit * inner_limit - y_sq)
+            spans = ((-x_outer, -x_inner), (x_inner, x_outer))
+        else:
+            # 上端・下端では帯が中央でつながる
+            spans = ((-x_outer, x_outer),)
+        for start, stop in spans:
+            for px in range(max(0, int(math.floor(center_x + start))),
+                            min(raster.width, int(math.ceil(center_x + stop)) + 1)):
+                x = px + 0.5 - center_x
+                distance = abs(math.sqrt(x * x + y_sq) - radius)
+                raster.blend_pixel(px, py, rgb, _coverage(distance - half_width))
+
+def draw_line(raster: Raster, x0: float, y0: float, x1: float, y1: float, width: float, rgb: RGB) -> None:
+    """端が平らな（Tk の capstyle='butt'）線分を描く"""
+    dx = x1 - x0
+    dy = y1 - y0
+    length = math.sqrt(dx * dx + dy * dy)
+    if length == 0.0:
+        return
+    ux, uy = dx / length, dy / length
+    half_width = max(0.5, width / 2.0)
+    reach = half_width + 1
+    for py in range(max(0, int(min(y0, y1) - reach)), min(raster.height, int(max(y0, y1) + reach) + 1)):
+        y = py + 0.5 - y0
+        for px in range(max(0, int(min(x0, x1) - reach)), min(raster.width, int(max(x0, x1) + reach) + 1)):
+            x = px + 0.5 - x0
+            along = x * ux + y * uy
+            across = abs(y * ux - x * uy)
+            coverage = _coverage(across - half_width) * _coverage(max(-along, along - length))
+            if coverage > 0.0:
+                raster.blend_pixel(px, py, rgb, coverage)
+
+def draw_strokes(raster: Raster, strokes: Sequence[Stroke], width: float, rgb: RGB) -> None:
+    """折れ線の集まりを丸い端・継ぎ目で描く（重なった部分も1回だけ合成）"""
+    segments: List[Tuple[float, float, float, float]] = [
+        (stroke[i][0], stroke[i][1], stroke[i + 1][0], stroke[i + 1][1])
+        for stroke in strokes for i in range(len(stroke) - 1)
+    ]
+    if not segments:
+        return
+    half_width = width / 2.0
+    reach = half_width + 1
+    min_x = min(min(x0, x1) for x0, _, x1, _ in segments) - reach
+    max_x = max(max(x0, x1) for x0, _, x1, _ in segments) + reach
+    min_y = min(min(y0, y1) for _, y0, _, y1 in segments) - reach
+    max_y = max(max(y0, y1) for _, y0, _, y1 in segments) + reach
+    pixels = raster.pixels
+    for py in range(max(0, int(min_y)), min(raster.height, int(max_y) + 1)):
+        y = py + 0.5
+        for px in range(max(0, int(min_x)), min(raster.width, int(max_x) + 1)):
+            x = px + 0.5
+            nearest = reach
+            for x0, y0, x1, y1 in segments:
+                dx = x1 - x0
+                dy = y1 - y0
+                length_sq = dx * dx + dy * dy or 1.0
+                t = ((x - x0) * dx + (y - y0) * dy) / length_sq
+                t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+                ex = x - x0 - t * dx
+                ey = y - y0 - t * dy
+                distance = math.sqrt(ex * ex + ey * ey)
+                if distance < nearest:
+                    nearest = distance
+            coverage = _coverage(nearest - half_width)
+            if coverage > 0.0:
+                blend_over(pixels, (py * raster.width + px) * 4, rgb, coverage)
+
+def draw_text(raster: Raster, text: str, center_x: float, center_y: float, height: float,
+              rgb: RGB, bold: bool = False) -> None:
+    """数字の文字列を中心 (center_x, center_y) に揃えてストロークフォントで描く"""
+    stroke_width = max(1.0, height * (0.16 if bold else 0.1))
+    # 線幅の分だけ枠を縮め、見た目の高さを height に合わせる
+    scale = max(1.0, height - stroke_width)
+    total_width = (len(text) - 1) * _GLYPH_ADVANCE + _GLYPH_WIDTH
+    left = center_x - total_width * scale / 2.0
+    top = center_y - scale / 2.0
+    strokes: List[Stroke] = []
+    for index, char in enumerate(text):
+        glyph_left = left + index * _GLYPH_ADVANCE * scale
+        for stroke in _STROKE_GLYPHS.get(char, ()):
+            strokes.append([(glyph_left + x * scale, top + y * scale) for x, y in stroke])
+    draw_strokes(raster, strokes, stroke_width, rgb)
+
+def numeral_pixel_height(font_size: int) -> float:
+    """Tk のフォントサイズ（ポイント）から数字の見た目の高さ（px）を概算"""
+    # 1pt = 96/72 px、数字の高さは em の約 0.72
+    return font_size * 96.0 / 72.0 * 0.72
+
+def dial_extent(style: ThemeStyle, geometry: DialGeometry) -> int:
+    """中心から画像の端までの距離（発光リングを含む）"""
+    reach = geometry.radius + (geometry.outline_width + 1) // 2
+    if style.has_glow:
+        reach += geometry.glow_spread
+    return reach + 2
+
+def rasterize_dial(style: ThemeStyle, radius: int) -> Tuple[Raster, int, int]:
+    """文字盤全体（外周・発光リング・数字・目盛り）を1枚のラスターに描画"""
+    probe = get_dial_geometry(0, 0, radius, style.compact_dial)
+    extent = dial_extent(style, probe)
+    # 画像内の座標で計算したレイアウト（中心は画像の中央）
+    geometry = get_dial_geometry(extent, extent, radius, style.compact_dial)
+    raster = Raster(extent * 2 + 1, extent * 2 + 1)
+
+    if style.has_glow:
+        # 外周線の外側から広げる（AnalogClockRenderer の発光スプライトと同じ形）
+        inner = geometry.radius + (geometry.outline_width + 1) // 2
+        ring, ring_x, ring_y = rasterize_glow_ring(inner, style.outline, geometry.glow_spread)
+        raster.composite(ring, extent + ring_x, extent + ring_y)
+
+    if style.face:
+        fill_circle(raster, extent, extent, radius, parse_color(style.face))
+    stroke_circle(raster, extent, extent, radius, geometry.outline_width, parse_color(style.outline))
+
+    resolved = resolve_style(style, radius)
+    numbers = parse_color(style.numbers)
+    height = numeral_pixel_height(resolved.numeral_font[1])
+    bold = resolved.numeral_font[2] == 'bold'
+    for hour, (x, y) in enumerate(geometry.numeral_positions, start=1):
+        draw_text(raster, str(hour), x, y, height, numbers, bold)
+
+    marks = parse_color(style.marks)
+    for segment in geometry.hour_marks:
+        draw_line(raster, *segment, geometry.hour_mark_width, marks)
+    if style.has_minute_marks:
+        for segment in geometry.minute_marks:
+            draw_line(raster, *segment, 1, marks)
+    return raster, -extent, -extent
+
+class DialImage(NamedTuple):
+    """事前描画した文字盤の画像（offset は中心から見た画像左上の位置）"""
+    image: Any
+    offset_x: int
+    offset_y: int
+    nbytes: int
+    build_ms: float
+
+class DialImageCache:
+    """事前描画した文字盤のLRUキャッシュ - メモリ使用量と再構築時間を記録"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, maxsize: int = 16):
+        self._cache = LRUCache(maxsize=maxsize, max_bytes=max_bytes,
+                               sizeof=lambda dial: dial.nbytes)
+        self._rebuilds = 0
+        self._total_build_ms = 0.0
+        self._last_build_ms = 0.0
+        self._max_build_ms = 0.0
+
+    def get_dial(self, key: Hashable, rasterize: Callable[[], Tuple[Raster, int, int]],
+                 make_image: Callable[[Raster], Any]) -> DialImage:
+        """文字盤の画像を取得（無ければラスター化して画像を生成）"""
+        dial = self._cache.get(key)
+        if dial is None:
+            start = time.perf_counter()
+            raster, offset_x, offset_y = rasterize()
+            image = make_image(raster)
+            build_ms = (time.perf_counter() - start) * 1000.0
+            dial = DialImage(image, offset_x, offset_y, raster.get_nbytes(), build_ms)
+            self._cache.put(key, dial)
+            self._rebuilds += 1
+            self._total_build_ms += build_ms
+            self._last_build_ms = build_ms
+            self._max_build_ms = max(self._max_build_ms, build_ms)
+        return dial
+
+    def clear(self) -> None:
+        """キャッシュを破棄"""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計（ヒット/ミス・バイト数・再構築時間）を取得"""
+        stats: Dict[str, Any] = self._cache.get_stats()
+        stats['rebuilds'] = self._rebuilds
+        stats['last_build_ms'] = self._last_build_ms
+        stats['max_build_ms'] = self._max_build_ms
+        stats['mean_build_ms'] = self._total_build_ms / self._rebuilds if self._rebuilds else 0.0
+        return stats
+
+# 全レンダラーで共有する文字盤キャッシュ（最近使ったテーマ・サイズへの切り替えは再描画不要）
+_dial_cache = DialImageCache()
+
+def get_dial_image_cache() -> DialImageCache:
+    """共有の文字盤キャッシュを取得"""
+    return _dial_cache
@@ -0,0 +1,200 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+class OvalPrimitive(NamedTuple):
+    """楕円プリミティブ"""
+    coords: Tuple[float, ...]
+    fill: str = ''
+    outline: str = 'black'
+    width: float = 1
+    tags: Tuple[str, ...] = ()
+
+class LinePrimitive(NamedTuple):
+    """線分プリミティブ"""
+    coords: Tuple[float, ...]
+    fill: str = 'black'
+    width: float = 1
+    capstyle: str = 'butt'
+    tags: Tuple[str, ...] = ()
+
+class TextPrimitive(NamedTuple):
+    """文字列プリミティブ（coords はアンカー座標 (x, y)）"""
+    coords: Tuple[float, ...]
+    text: str = ''
+    font: Tuple[Any, ...] = ()
+    fill: str = 'black'
+    tags: Tuple[str, ...] = ()
+
+class ImagePrimitive(NamedTuple):
+    """画像プリミティブ（coords はアンカー座標 (x, y)、image は Raster）"""
+    coords: Tuple[float, ...]
+    image: Any = None
+    anchor: str = 'center'
+    tags: Tuple[str, ...] = ()
+
+Primitive = Union[OvalPrimitive, LinePrimitive, TextPrimitive, ImagePrimitive]
+
+def _normalize_tags(tags: Any) -> Tuple[str, ...]:
+    """Tk と同様に文字列/タプルのタグを正規化"""
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return tuple(tags.split())
+    return tuple(tags)
+
+class DisplayListCanvas:
+    """tk.Canvas 互換のメモリ上ディスプレイリスト - Tk 不要の描画先
+
+    アイテムは生成順（=重なり順）に型付きプリミティブとして保持する。
+    """
+
+    def __init__(self, width: int = 350, height: int = 350):
+        self._width = width
+        self._height = height
+        self._items: Dict[int, Primitive] = {}
+        self._next_id = 1
+        self._call_count = 0
+
+    def _add(self, primitive: Primitive) -> int:
+        """プリミティブを登録してIDを返す"""
+        item = self._next_id
+        self._next_id += 1
+        self._items[item] = primitive
+        return item
+
+    def create_oval(self, *coords: float, fill: str = '', outline: str = 'black',
+                    width: float = 1, tags: Any = None, **kwargs) -> int:
+        """楕円を追加"""
+        self._call_count += 1
+        return self._add(OvalPrimitive(tuple(coords), fill, outline, width, _normalize_tags(tags)))
+
+    def create_line(self, *coords: float, fill: str = 'black', width: float = 1,
+                    capstyle: str = 'butt', tags: Any = None, **kwargs) -> int:
+        """線分を追加"""
+        self._call_count += 1
+        return self._add(LinePrimitive(tuple(coords), fill, width, capstyle, _normalize_tags(tags)))
+
+    def create_text(self, *coords: float, text: str = '', font: Any = (), fill: str = 'black',
+                    tags: Any = None, **kwargs) -> int:
+        """文字列を追加"""
+        self._call_count += 1
+        return self._add(TextPrimitive(tuple(coords), text, tuple(font), fill, _normalize_tags(tags)))
+
+    def create_image(self, *coords: float, image: Any = None, anchor: str = 'center',
+                     tags: Any = None, **kwargs) -> int:
+        """画像を追加"""
+        self._call_count += 1
+        return self._add(ImagePrimitive(tuple(coords), image, anchor, _normalize_tags(tags)))
+
+    def image_from_raster(self, raster: Any, matte: str = '#000000') -> Any:
+        """ラスターをこの描画先で使える画像に変換（ディスプレイリストではそのまま保持）"""
+        return raster
+
+    def coords(self, item: int, *coords: float) -> Optional[List[float]]:
+        """アイテムの座標を取得/更新"""
+        self._call_count += 1
+        primitive = self._items.get(item)
+        if primitive is None:
+            return None if coords else []
+        if not coords:
+            return list(primitive.coords)
+        self._items[item] = primitive._replace(coords=tuple(coords))
+        return None
+
+    def itemconfigure(self, tag_or_id: Union[int, str], **options: Any) -> None:
+        """アイテムの属性を更新"""
+        self._call_count += 1
+        for item in self._resolve(tag_or_id):
+            primitive = self._items[item]
+            changes = {key: value for key, value in options.items() if key in primitive._fields}
+            if 'tags' in changes:
+                changes['tags'] = _normalize_tags(changes['tags'])
+            if 'font' in changes:
+                changes['font'] = tuple(changes['font'])
+            self._items[item] = primitive._replace(**changes)
+
+    itemconfig = itemconfigure
+
+    def scale(self, tag_or_id: Union[int, str], x_origin: float, y_origin: float,
+              x_scale: float, y_scale: float) -> None:
+        """アイテムの座標を原点を中心に拡大縮小（Tk と同様に文字・画像はアンカー座標のみ移動）"""
+        self._call_count += 1
+        for item in self._resolve(tag_or_id):
+            primitive = self._items[item]
+            coords = tuple(
+                (x_origin + (value - x_origin) * x_scale) if index % 2 == 0
+                else (y_origin + (value - y_origin) * y_scale)
+                for index, value in enumerate(primitive.coords)
+            )
+            self._items[item] = primitive._replace(coords=coords)
+
+    def move(self, tag_or_id: Union[int, str], dx: float, dy: float) -> None:
+        """アイテムを平行移動"""
+        self._call_count += 1
+        for item in self._resolve(tag_or_id):
+            primitive = self._items[item]
+            coords = tuple(value + (dx if index % 2 == 0 else dy) for index, value in enumerate(primitive.coords))
+            self._items[item] = primitive._replace(coords=coords)
+
+    def tag_raise(self, tag_or_id: Union[int, str], above: Union[int, str, None] = None) -> None:
+        """アイテムを最前面、または above の最も上のアイテムのすぐ上へ移動"""
+        self._restack(tag_or_id, above, raise_=True)
+
+    def tag_lower(self, tag_or_id: Union[int, str], below: Union[int, str, None] = None) -> None:
+        """アイテムを最背面、または below の最も下のアイテムのすぐ下へ移動"""
+        self._restack(tag_or_id, below, raise_=False)
+
+    def _restack(self, tag_or_id: Union[int, str], reference: Union[int, str, None], raise_: bool) -> None:
+        """重なり順（生成順の辞書）を並べ替える"""
+        self._call_count += 1
+        moving = self._resolve(tag_or_id)
+        if not moving:
+            return
+        moving_set = set(moving)
+        order = [item for item in self._items if item not in moving_set]
+        anchors = [item for item in self._resolve(reference) if item not in moving_set] if reference is not None else []
+        if anchors:
+            index = order.index(anchors[-1]) + 1 if raise_ else order.index(anchors[0])
+        else:
+            index = len(order) if raise_ else 0
+        order[index:index] = moving
+        self._items = {item: self._items[item] for item in order}
+
+    def delete(self, tag_or_id: Union[int, str]) -> None:
+        """アイテムを削除"""
+        self._call_count += 1
+        for item in self._resolve(tag_or_id):
+            del self._items[item]
+
+    def find_all(self) -> Tuple[int, ...]:
+        """すべてのアイテムIDを取得"""
+        self._call_count += 1
+        return tuple(self._items)
+
+    def find_withtag(self, tag_or_id: Union[int, str]) -> Tuple[int, ...]:
+        """タグに一致するアイテムIDを取得"""
+        self._call_count += 1
+        return tuple(self._resolve(tag_or_id))
+
+    def winfo_width(self) -> int:
+        """幅を取得"""
+        return self._width
+
+    def winfo_height(self) -> int:
+        """高さを取得"""
+        return self._height
+
+    def _resolve(self, tag_or_id: Union[int, str]) -> List[int]:
+        """タグまたはIDを対象アイテムIDのリストに変換"""
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+        if tag_or_id == 'all':
+            return list(self._items)
+        return [item for item, primitive in self._items.items() if tag_or_id in primitive.tags]
+
+    def get_display_list(self) -> List[Primitive]:
+        """重なり順のプリミティブ一覧を取得"""
+        return list(self._items.values())
+
+    def get_call_count(self) -> int:
+        """Canvas API の呼び出し回数を取得"""
+        return self._call_count
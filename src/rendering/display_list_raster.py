@@ -0,0 +1,63 @@
+from typing import Dict, Iterable
+from .dial_raster import draw_line, draw_strokes, draw_text, fill_circle, numeral_pixel_height, stroke_circle
+from .display_list import ImagePrimitive, LinePrimitive, OvalPrimitive, Primitive, TextPrimitive
+from .raster import RGB, Raster, parse_color
+
+def _color(cache: Dict[str, RGB], color: str) -> RGB:
+    """色の文字列を (r, g, b) に変換（同じ色は一度だけ解析）"""
+    rgb = cache.get(color)
+    if rgb is None:
+        rgb = parse_color(color)
+        cache[color] = rgb
+    return rgb
+
+def create_background(width: int, height: int, color: str) -> Raster:
+    """キャンバスの背景色で塗りつぶしたラスターを生成"""
+    raster = Raster(width, height)
+    row = bytes(parse_color(color) + (255,)) * raster.width
+    raster.pixels[:] = row * raster.height
+    return raster
+
+def copy_raster(raster: Raster) -> Raster:
+    """ラスターを複製"""
+    copy = Raster(raster.width, raster.height)
+    copy.pixels[:] = raster.pixels
+    return copy
+
+def rasterize_primitives(raster: Raster, primitives: Iterable[Primitive]) -> None:
+    """ディスプレイリストのプリミティブを重なり順にラスターへ描画（Tk キャンバスと同じ見た目）
+
+    楕円は文字盤・中心の円に使う正円として、文字は数字のストロークフォントで描く。
+    線は capstyle='round' なら丸い端（針）、それ以外は平らな端（目盛り）で描く。
+    """
+    colors: Dict[str, RGB] = {}
+    for primitive in primitives:
+        if isinstance(primitive, OvalPrimitive):
+            x0, y0, x1, y1 = primitive.coords
+            center_x = (x0 + x1) / 2.0
+            center_y = (y0 + y1) / 2.0
+            radius = (x1 - x0) / 2.0
+            if primitive.fill:
+                fill_circle(raster, center_x, center_y, radius, _color(colors, primitive.fill))
+            if primitive.outline and primitive.width > 0:
+                stroke_circle(raster, center_x, center_y, radius, primitive.width, _color(colors, primitive.outline))
+        elif isinstance(primitive, LinePrimitive):
+            x0, y0, x1, y1 = primitive.coords[:4]
+            rgb = _color(colors, primitive.fill)
+            if primitive.capstyle == 'round':
+                draw_strokes(raster, (((x0, y0), (x1, y1)),), primitive.width, rgb)
+            else:
+                draw_line(raster, x0, y0, x1, y1, primitive.width, rgb)
+        elif isinstance(primitive, TextPrimitive):
+            x, y = primitive.coords[:2]
+            font = primitive.font
+            size = font[1] if len(font) > 1 else 10
+            bold = len(font) > 2 and font[2] == 'bold'
+            draw_text(raster, primitive.text, x, y, numeral_pixel_height(size), _color(colors, primitive.fill), bold)
+        elif isinstance(primitive, ImagePrimitive) and isinstance(primitive.image, Raster):
+            x, y = primitive.coords[:2]
+            image = primitive.image
+            if primitive.anchor == 'center':
+                x -= image.width / 2.0
+                y -= image.height / 2.0
+            raster.composite(image, int(round(x)), int(round(y)))
@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING, Any, List, Optional
+from .analog_clock_renderer import AnalogClockRenderer
+from .display_list import DisplayListCanvas, Primitive
+
+if TYPE_CHECKING:
+    from ..core.clock_config import ClockConfig
+
+class DisplayListRenderer(AnalogClockRenderer):
+    """ディスプレイリストへ描画するヘッドレスレンダラー - Liskov Substitution Principle
+
+    文字盤と針の描画ロジックは AnalogClockRenderer と共通で、描画先だけが
+    DisplayListCanvas に置き換わる。Tk やディスプレイは不要。
+    """
+
+    def initialize(self, canvas: Optional[Any], config: "ClockConfig") -> None:
+        """レンダラーを初期化（canvas が None なら新しいディスプレイリストを使用）"""
+        if canvas is None:
+            clock_size = config.get_clock_size()
+            canvas = DisplayListCanvas(clock_size['width'], clock_size['height'])
+        super().initialize(canvas, config)
+
+    def get_canvas(self) -> DisplayListCanvas:
+        """描画先のディスプレイリストを取得"""
+        if self._canvas is None:
+            self._canvas = DisplayListCanvas()
+        return self._canvas
+
+    def get_display_list(self) -> List[Primitive]:
+        """現在のフレームのプリミティブ一覧（重なり順）を取得"""
+        return self.get_canvas().get_display_list()
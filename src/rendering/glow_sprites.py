@@ -0,0 +1,372 @@
+import math
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generator, Hashable, NamedTuple, Optional, Tuple
+from .lru_cache import LRUCache
+from .raster import Raster, parse_color, run_steps
+
+# スプライトキャッシュの既定の上限と、レンダラーの予約で広げられる上限（バイト）
+DEFAULT_SPRITE_BUDGET_BYTES = 16 * 1024 * 1024
+MAX_SPRITE_BUDGET_BYTES = 256 * 1024 * 1024
+
+# 時針・分針の先読み用に確保するスプライト数
+GLOW_LOOKAHEAD_BUCKETS = 8
+
+class GlowSprite(NamedTuple):
+    """発光効果のスプライト（offset は中心から見た画像左上の位置）"""
+    image: Any
+    offset_x: int
+    offset_y: int
+    nbytes: int
+
+def glow_falloff(distance: float, core: float, spread: float, peak: float) -> float:
+    """中心線からの距離に応じた発光の強さ（0〜1）"""
+    if distance <= core:
+        return peak
+    t = (distance - core) / spread
+    if t >= 1.0:
+        return 0.0
+    return peak * (1.0 - t) * (1.0 - t)
+
+def _segment_extent(angle: float, length: int, width: int,
+                    spread: float) -> Tuple[float, float, int, int, int, int]:
+    """線分の先端座標と、発光を含む外接矩形（中心が原点）"""
+    angle_rad = math.radians(90 - angle)
+    end_x = length * math.cos(angle_rad)
+    end_y = -length * math.sin(angle_rad)
+    reach = width / 2.0 + spread
+    min_x = int(math.floor(min(0.0, end_x) - reach))
+    min_y = int(math.floor(min(0.0, end_y) - reach))
+    max_x = int(math.ceil(max(0.0, end_x) + reach))
+    max_y = int(math.ceil(max(0.0, end_y) + reach))
+    return end_x, end_y, min_x, min_y, max_x, max_y
+
+def glow_segment_nbytes(angle: float, length: int, width: int, spread: float) -> int:
+    """rasterize_glow_segment が生成するラスターのバイト数（ラスター化せずに計算）"""
+    _, _, min_x, min_y, max_x, max_y = _segment_extent(angle, length, width, spread)
+    return (max_x - min_x + 1) * (max_y - min_y + 1) * 4
+
+def glow_cycle_nbytes(length: int, width: int, spread: float, bucket_size: float) -> int:
+    """角度の刻み bucket_size で針が1周する間のスプライトの合計バイト数"""
+    count = int(math.ceil(360.0 / bucket_size))
+    return sum(glow_segment_nbytes(bucket * bucket_size, length, width, spread) for bucket in range(count))
+
+def rasterize_glow_segment(angle: float, length: int, width: int, color: str,
+                           spread: float, peak: float = 0.6) -> Tuple[Raster, int, int]:
+    """中心から角度 angle（12時起点・時計回り）に伸びる線分の発光をラスター化"""
+    return run_steps(rasterize_glow_segment_steps(angle, length, width, color, spread, peak))
+
+def rasterize_glow_segment_steps(angle: float, length: int, width: int, color: str, spread: float,
+                                 peak: float = 0.6) -> Generator[None, None, Tuple[Raster, int, int]]:
+    """rasterize_glow_segment を1行ごとに中断できるジェネレーター"""
+    end_x, end_y, min_x, min_y, max_x, max_y = _segment_extent(angle, length, width, spread)
+    core = width / 2.0
+    reach = core + spread
+    raster = Raster(max_x - min_x + 1, max_y - min_y + 1)
+
+    rgb = parse_color(color)
+    seg_len_sq = end_x * end_x + end_y * end_y or 1.0
+    normal_x = -end_y / math.sqrt(seg_len_sq)
+    normal_y = end_x / math.sqrt(seg_len_sq)
+    pixels = raster.pixels
+
+    for py in range(raster.height):
+        yield
+        y = min_y + py + 0.5
+        # 直線からの距離が reach 以内となる x の範囲（線分の帯）だけを走査
+        if abs(normal_x) > 1e-9:
+            a = (-reach - normal_y * y) / normal_x
+            b = (reach - normal_y * y) / normal_x
+            x_lo = int(math.floor(min(a, b) - reach)) - min_x
+            x_hi = int(math.ceil(max(a, b) + reach)) - min_x
+        else:
+            if abs(normal_y * y) > reach:
+                continue
+            x_lo, x_hi = 0, raster.width - 1
+        x_lo = max(0, x_lo)
+        x_hi = min(raster.width - 1, x_hi)
+
+        row_base = py * raster.width * 4
+        for px in range(x_lo, x_hi + 1):
+            x = min_x + px + 0.5
+            # 線分への最近点までの距離
+            t = (x * end_x + y * end_y) / seg_len_sq
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            dx = x - t * end_x
+            dy = y - t * end_y
+            intensity = glow_falloff(math.sqrt(dx * dx + dy * dy), core, spread, peak)
+            if intensity > 0.02:
+                offset = row_base + px * 4
+                pixels[offset] = rgb[0]
+                pixels[offset + 1] = rgb[1]
+                pixels[offset + 2] = rgb[2]
+                pixels[offset + 3] = int(intensity * 255)
+    return raster, min_x, min_y
+
+def rasterize_glow_ring(radius: int, color: str, spread: float,
+                        peak: float = 0.6) -> Tuple[Raster, int, int]:
+    """文字盤の外周から外側へ広がる発光リングをラスター化"""
+    outer = radius + spread
+    extent = int(math.ceil(outer)) + 1
+    raster = Raster(extent * 2 + 1, extent * 2 + 1)
+    rgb = parse_color(color)
+    pixels = raster.pixels
+    outer_sq = outer * outer
+    inner_sq = radius * radius
+
+    for py in range(raster.height):
+        y = py - extent + 0.5
+        y_sq = y * y
+        if y_sq > outer_sq:
+            continue
+        x_outer = math.sqrt(outer_sq - y_sq)
+        x_inner = math.sqrt(inner_sq - y_sq) if y_sq < inner_sq else 0.0
+        row_base = py * raster.width * 4
+        # 左右の弧の帯だけを走査
+        for start, stop in ((-x_outer, -x_inner), (x_inner, x_outer)):
+            for px in range(max(0, int(math.floor(start)) + extent),
+                            min(raster.width, int(math.ceil(stop)) + extent + 1)):
+                x = px - extent + 0.5
+                distance = math.sqrt(x * x + y_sq) - radius
+                if distance < 0:
+                    continue
+                intensity = glow_falloff(distance, 0.0, spread, peak)
+                if intensity > 0.02:
+                    offset = row_base + px * 4
+                    pixels[offset] = rgb[0]
+                    pixels[offset + 1] = rgb[1]
+                    pixels[offset + 2] = rgb[2]
+                    pixels[offset + 3] = int(intensity * 255)
+    return raster, -extent, -extent
+
+def angle_bucket_size(length: int, tolerance: float = 1.0) -> float:
+    """針先端のずれが tolerance (px) 以内に収まる角度の刻み幅（度）"""
+    return max(0.25, math.degrees(tolerance / max(1, length)))
+
+def glow_sprite_steps(raster_steps: Generator[None, None, Tuple[Raster, int, int]],
+                      make_image_steps: Callable[[Raster], Generator[None, None, Any]]
+                      ) -> Generator[None, None, GlowSprite]:
+    """ラスター化と画像への変換を少しずつ進めてスプライトを生成するジェネレーター"""
+    raster, offset_x, offset_y = yield from raster_steps
+    image = yield from make_image_steps(raster)
+    return GlowSprite(image, offset_x, offset_y, raster.get_nbytes())
+
+class GlowSpriteCache:
+    """発光スプライトのLRUキャッシュ - メモリ使用量を積算
+
+    上限は既定値と、レンダラーが予約した作業セット（秒針の1周分など）の合計の大きい方。
+    同じキーの作業セットを複数のレンダラーが予約しても1回分だけ数える。
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SPRITE_BUDGET_BYTES, maxsize: int = 4096,
+                 max_budget: int = MAX_SPRITE_BUDGET_BYTES):
+        self._cache = LRUCache(maxsize=maxsize, max_bytes=max_bytes,
+                               sizeof=lambda sprite: sprite.nbytes)
+        self._base_bytes = max_bytes
+        self._max_budget = max(max_bytes, max_budget)
+        # レンダラーごとの作業セット（破棄されたレンダラーの分は自動的に外れる）
+        self._reservations: "weakref.WeakKeyDictionary[Any, Dict[Hashable, int]]" = weakref.WeakKeyDictionary()
+        self._rasterized = 0
+
+    def reserve(self, owner: Any, working_sets: Dict[Hashable, int]) -> None:
+        """owner が使うスプライトの作業セット（キー → バイト数）を予約し、上限を広げる"""
+        self._reservations[owner] = dict(working_sets)
+        self._update_budget()
+
+    def release(self, owner: Any) -> None:
+        """owner の予約を解除"""
+        if self._reservations.pop(owner, None) is not None:
+            self._update_budget()
+
+    def get_max_bytes(self) -> int:
+        """現在のバイト数の上限"""
+        working_sets: Dict[Hashable, int] = {}
+        for reserved in list(self._reservations.values()):
+            working_sets.update(reserved)
+        return min(self._max_budget, max(self._base_bytes, sum(working_sets.values())))
+
+    def _update_budget(self) -> None:
+        """予約に合わせて上限を更新"""
+        self._cache.set_max_bytes(self.get_max_bytes())
+
+    def get_sprite(self, key: Hashable, rasterize: Callable[[], Tuple[Raster, int, int]],
+                   make_image: Callable[[Raster], Any]) -> GlowSprite:
+        """スプライトを取得（無ければラスター化して画像を生成）"""
+        sprite = self._cache.get(key)
+        if sprite is None:
+            raster, offset_x, offset_y = rasterize()
+            # Tk の PhotoImage も1ピクセル4バイトで保持する
+            sprite = GlowSprite(make_image(raster), offset_x, offset_y, raster.get_nbytes())
+            self.store(key, sprite)
+        return sprite
+
+    def get_cached(self, key: Hashable) -> Optional[GlowSprite]:
+        """キャッシュ済みのスプライトだけを取得（無ければ None、ミスとして数える）"""
+        return self._cache.get(key)
+
+    def peek(self, key: Hashable) -> Optional[GlowSprite]:
+        """キャッシュ済みかどうかを調べる（統計と LRU の順序は変えない）"""
+        return self._cache.peek(key)
+
+    def store(self, key: Hashable, sprite: GlowSprite) -> None:
+        """生成したスプライトを登録"""
+        self._update_budget()
+        self._cache.put(key, sprite)
+        self._rasterized += 1
+
+    def clear(self) -> None:
+        """キャッシュを破棄"""
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """キャッシュ統計（ヒット/ミス・バイト数）を取得"""
+        self._update_budget()
+        stats = self._cache.get_stats()
+        stats['rasterized'] = self._rasterized
+        return stats
+
+SpriteStepsFactory = Callable[[], Generator[None, None, GlowSprite]]
+
+class GlowSpriteWarmer:
+    """足りないスプライトをティックの合間に少しずつ生成するクラス - Producer-Consumer Pattern
+
+    描画先のウィジェットに attach すると after のタイマーで slice_ms ずつ生成を進め、
+    フレームの描画中にラスター化で止まらないようにする。表示に必要なもの（urgent）を
+    先読みより先に処理する。attach していない場合は run() を呼んだときだけ進む。
+    """
+
+    def __init__(self, cache: GlowSpriteCache, slice_ms: float = 2.0, max_pending: int = 16):
+        self._cache = cache
+        self._slice_ms = slice_ms
+        self._max_pending = max(1, max_pending)
+        self._urgent: "OrderedDict[Hashable, SpriteStepsFactory]" = OrderedDict()
+        self._pending: "OrderedDict[Hashable, SpriteStepsFactory]" = OrderedDict()
+        self._current: Optional[Tuple[Hashable, Generator[None, None, GlowSprite]]] = None
+        self._widget: Any = None
+        self._on_ready: Optional[Callable[[Hashable], None]] = None
+        self._after_id: Optional[str] = None
+        self._warmed = 0
+        self._slices = 0
+        self._dropped = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+
+    def attach(self, widget: Any, on_ready: Optional[Callable[[Hashable], None]] = None) -> None:
+        """widget のタイマーで生成を進める（on_ready は生成が終わったキーで呼ばれる）"""
+        self.detach()
+        self._widget = widget
+        self._on_ready = on_ready
+        self._schedule()
+
+    def detach(self) -> None:
+        """タイマーを止めてウィジェットから外す（待ち行列は残す）"""
+        if self._after_id is not None and self._widget is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass  # ウィジェットが既に破棄されている
+        self._after_id = None
+        self._widget = None
+        self._on_ready = None
+
+    def is_attached(self) -> bool:
+        """タイマーで生成を進めているかどうか"""
+        return self._widget is not None
+
+    def request(self, key: Hashable, steps: SpriteStepsFactory, urgent: bool = False) -> None:
+        """スプライトの生成を依頼（キャッシュ済み・依頼済みなら何もしない）"""
+        if self._cache.peek(key) is not None or (self._current is not None and self._current[0] == key):
+            return
+        queue = self._urgent if urgent else self._pending
+        if key in queue:
+            return
+        if urgent:
+            self._pending.pop(key, None)
+        elif key in self._urgent:
+            return
+        queue[key] = steps
+        # 古い依頼から捨てる（先読みは角度が進むと不要になる）
+        while len(queue) > self._max_pending:
+            queue.popitem(last=False)
+            self._dropped += 1
+        self._schedule()
+
+    def has_work(self) -> bool:
+        """生成中・依頼中のスプライトがあるかどうか"""
+        return self._current is not None or bool(self._urgent) or bool(self._pending)
+
+    def clear(self) -> None:
+        """生成中・依頼中のスプライトを破棄"""
+        self._urgent.clear()
+        self._pending.clear()
+        self._current = None
+
+    def run(self, budget_ms: Optional[float] = None) -> bool:
+        """budget_ms（None なら無制限）の範囲で生成を進め、残りがあるかどうかを返す"""
+        deadline = time.perf_counter() + budget_ms / 1000.0 if budget_ms is not None else None
+        while True:
+            if self._current is None and not self._start_next():
+                return False
+            key, steps = self._current
+            try:
+                next(steps)
+            except StopIteration as finished:
+                self._current = None
+                self._cache.store(key, finished.value)
+                self._warmed += 1
+                if self._on_ready is not None:
+                    self._on_ready(key)
+                continue
+            if deadline is not None and time.perf_counter() >= deadline:
+                return True
+
+    def _start_next(self) -> bool:
+        """次の依頼の生成を始める（無ければ False）"""
+        for queue in (self._urgent, self._pending):
+            while queue:
+                key, steps = queue.popitem(last=False)
+                if self._cache.peek(key) is None:
+                    self._current = (key, steps())
+                    return True
+        return False
+
+    def _schedule(self) -> None:
+        """残りがあればタイマーを登録（after_idle はフレーム中の update_idletasks で走るため使わない）"""
+        if self._widget is None or self._after_id is not None or not self.has_work():
+            return
+        try:
+            self._after_id = self._widget.after(1, self._on_timer)
+        except Exception:
+            self._after_id = None  # ウィジェットが既に破棄されている
+
+    def _on_timer(self) -> None:
+        """タイマー: slice_ms だけ生成を進める"""
+        self._after_id = None
+        self._slices += 1
+        try:
+            self.run(self._slice_ms)
+        except Exception as error:
+            # 生成中のスプライトだけを諦めて残りを続ける
+            self._current = None
+            self._errors += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+        self._schedule()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """生成の統計（生成数・待ち行列・タイマーの回数）を取得"""
+        return {
+            'warmed': self._warmed,
+            'pending': len(self._urgent) + len(self._pending) + (1 if self._current is not None else 0),
+            'slices': self._slices,
+            'dropped': self._dropped,
+            'errors': self._errors,
+            'last_error': self._last_error
+        }
+
+# 全レンダラーで共有するスプライトキャッシュ
+_sprite_cache = GlowSpriteCache()
+
+def get_glow_sprite_cache() -> GlowSpriteCache:
+    """共有スプライトキャッシュを取得"""
+    return _sprite_cache
@@ -0,0 +1,153 @@
+import math
+from array import array
+from typing import Any, NamedTuple, Sequence, Tuple, Union
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy は任意（無ければ array を使った純 Python で計算）
+    _np = None
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 針の長さ（ベースサイズ150の半径に対する長さ）
+HOUR_HAND_LENGTH = 80
+MINUTE_HAND_LENGTH = 110
+SECOND_HAND_LENGTH = 120
+
+Number = Union[int, float]
+NumberOrSequence = Union[Number, Sequence[Number]]
+
+def hand_angles(hours: int, minutes: int, seconds: float) -> Tuple[float, float, float]:
+    """時・分・秒から (時針, 分針, 秒針) の角度（12時から時計回りの度）を計算"""
+    hour_angle = hours * 30 + minutes * 0.5  # 時針: 30度/時間 + 滑らかな動き
+    minute_angle = minutes * 6 + seconds * 0.1  # 分針: 6度/分 + 滑らかな動き
+    second_angle = seconds * 6  # 秒針: 6度/秒
+    return hour_angle, minute_angle, second_angle
+
+def hand_end_point(center_x: float, center_y: float, angle: float, length: float) -> Tuple[float, float]:
+    """針の先端座標を計算"""
+    angle_rad = math.radians(90 - angle)
+    return center_x + length * math.cos(angle_rad), center_y - length * math.sin(angle_rad)
+
+def hand_lengths(radius: int) -> Tuple[int, int, int]:
+    """半径に応じた (時針, 分針, 秒針) の長さ"""
+    scale_factor = radius / 150
+    return (int(HOUR_HAND_LENGTH * scale_factor), int(MINUTE_HAND_LENGTH * scale_factor),
+            int(SECOND_HAND_LENGTH * scale_factor))
+
+class HandEndpoints(NamedTuple):
+    """多数の時刻の針の角度と先端座標（各フィールドは入力と同じ長さの配列）"""
+    hour_angle: Any
+    minute_angle: Any
+    second_angle: Any
+    hour_x: Any
+    hour_y: Any
+    minute_x: Any
+    minute_y: Any
+    second_x: Any
+    second_y: Any
+
+def has_numpy() -> bool:
+    """NumPy が使えるかどうか"""
+    return _np is not None
+
+def compute_hand_endpoints(seconds_of_day: Sequence[float], center_x: NumberOrSequence = 175,
+                           center_y: NumberOrSequence = 175, radius: NumberOrSequence = 150,
+                           smooth: bool = True, backend: str = 'auto') -> HandEndpoints:
+    """多数の時刻（0時からの秒）の針の先端座標をまとめて計算
+
+    中心と半径は時刻ごとの配列、または全時刻で共通の値を指定できる。smooth が False なら
+    秒の小数部を切り捨てる（1秒ごとに動く時計と同じ）。結果は render_hands と同じ計算式による。
+    backend: 'numpy'（NumPy 配列を返す）, 'python'（array('d') を返す）, 'auto'（NumPy があれば numpy）
+    """
+    if backend == 'auto':
+        backend = 'numpy' if _np is not None else 'python'
+    if backend == 'numpy':
+        if _np is None:
+            raise RuntimeError("NumPy is not installed")
+        return _compute_numpy(seconds_of_day, center_x, center_y, radius, smooth)
+    if backend == 'python':
+        return _compute_python(seconds_of_day, center_x, center_y, radius, smooth)
+    raise ValueError(f"Unknown backend: {backend}")
+
+def _compute_numpy(seconds_of_day: Sequence[float], center_x: NumberOrSequence, center_y: NumberOrSequence,
+                   radius: NumberOrSequence, smooth: bool) -> HandEndpoints:
+    """NumPy で配列全体を一度に計算"""
+    np = _np
+    times = np.asarray(seconds_of_day, dtype=np.float64) % SECONDS_PER_DAY
+    hours = (times // 3600) % 12
+    minutes = (times % 3600) // 60
+    seconds = times % 60
+    if not smooth:
+        seconds = np.floor(seconds)
+    hour_angle = hours * 30 + minutes * 0.5
+    minute_angle = minutes * 6 + seconds * 0.1
+    second_angle = seconds * 6
+
+    center_x = np.asarray(center_x, dtype=np.float64)
+    center_y = np.asarray(center_y, dtype=np.float64)
+    scale_factor = np.asarray(radius, dtype=np.float64) / 150
+
+    def end_points(angle, length):
+        angle_rad = np.radians(90 - angle)
+        return center_x + length * np.cos(angle_rad), center_y - length * np.sin(angle_rad)
+
+    hour_x, hour_y = end_points(hour_angle, np.floor(HOUR_HAND_LENGTH * scale_factor))
+    minute_x, minute_y = end_points(minute_angle, np.floor(MINUTE_HAND_LENGTH * scale_factor))
+    second_x, second_y = end_points(second_angle, np.floor(SECOND_HAND_LENGTH * scale_factor))
+    return HandEndpoints(hour_angle, minute_angle, second_angle,
+                         hour_x, hour_y, minute_x, minute_y, second_x, second_y)
+
+def _column(value: NumberOrSequence, count: int) -> Sequence[float]:
+    """共通の値または配列を、長さ count の列として参照できるようにする"""
+    if isinstance(value, (int, float)):
+        return array('d', [value]) * count
+    if len(value) != count:
+        raise ValueError(f"Expected {count} values, got {len(value)}")
+    return value
+
+def _compute_python(seconds_of_day: Sequence[float], center_x: NumberOrSequence, center_y: NumberOrSequence,
+                    radius: NumberOrSequence, smooth: bool) -> HandEndpoints:
+    """array('d') に書き込みながら1時刻ずつ計算（NumPy が無い環境向け）"""
+    count = len(seconds_of_day)
+    centers_x = _column(center_x, count)
+    centers_y = _column(center_y, count)
+    radii = _column(radius, count)
+    columns = [array('d', bytes(8 * count)) for _ in HandEndpoints._fields]
+    hour_angles, minute_angles, second_angles, hour_xs, hour_ys, minute_xs, minute_ys, second_xs, second_ys = columns
+
+    radians, cos, sin = math.radians, math.cos, math.sin
+    lengths_cache = {}
+    for index in range(count):
+        time_of_day = seconds_of_day[index] % SECONDS_PER_DAY
+        hours = (time_of_day // 3600) % 12
+        minutes = (time_of_day % 3600) // 60
+        seconds = time_of_day % 60
+        if not smooth:
+            seconds = float(int(seconds))
+        hour_angle = hours * 30 + minutes * 0.5
+        minute_angle = minutes * 6 + seconds * 0.1
+        second_angle = seconds * 6
+
+        radius_value = radii[index]
+        lengths = lengths_cache.get(radius_value)
+        if lengths is None:
+            lengths = hand_lengths(radius_value)
+            lengths_cache[radius_value] = lengths
+        hour_length, minute_length, second_length = lengths
+        x = centers_x[index]
+        y = centers_y[index]
+
+        hour_angles[index] = hour_angle
+        minute_angles[index] = minute_angle
+        second_angles[index] = second_angle
+        angle_rad = radians(90 - hour_angle)
+        hour_xs[index] = x + hour_length * cos(angle_rad)
+        hour_ys[index] = y - hour_length * sin(angle_rad)
+        angle_rad = radians(90 - minute_angle)
+        minute_xs[index] = x + minute_length * cos(angle_rad)
+        minute_ys[index] = y - minute_length * sin(angle_rad)
+        angle_rad = radians(90 - second_angle)
+        second_xs[index] = x + second_length * cos(angle_rad)
+        second_ys[index] = y - second_length * sin(angle_rad)
+    return HandEndpoints(*columns)
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class LRUCache:
+    """容量制限付きLRUキャッシュ - ヒット/ミス数を記録
+
+    sizeof を指定するとエントリのバイト数を積算し、max_bytes を超えた分も古い順に破棄する。
+    """
+
+    def __init__(self, maxsize: int = 32, max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        self._maxsize = max(1, maxsize)
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """値を取得（見つからなければ None）"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """値を登録し、容量を超えた古いエントリを破棄"""
+        if key in self._entries:
+            self._bytes -= self._sizes.pop(key, 0)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self._sizeof is not None:
+            size = self._sizeof(value)
+            self._sizes[key] = size
+            self._bytes += size
+        self._evict()
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """値を取得（ヒット/ミス数と LRU の順序は変えない）"""
+        return self._entries.get(key)
+
+    def set_max_bytes(self, max_bytes: Optional[int]) -> None:
+        """バイト数の上限を変更し、超えた分の古いエントリを破棄"""
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def _evict(self) -> None:
+        """容量を超えた古いエントリを破棄（最新の1つは残す）"""
+        while len(self._entries) > self._maxsize or self._over_budget():
+            if len(self._entries) == 1:
+                break
+            evicted, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(evicted, 0)
+            self._evictions += 1
+
+    def _over_budget(self) -> bool:
+        """バイト数の上限を超えているか"""
+        return self._max_bytes is not None and self._bytes > self._max_bytes
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """値を取得し、無ければ factory で生成して登録"""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄"""
+        self._entries.clear()
+        self._sizes.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, int]:
+        """キャッシュ統計を取得"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'size': len(self._entries),
+            'maxsize': self._maxsize,
+            'bytes': self._bytes,
+            'max_bytes': self._max_bytes or 0
+        }
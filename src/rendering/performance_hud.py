@@ -0,0 +1,179 @@
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+def get_process_rss() -> Optional[int]:
+    """プロセスの常駐メモリ（RSS, バイト）を取得（取得できなければ None）"""
+    try:
+        # Linux: 2列目が常駐ページ数
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if sys.platform == 'win32':
+        return _get_windows_working_set()
+    return None
+
+def _get_windows_working_set() -> Optional[int]:
+    """Windows: psapi の GetProcessMemoryInfo でワーキングセットを取得"""
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        kernel32 = ctypes.windll.kernel32
+        psapi = ctypes.windll.psapi
+        kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+        psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    except (AttributeError, OSError, ImportError):
+        pass
+    return None
+
+class FrameSampler:
+    """表示の更新間隔ごとにフレーム時間とティック遅延を集計するクラス"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._reset(clock())
+
+    def _reset(self, now: float) -> None:
+        self._window_start = now
+        self._frames = 0
+        self._frame_total_ms = 0.0
+        self._frame_max_ms = 0.0
+        self._lateness_max_ms = 0.0
+        self._last_lateness_ms = 0.0
+
+    def record(self, frame_ms: float, lateness_ms: float = 0.0) -> None:
+        """1フレームを記録"""
+        self._frames += 1
+        self._frame_total_ms += frame_ms
+        if frame_ms > self._frame_max_ms:
+            self._frame_max_ms = frame_ms
+        if lateness_ms > self._lateness_max_ms:
+            self._lateness_max_ms = lateness_ms
+        self._last_lateness_ms = lateness_ms
+
+    def take(self) -> Dict[str, float]:
+        """前回から今回までの集計を取得して次の区間を開始"""
+        now = self._clock()
+        elapsed = now - self._window_start
+        frames = self._frames
+        sample = {
+            'frames': frames,
+            'fps': frames / elapsed if elapsed > 0 else 0.0,
+            'frame_mean_ms': self._frame_total_ms / frames if frames else 0.0,
+            'frame_max_ms': self._frame_max_ms,
+            'lateness_ms': self._last_lateness_ms,
+            'lateness_max_ms': self._lateness_max_ms
+        }
+        self._reset(now)
+        return sample
+
+class PerformanceHud:
+    """時計のキャンバスに重ねて表示する性能情報 - Single Responsibility Principle
+
+    フレーム時間・ティック遅延・実際の更新レート・キャンバスのアイテム数・RSS を
+    低いレート（既定 2Hz）で書き換える。テキストは既存アイテムの itemconfigure で更新し、
+    測定対象のフレームに割り込まないよう描画は自身のタイマーで行う。
+    """
+
+    TAG = 'performance-hud'
+
+    def __init__(self, canvas: Any, interval_ms: int = 500):
+        self._canvas = canvas
+        self._interval_ms = interval_ms
+        self._sampler = FrameSampler()
+        self._after_id: Optional[str] = None
+        self._background: Optional[int] = None
+        self._text: Optional[int] = None
+        self._last_sample: Dict[str, Any] = {}
+
+    def record_frame(self, frame_ms: float, lateness_ms: float = 0.0) -> None:
+        """1フレーム分の計測値を記録（表示は次の更新時）"""
+        self._sampler.record(frame_ms, lateness_ms)
+
+    def start(self) -> None:
+        """表示を開始"""
+        if self._after_id is None:
+            self._sampler.take()
+            self._update()
+
+    def stop(self) -> None:
+        """表示を終了してアイテムを削除"""
+        if self._after_id is not None:
+            try:
+                self._canvas.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        try:
+            self._canvas.delete(self.TAG)
+        except Exception:
+            pass
+        self._background = None
+        self._text = None
+
+    def is_running(self) -> bool:
+        """表示中かどうか"""
+        return self._after_id is not None
+
+    def _update(self) -> None:
+        """集計を取得して表示を書き換え、次の更新を予約"""
+        sample = self._sampler.take()
+        self._ensure_items()
+        # HUD 自身のアイテムは数えない
+        sample['items'] = max(0, len(self._canvas.find_all()) - 2)
+        sample['rss'] = get_process_rss()
+        self._last_sample = sample
+        self._canvas.itemconfigure(self._text, text=self.format_sample(sample))
+        x0, y0, x1, y1 = self._canvas.bbox(self._text) or (0, 0, 0, 0)
+        self._canvas.coords(self._background, x0 - 4, y0 - 3, x1 + 4, y1 + 3)
+        # 針や文字盤が後から作られても常に最前面に表示
+        self._canvas.tag_raise(self.TAG)
+        self._after_id = self._canvas.after(self._interval_ms, self._update)
+
+    def _ensure_items(self) -> None:
+        """表示用のアイテムを生成（文字盤の再描画で消された場合も作り直す）"""
+        if self._text is not None and self._canvas.find_withtag(self.TAG):
+            return
+        self._canvas.delete(self.TAG)
+        self._background = self._canvas.create_rectangle(
+            0, 0, 0, 0, fill='#000000', outline='#00c000', tags=self.TAG)
+        self._text = self._canvas.create_text(
+            8, 6, anchor='nw', text='', fill='#00ff66', font=('Courier', 9), tags=self.TAG)
+
+    @staticmethod
+    def format_sample(sample: Dict[str, Any]) -> str:
+        """集計を表示用の複数行テキストに整形"""
+        rss = sample.get('rss')
+        lines: List[str] = [
+            f"frame {sample['frame_mean_ms']:6.2f} ms (max {sample['frame_max_ms']:6.2f})",
+            f"late  {sample['lateness_ms']:6.2f} ms (max {sample['lateness_max_ms']:6.2f})",
+            f"rate  {sample['fps']:6.1f} /s",
+            f"items {sample['items']:6d}",
+            f"rss   {rss / (1024 * 1024):6.1f} MB" if rss is not None else "rss      n/a"
+        ]
+        return "\n".join(lines)
+
+    def get_last_sample(self) -> Dict[str, Any]:
+        """直近に表示した集計を取得"""
+        return dict(self._last_sample)
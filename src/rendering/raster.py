@@ -0,0 +1,133 @@
+from typing import Any, Dict, Generator, Tuple
+
+RGB = Tuple[int, int, int]
+
+def parse_color(color: str) -> RGB:
+    """'#rgb' / '#rrggbb' 形式の色を (r, g, b) に変換"""
+    value = color.lstrip('#')
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+def format_color(rgb: RGB) -> str:
+    """(r, g, b) を '#rrggbb' 形式に変換"""
+    return '#%02x%02x%02x' % rgb
+
+def blend_over(pixels: bytearray, offset: int, rgb: RGB, coverage: float) -> None:
+    """RGBA ピクセルに色を coverage（0〜1）の不透明度で重ねる"""
+    if coverage >= 1.0:
+        pixels[offset:offset + 4] = bytes((rgb[0], rgb[1], rgb[2], 255))
+        return
+    dest_alpha = pixels[offset + 3] / 255.0
+    keep = dest_alpha * (1.0 - coverage)
+    alpha = coverage + keep
+    if alpha <= 0.0:
+        return
+    for channel in range(3):
+        pixels[offset + channel] = int((rgb[channel] * coverage + pixels[offset + channel] * keep) / alpha + 0.5)
+    pixels[offset + 3] = int(alpha * 255 + 0.5)
+
+class Raster:
+    """RGBA 8bit のピクセルバッファ（Tk や PIL に依存しない）"""
+
+    __slots__ = ('width', 'height', 'pixels')
+
+    def __init__(self, width: int, height: int):
+        self.width = max(1, width)
+        self.height = max(1, height)
+        self.pixels = bytearray(self.width * self.height * 4)
+
+    def set_pixel(self, x: int, y: int, rgb: RGB, alpha: int) -> None:
+        """ピクセルを設定"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            offset = (y * self.width + x) * 4
+            self.pixels[offset:offset + 4] = bytes((rgb[0], rgb[1], rgb[2], alpha))
+
+    def blend_pixel(self, x: int, y: int, rgb: RGB, coverage: float) -> None:
+        """ピクセルに色を coverage（0〜1）の不透明度で重ねる（source-over 合成）"""
+        if 0 <= x < self.width and 0 <= y < self.height and coverage > 0.0:
+            blend_over(self.pixels, (y * self.width + x) * 4, rgb, coverage)
+
+    def fill_row(self, y: int, x0: int, x1: int, rgb: RGB) -> None:
+        """行の区間 [x0, x1) を不透明な色で塗りつぶす"""
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if 0 <= y < self.height and x0 < x1:
+            offset = (y * self.width + x0) * 4
+            self.pixels[offset:offset + (x1 - x0) * 4] = bytes((rgb[0], rgb[1], rgb[2], 255)) * (x1 - x0)
+
+    def composite(self, source: "Raster", left: int, top: int) -> None:
+        """別のラスターを (left, top) の位置に重ねる"""
+        src = source.pixels
+        for sy in range(source.height):
+            y = top + sy
+            if not 0 <= y < self.height:
+                continue
+            for x0, x1 in source.iter_row_spans(sy):
+                for sx in range(x0, x1):
+                    x = left + sx
+                    if 0 <= x < self.width:
+                        offset = (sy * source.width + sx) * 4
+                        blend_over(self.pixels, (y * self.width + x) * 4,
+                                   (src[offset], src[offset + 1], src[offset + 2]), src[offset + 3] / 255.0)
+
+    def get_nbytes(self) -> int:
+        """ピクセルバッファのバイト数"""
+        return len(self.pixels)
+
+    def iter_row_spans(self, y: int):
+        """行内の不透明（alpha > 0）な連続区間を (x0, x1) で列挙"""
+        row = self.pixels
+        base = y * self.width * 4
+        x = 0
+        width = self.width
+        while x < width:
+            while x < width and row[base + x * 4 + 3] == 0:
+                x += 1
+            start = x
+            while x < width and row[base + x * 4 + 3] != 0:
+                x += 1
+            if start < x:
+                yield start, x
+
+def run_steps(steps: Generator[None, None, Any]) -> Any:
+    """中断可能な処理（*_steps のジェネレーター）を最後まで実行して戻り値を返す"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+def raster_to_photo_image(raster: Raster, master: Any, matte: str = '#000000') -> Any:
+    """ラスターを tk.PhotoImage に変換
+
+    Tk 8.6 の put は半透明を扱えないため、alpha は matte（下地の色）と合成し、
+    alpha = 0 のピクセルは透明のまま残す。
+    """
+    return run_steps(raster_to_photo_image_steps(raster, master, matte))
+
+def raster_to_photo_image_steps(raster: Raster, master: Any, matte: str = '#000000') -> Generator[None, None, Any]:
+    """raster_to_photo_image を1行ごとに中断できるジェネレーター（戻り値が tk.PhotoImage）"""
+    import tkinter as tk
+    image = tk.PhotoImage(master=master, width=raster.width, height=raster.height)
+    matte_rgb = parse_color(matte)
+    blended: Dict[bytes, str] = {}
+    pixels = raster.pixels
+    for y in range(raster.height):
+        yield
+        for x0, x1 in raster.iter_row_spans(y):
+            colors = []
+            offset = (y * raster.width + x0) * 4
+            for _ in range(x0, x1):
+                key = bytes(pixels[offset:offset + 4])
+                color = blended.get(key)
+                if color is None:
+                    alpha = key[3] / 255.0
+                    color = format_color(tuple(
+                        int(round(m + (c - m) * alpha)) for c, m in zip(key[:3], matte_rgb)
+                    ))
+                    blended[key] = color
+                colors.append(color)
+                offset += 4
+            image.put('{' + ' '.join(colors) + '}', to=(x0, y))
+    return image
@@ -0,0 +1,78 @@
+from typing import Dict
+
+class RenderStats:
+    """描画統計クラス - キャンバスアイテムの生成/削除数と針の更新/省略数を記録"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """統計をリセット"""
+        self._frames = 0
+        self._created_total = 0
+        self._deleted_total = 0
+        self._frame_created = 0
+        self._frame_deleted = 0
+        self._updated_total = 0
+        self._skipped_total = 0
+        self._frame_skipped = 0
+        self._faces_scaled = 0
+        self._faces_rebuilt = 0
+        self._face_items_restyled = 0
+        self._face_items_recreated = 0
+
+    def begin_frame(self) -> None:
+        """フレーム（1ティック）の計測を開始"""
+        self._frames += 1
+        self._frame_created = 0
+        self._frame_deleted = 0
+        self._frame_skipped = 0
+
+    def record_created(self, count: int = 1) -> None:
+        """生成したアイテム数を記録"""
+        self._created_total += count
+        self._frame_created += count
+
+    def record_deleted(self, count: int = 1) -> None:
+        """削除したアイテム数を記録"""
+        self._deleted_total += count
+        self._frame_deleted += count
+
+    def record_hand_updated(self) -> None:
+        """座標を更新した針を記録"""
+        self._updated_total += 1
+
+    def record_hand_skipped(self) -> None:
+        """角度が変わらず更新を省略した針を記録"""
+        self._skipped_total += 1
+        self._frame_skipped += 1
+
+    def record_face_scaled(self) -> None:
+        """サイズ変更で文字盤のアイテムを変形して使い回したことを記録"""
+        self._faces_scaled += 1
+
+    def record_face_rebuilt(self) -> None:
+        """サイズ変更で文字盤のアイテムを作り直したことを記録"""
+        self._faces_rebuilt += 1
+
+    def record_face_restyled(self, restyled: int, recreated: int) -> None:
+        """テーマ変更で属性を変更した文字盤アイテム数と、生成し直したアイテム数を記録"""
+        self._face_items_restyled += restyled
+        self._face_items_recreated += recreated
+
+    def get_stats(self) -> Dict[str, int]:
+        """統計を取得"""
+        return {
+            'frames': self._frames,
+            'created_total': self._created_total,
+            'deleted_total': self._deleted_total,
+            'last_frame_created': self._frame_created,
+            'last_frame_deleted': self._frame_deleted,
+            'hands_updated_total': self._updated_total,
+            'hands_skipped_total': self._skipped_total,
+            'last_frame_skipped': self._frame_skipped,
+            'faces_scaled_total': self._faces_scaled,
+            'faces_rebuilt_total': self._faces_rebuilt,
+            'face_items_restyled_total': self._face_items_restyled,
+            'face_items_recreated_total': self._face_items_recreated
+        }
@@ -0,0 +1,30 @@
+from typing import List
+from ..interfaces.renderer_interface import IRenderer
+
+def _create_canvas_renderer() -> IRenderer:
+    """Tk キャンバス用レンダラーを生成"""
+    from .analog_clock_renderer import AnalogClockRenderer
+    return AnalogClockRenderer()
+
+def _create_display_list_renderer() -> IRenderer:
+    """ヘッドレスのディスプレイリスト用レンダラーを生成"""
+    from .display_list_renderer import DisplayListRenderer
+    return DisplayListRenderer()
+
+# レンダラー種別 -> 生成関数（使用時にだけ実装モジュールを読み込む）
+_RENDERER_FACTORIES = {
+    'canvas': _create_canvas_renderer,
+    'display_list': _create_display_list_renderer
+}
+
+def create_renderer(renderer_type: str = 'canvas') -> IRenderer:
+    """種別名からレンダラーを生成"""
+    try:
+        factory = _RENDERER_FACTORIES[renderer_type]
+    except KeyError:
+        raise ValueError(f"Unknown renderer type: {renderer_type}") from None
+    return factory()
+
+def get_renderer_types() -> List[str]:
+    """利用可能なレンダラー種別の一覧を取得"""
+    return list(_RENDERER_FACTORIES.keys())
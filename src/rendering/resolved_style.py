@@ -0,0 +1,37 @@
+from typing import Dict, NamedTuple, Tuple
+from ..themes.theme_style import ThemeStyle
+from .dial_geometry import numeral_font_size
+from .lru_cache import LRUCache
+
+class ResolvedStyle(NamedTuple):
+    """半径に合わせて解決済みのスタイル - 不変オブジェクト"""
+    style: ThemeStyle
+    radius: int
+    numeral_font: Tuple[str, int, str]
+    hour_width: int
+    minute_width: int
+    second_width: int
+
+_resolved_cache = LRUCache(maxsize=64)
+
+def resolve_style(style: ThemeStyle, radius: int) -> ResolvedStyle:
+    """スタイルを半径に合わせて解決（(スタイル, 半径) ごとにキャッシュ）"""
+    key = (style, radius)
+    resolved = _resolved_cache.get(key)
+    if resolved is None:
+        # サイズに応じて針の太さを調整（ベースサイズ150で正規化）
+        scale_factor = radius / 150
+        resolved = ResolvedStyle(
+            style=style,
+            radius=radius,
+            numeral_font=(style.font_family, numeral_font_size(radius, style.compact_dial), style.font_weight),
+            hour_width=max(1, int(style.hour_width * scale_factor)),
+            minute_width=max(1, int(style.minute_width * scale_factor)),
+            second_width=max(1, int(style.second_width * scale_factor))
+        )
+        _resolved_cache.put(key, resolved)
+    return resolved
+
+def get_resolved_style_cache_stats() -> Dict[str, int]:
+    """解決済みスタイルキャッシュのヒット/ミス数を取得"""
+    return _resolved_cache.get_stats()
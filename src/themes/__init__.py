@@ -1,23 +1,34 @@
 # Theme system components
+# 各要素は初回アクセス時に読み込む（PEP 562）。使わないテーマを起動時に読み込まないため
 
-from .theme_manager import ThemeManager
-from .base_theme import BaseTheme
-from .concrete_themes import (
-    ModernTheme,
-    ClassicTheme,
-    DarkTheme,
-    LightTheme,
-    NeonTheme,
-    MinimalTheme
-)
+from importlib import import_module
+from typing import Any, Dict, List
 
-__all__ = [
-    'ThemeManager',
-    'BaseTheme',
-    'ModernTheme',
-    'ClassicTheme',
-    'DarkTheme',
-    'LightTheme',
-    'NeonTheme',
-    'MinimalTheme'
-]
\ No newline at end of file
+# 公開名 -> 定義モジュール
+_LAZY_EXPORTS: Dict[str, str] = {
+    'ThemeManager': '.theme_manager',
+    'BaseTheme': '.base_theme',
+    'ThemeStyle': '.theme_style',
+    'compile_theme_style': '.theme_style',
+    'ModernTheme': '.concrete_themes',
+    'ClassicTheme': '.concrete_themes',
+    'DarkTheme': '.concrete_themes',
+    'LightTheme': '.concrete_themes',
+    'NeonTheme': '.concrete_themes',
+    'MinimalTheme': '.concrete_themes'
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    """公開名を初回アクセス時に読み込む"""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
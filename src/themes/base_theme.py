@@ -1,6 +1,7 @@
 from abc import ABC
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..interfaces.theme_interface import ITheme
+from .theme_style import ThemeStyle, DEFAULT_CAPABILITIES, compile_theme_style
 
 class BaseTheme(ITheme):
     """テーマのベースクラス - Template Method Pattern"""
@@ -10,6 +11,8 @@ class BaseTheme(ITheme):
         self._colors = self._define_colors()
         self._font_settings = self._define_font_settings()
         self._hand_settings = self._define_hand_settings()
+        self._capabilities = self._define_capabilities()
+        self._style: Optional[ThemeStyle] = None
     
     def get_name(self) -> str:
         return self._name
@@ -23,6 +26,18 @@ class BaseTheme(ITheme):
     def get_hand_settings(self) -> Dict[str, Any]:
         return self._hand_settings.copy()
     
+    def get_style(self) -> ThemeStyle:
+        """コンパイル済みのスタイルを取得（初回のみ生成）"""
+        if self._style is None:
+            self._style = compile_theme_style(
+                self._name,
+                self._colors,
+                self._font_settings,
+                self._hand_settings,
+                self._capabilities
+            )
+        return self._style
+    
     def apply_special_effects(self, canvas, draw_func, *args, **kwargs) -> Any:
         """デフォルトでは特殊効果なし"""
         return draw_func(*args, **kwargs)
@@ -57,4 +72,8 @@ class BaseTheme(ITheme):
             'hour_width': 6,
             'minute_width': 4,
             'second_width': 2
-        }
\ No newline at end of file
+        }
+    
+    def _define_capabilities(self) -> Dict[str, bool]:
+        """機能フラグを定義（分の目盛り・発光効果・コンパクトな文字盤）"""
+        return dict(DEFAULT_CAPABILITIES)
\ No newline at end of file
@@ -113,6 +113,11 @@ class NeonTheme(BaseTheme):
             'outline': '#333333'
         }
     
+    def _define_capabilities(self) -> Dict[str, bool]:
+        capabilities = super()._define_capabilities()
+        capabilities['has_glow'] = True
+        return capabilities
+    
     def apply_special_effects(self, canvas, draw_func, *args, **kwargs) -> Any:
         """ネオン発光効果を適用"""
         # 発光効果のために複数回描画
@@ -158,4 +163,10 @@ class MinimalTheme(BaseTheme):
             'hour_width': 4,
             'minute_width': 2,
             'second_width': 1
-        }
\ No newline at end of file
+        }
+    
+    def _define_capabilities(self) -> Dict[str, bool]:
+        capabilities = super()._define_capabilities()
+        capabilities['has_minute_marks'] = False
+        capabilities['compact_dial'] = True
+        return capabilities
\ No newline at end of file
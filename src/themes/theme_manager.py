@@ -1,51 +1,77 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from ..interfaces.theme_interface import ITheme
-from .concrete_themes import (
-    ModernTheme,
-    ClassicTheme,
-    DarkTheme,
-    LightTheme,
-    NeonTheme,
-    MinimalTheme
-)
+
+def _concrete_theme_factory(class_name: str) -> Callable[[], ITheme]:
+    """組み込みテーマの生成関数（呼び出されたときにテーマ実装を読み込む）"""
+    def create() -> ITheme:
+        from . import concrete_themes
+        return getattr(concrete_themes, class_name)()
+    return create
+
+# 組み込みテーマ（表示名, クラス名）- 表示順
+_DEFAULT_THEMES: List[Tuple[str, str]] = [
+    ("モダン", "ModernTheme"),
+    ("クラシック", "ClassicTheme"),
+    ("ダーク", "DarkTheme"),
+    ("ライト", "LightTheme"),
+    ("ネオン", "NeonTheme"),
+    ("ミニマル", "MinimalTheme")
+]
 
 class ThemeManager:
-    """テーマ管理クラス - Open/Closed Principle"""
+    """テーマ管理クラス - Open/Closed Principle
+    
+    組み込みテーマは名前と生成関数だけを登録し、初めて取得されたときに生成する。
+    """
     
     def __init__(self):
         self._themes: Dict[str, ITheme] = {}
+        self._factories: Dict[str, Callable[[], ITheme]] = {}
+        self._order: List[str] = []
         self._register_default_themes()
     
     def _register_default_themes(self) -> None:
         """デフォルトテーマを登録"""
-        default_themes = [
-            ModernTheme(),
-            ClassicTheme(),
-            DarkTheme(),
-            LightTheme(),
-            NeonTheme(),
-            MinimalTheme()
-        ]
-        
-        for theme in default_themes:
-            self.register_theme(theme)
+        for theme_name, class_name in _DEFAULT_THEMES:
+            self.register_theme_factory(theme_name, _concrete_theme_factory(class_name))
     
     def register_theme(self, theme: ITheme) -> None:
         """テーマを登録 - Open/Closed Principle"""
-        self._themes[theme.get_name()] = theme
+        name = theme.get_name()
+        self._factories.pop(name, None)
+        self._themes[name] = theme
+        if name not in self._order:
+            self._order.append(name)
+    
+    def register_theme_factory(self, theme_name: str, factory: Callable[[], ITheme]) -> None:
+        """テーマを生成関数で登録（初めて取得されたときに生成）"""
+        self._themes.pop(theme_name, None)
+        self._factories[theme_name] = factory
+        if theme_name not in self._order:
+            self._order.append(theme_name)
     
     def unregister_theme(self, theme_name: str) -> None:
         """テーマを削除"""
         self._themes.pop(theme_name, None)
+        self._factories.pop(theme_name, None)
+        if theme_name in self._order:
+            self._order.remove(theme_name)
     
     def get_theme(self, theme_name: str) -> Optional[ITheme]:
         """テーマを取得"""
-        return self._themes.get(theme_name)
+        theme = self._themes.get(theme_name)
+        if theme is None:
+            factory = self._factories.pop(theme_name, None)
+            if factory is None:
+                return None
+            theme = factory()
+            self._themes[theme_name] = theme
+        return theme
     
     def get_theme_names(self) -> List[str]:
         """テーマ名一覧を取得"""
-        return list(self._themes.keys())
+        return list(self._order)
     
     def get_all_themes(self) -> Dict[str, ITheme]:
         """すべてのテーマを取得"""
-        return self._themes.copy()
\ No newline at end of file
+        return {theme_name: self.get_theme(theme_name) for theme_name in self._order}
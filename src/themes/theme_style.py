@@ -0,0 +1,65 @@
+from typing import Any, Dict, NamedTuple
+
+class ThemeStyle(NamedTuple):
+    """コンパイル済みのテーマスタイル - 不変オブジェクト（属性アクセスのみ）"""
+    name: str
+    # 色
+    bg: str
+    canvas_bg: str
+    face: str
+    hour_hand: str
+    minute_hand: str
+    second_hand: str
+    numbers: str
+    marks: str
+    center: str
+    digital_fg: str
+    outline: str
+    # フォント
+    font_family: str
+    font_size: int
+    font_weight: str
+    # 針の太さ（半径150基準）
+    hour_width: int
+    minute_width: int
+    second_width: int
+    # 機能フラグ（カスタムテーマはここで振る舞いを選択する）
+    has_minute_marks: bool
+    has_glow: bool
+    compact_dial: bool
+
+# テーマが機能フラグを定義しない場合の既定値
+DEFAULT_CAPABILITIES: Dict[str, bool] = {
+    'has_minute_marks': True,
+    'has_glow': False,
+    'compact_dial': False
+}
+
+def compile_theme_style(name: str, colors: Dict[str, str], font_settings: Dict[str, Any],
+                        hand_settings: Dict[str, Any], capabilities: Dict[str, bool]) -> ThemeStyle:
+    """テーマの各設定辞書からスタイルオブジェクトを生成"""
+    flags = dict(DEFAULT_CAPABILITIES)
+    flags.update(capabilities)
+    return ThemeStyle(
+        name=name,
+        bg=colors['bg'],
+        canvas_bg=colors['canvas_bg'],
+        face=colors['face'],
+        hour_hand=colors['hour_hand'],
+        minute_hand=colors['minute_hand'],
+        second_hand=colors['second_hand'],
+        numbers=colors['numbers'],
+        marks=colors['marks'],
+        center=colors['center'],
+        digital_fg=colors['digital_fg'],
+        outline=colors['outline'],
+        font_family=font_settings['family'],
+        font_size=font_settings['size'],
+        font_weight=font_settings['weight'],
+        hour_width=hand_settings['hour_width'],
+        minute_width=hand_settings['minute_width'],
+        second_width=hand_settings['second_width'],
+        has_minute_marks=bool(flags['has_minute_marks']),
+        has_glow=bool(flags['has_glow']),
+        compact_dial=bool(flags['compact_dial'])
+    )